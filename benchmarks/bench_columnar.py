@@ -0,0 +1,57 @@
+# pyquerybuilder/benchmarks/bench_columnar.py
+"""Benchmark row-dictionary fetching against the columnar fetch paths.
+
+Runs QueryExecutor.execute() and execute_columnar() against an in-memory
+cursor so only the client-side conversion is measured.
+
+Usage:
+    python benchmarks/bench_columnar.py [rows]
+"""
+import os
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if "pyquerybuilder" not in sys.modules:
+    package = types.ModuleType("pyquerybuilder")
+    package.__path__ = [ROOT]
+    sys.modules["pyquerybuilder"] = package
+sys.path.insert(0, ROOT)
+
+from pyquerybuilder.core import columnar  # noqa: E402
+from pyquerybuilder.core.executor import QueryExecutor  # noqa: E402
+from tests.fakes import FakeConnector  # noqa: E402
+
+
+def timed(label, function, repeat=3):
+    """Print the best of several runs of a function."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<24}{best:8.3f}s")
+
+
+def main(row_count=1_000_000):
+    rows = [(i, i * 0.5, f"name-{i % 100}") for i in range(row_count)]
+    executor = QueryExecutor(FakeConnector(columns=("ID", "AMOUNT", "NAME"), rows=rows))
+    sql = "SELECT id, amount, name FROM t"
+
+    print(f"{row_count} rows, 3 columns")
+    timed("execute (dict rows)", lambda: executor.execute(sql))
+    timed("execute (compact rows)", lambda: executor.execute(sql, row_format="compact"))
+    timed("execute_columnar pydict", lambda: executor.execute_columnar(sql, output="pydict"))
+    if columnar.pyarrow is not None:
+        timed("execute_columnar arrow", lambda: executor.execute_columnar(sql, output="arrow"))
+        if columnar.numpy is not None:
+            timed("execute_columnar numpy", lambda: executor.execute_columnar(sql, output="numpy"))
+        timed("stream_arrow", lambda: list(executor.stream_arrow(sql)))
+    else:
+        print("pyarrow is not installed; skipping the Arrow paths")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,74 @@
+# pyquerybuilder/benchmarks/bench_in_list.py
+"""Benchmark the IN-list strategies of the WHERE generator.
+
+Builds the same ``id IN (...)`` filter as one placeholder per value, as a
+FLATTENed JSON array and as a temporary table, and runs each through
+QueryExecutor against an in-memory connector. Only client-side costs are
+measured: SQL generation, SQL text and parameter size, and the statements
+the executor sends (the temporary table is loaded with executemany(), or
+with PUT and COPY INTO when pyarrow is installed).
+
+Usage:
+    python benchmarks/bench_in_list.py [values]
+"""
+import os
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if "pyquerybuilder" not in sys.modules:
+    package = types.ModuleType("pyquerybuilder")
+    package.__path__ = [ROOT]
+    sys.modules["pyquerybuilder"] = package
+sys.path.insert(0, ROOT)
+
+from pyquerybuilder.core.executor import QueryExecutor  # noqa: E402
+from pyquerybuilder.sql.generators.where_generator import generate_where  # noqa: E402
+from tests.fakes import FakeConnector  # noqa: E402
+
+# (label, array threshold, temporary table threshold) per strategy
+STRATEGIES = (
+    ("placeholders", float("inf"), float("inf")),
+    ("flatten array", 0, float("inf")),
+    ("temporary table", 0, 0)
+)
+
+
+def best_of(function, repeat=3):
+    """Get the best wall time of several runs of a function."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(value_count=50_000):
+    conditions = [{"field": "id", "operator": "IN", "value": list(range(value_count))}]
+
+    print(f"IN list of {value_count} integers")
+    print(f"{'strategy':<18}{'build':>9}{'execute':>10}{'sql bytes':>12}"
+          f"{'params':>8}{'statements':>12}")
+    for label, array_threshold, temp_table_threshold in STRATEGIES:
+        def build():
+            return generate_where(conditions, array_threshold=array_threshold,
+                                  temp_table_threshold=temp_table_threshold)
+
+        build_time = best_of(build)
+        where, params = build()
+        sql = f"SELECT id FROM t {where}"
+
+        connector = FakeConnector()
+        executor = QueryExecutor(connector)
+        execute_time = best_of(lambda: executor.execute(sql, params))
+        statements = len(connector.statements) // 3
+
+        print(f"{label:<18}{build_time:8.3f}s{execute_time:9.3f}s"
+              f"{len(sql.encode('utf-8')):>12}{len(params):>8}{statements:>12}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,250 @@
+# pyquerybuilder/core/async_executor.py
+"""Asyncio executor built on Snowflake asynchronous query submission."""
+import asyncio
+import functools
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .in_list import bind_in_lists, drop_in_list_sql, load_in_list
+from .result_stream import DEFAULT_BATCH_SIZE
+from .session import apply_session, route_connector, session_settings
+from .stage import run_statement
+
+# Snowflake query ids are UUIDs; anything else is never sent to the server
+_QUERY_ID_PATTERN = re.compile(r"^[0-9a-fA-F-]+$")
+
+
+class AsyncQueryExecutor:
+    """Executes queries with execute_async() and polls for completion.
+
+    The event loop only hands short calls (submit, status check, fetch) to
+    a worker thread; while a query runs, waiting is an asyncio.sleep with
+    exponential backoff, so long queries do not hold a thread. Queries in
+    flight are tracked by query id and cancelled on the server whenever
+    the awaiting task is cancelled, whether during submission, while
+    polling or while fetching.
+    """
+
+    def __init__(self, connector, poll_interval: float = 0.1,
+                 max_poll_interval: float = 5.0, backoff: float = 1.5,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """Initialize with a database connector.
+
+        Args:
+            connector: Snowflake connector
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Maximum delay between status checks
+            backoff: Factor the delay grows by after each check
+            batch_size: Rows fetched per round trip when streaming
+        """
+        self.connector = connector
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self._in_flight = {}
+
+    @property
+    def in_flight(self) -> List[str]:
+        """Query ids submitted and not yet finished or cancelled."""
+        return list(self._in_flight)
+
+    async def execute(self, query, params: Optional[Dict[str, Any]] = None,
+                      session: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Execute a query and return all rows.
+
+        Args:
+            query: QueryBuilder instance or SQL string
+            params: Parameters dictionary when query is a SQL string
+            session: Session settings (see QueryExecutor.execute) when
+                query is a SQL string
+
+        Returns:
+            List of dictionaries with query results
+        """
+        return [row async for row in self.stream(query, params, session=session)]
+
+    async def stream(self, query, params: Optional[Dict[str, Any]] = None,
+                     batch_size: Optional[int] = None,
+                     session: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Execute a query and iterate over its rows asynchronously.
+
+        Args:
+            query: QueryBuilder instance or SQL string
+            params: Parameters dictionary when query is a SQL string
+            batch_size: Rows fetched per round trip
+            session: Session settings (see QueryExecutor.execute) when
+                query is a SQL string; builders carry their own
+
+        Returns:
+            Async iterator of row dictionaries
+        """
+        if hasattr(query, "build"):
+            sql, params = query.build()
+            # Contradictory filters never need a round trip
+            if getattr(query, "is_always_false", lambda: False)():
+                return
+            session = session_settings(query)
+        else:
+            sql = query
+
+        session = session or {}
+        batch_size = batch_size or self.batch_size
+        connector, warehouse = route_connector(self.connector, session.get("warehouse"))
+        sql, params, in_lists = bind_in_lists(sql, params)
+
+        # A checkout that completes after cancellation is still released
+        connection = await self._complete(
+            self._acquire, connector, on_cancel=lambda c: self._release(connector, c)
+        )
+        cursor = None
+        query_id = None
+        loaded = []
+
+        try:
+            await self._complete(apply_session, connection, session.get("query_tag"),
+                                 warehouse, getattr(connector, "warehouse", None))
+            for name, in_list in in_lists:
+                loaded.append(name)
+                await self._complete(load_in_list, connection, name, in_list)
+
+            cursor = connection.cursor()
+            await self._complete(cursor.execute_async, sql, params or {})
+            query_id = cursor.sfqid
+            self._in_flight[query_id] = connection
+
+            await self._wait(query_id, connection)
+            await self._complete(cursor.get_results_from_sfqid, query_id)
+
+            column_names = [desc[0] for desc in cursor.description]
+            while True:
+                rows = await self._complete(cursor.fetchmany, batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(column_names, row))
+        except asyncio.CancelledError:
+            # Submission may have completed after the task was cancelled
+            query_id = query_id or getattr(cursor, "sfqid", None)
+            if query_id:
+                self._in_flight[query_id] = connection
+                await asyncio.shield(self.cancel(query_id))
+            raise
+        finally:
+            if query_id is not None:
+                self._in_flight.pop(query_id, None)
+            # Closing, dropping and releasing block, so they run off the loop
+            await self._complete(self._clean_up, connector, connection, cursor, loaded)
+
+    async def cancel(self, query_id: str) -> bool:
+        """Cancel a query that is still running.
+
+        Args:
+            query_id: Snowflake query id
+
+        Returns:
+            True if a cancellation was sent
+        """
+        connection = self._in_flight.pop(query_id, None)
+        if connection is None or not _QUERY_ID_PATTERN.match(query_id):
+            return False
+
+        await self._run(self._cancel_on_server, connection, query_id)
+        return True
+
+    async def cancel_all(self):
+        """Cancel every query still in flight."""
+        for query_id in list(self._in_flight):
+            await self.cancel(query_id)
+
+    async def _wait(self, query_id: str, connection):
+        """Poll a submitted query until it stops running.
+
+        Args:
+            query_id: Snowflake query id
+            connection: Connection the query was submitted on
+
+        """
+        delay = self.poll_interval
+        while True:
+            status = await self._run(
+                connection.get_query_status_throw_if_error, query_id
+            )
+            if not connection.is_still_running(status):
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * self.backoff, self.max_poll_interval)
+
+    @staticmethod
+    def _cancel_on_server(connection, query_id: str):
+        """Send SYSTEM$CANCEL_QUERY for a query id."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY('{query_id}')")
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _acquire(connector):
+        """Check a connection out of a connector."""
+        if hasattr(connector, "acquire"):
+            return connector.acquire()
+        return connector.connect()
+
+    @classmethod
+    def _clean_up(cls, connector, connection, cursor, tables):
+        """Close a stream's cursor, drop its IN-list tables and release it."""
+        try:
+            if cursor is not None:
+                cursor.close()
+            for name in tables:
+                try:
+                    run_statement(connection, drop_in_list_sql(name))
+                except Exception:
+                    # Temporary tables vanish with the session anyway
+                    pass
+        finally:
+            cls._release(connector, connection)
+
+    @staticmethod
+    def _release(connector, connection):
+        """Give a connection back to a connector."""
+        if hasattr(connector, "release"):
+            connector.release(connection)
+
+    @staticmethod
+    async def _run(func, *args):
+        """Run a short blocking call in the default thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    @classmethod
+    async def _complete(cls, func, *args, on_cancel=None):
+        """Run a blocking call that must not be abandoned half-way.
+
+        A worker thread cannot be interrupted, so when the awaiting task
+        is cancelled the call is still waited for before the cancellation
+        is re-raised. Its effect (a checked-out connection, a submitted
+        query id) is then known to the caller's cleanup.
+
+        Args:
+            func: Blocking callable
+            args: Positional arguments
+            on_cancel: Optional callable receiving the call's result when
+                the task was cancelled
+
+        Returns:
+            Result of the call
+        """
+        future = asyncio.ensure_future(cls._run(func, *args))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            try:
+                result = await future
+            except Exception:
+                pass
+            else:
+                if on_cancel is not None:
+                    on_cancel(result)
+            raise
@@ -0,0 +1,193 @@
+# pyquerybuilder/core/batch_executor.py
+"""Concurrent execution of independent queries with warehouse limits."""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .executor import QueryExecutor
+
+
+def builder_warehouse(builder, default: Optional[str] = None) -> Optional[str]:
+    """Get the warehouse a builder asked for with with_warehouse().
+
+    Args:
+        builder: QueryBuilder instance
+        default: Warehouse used when no hint is present
+
+    Returns:
+        Warehouse name or the default
+    """
+    for hint in reversed(getattr(builder, "_hints", [])):
+        if getattr(hint, "hint_type", None) == "USE_WAREHOUSE":
+            return hint.value
+    return default
+
+
+class BatchQueryExecutor:
+    """Runs a batch of queries concurrently on a thread pool.
+
+    Each query holds a slot of its warehouse's concurrency limit while it
+    runs, so a page load cannot queue more queries on a warehouse than it
+    can serve at once. Queries waiting for a slot wait in a per-warehouse
+    queue rather than on a worker thread, and are handed to the pool when
+    a query on the same warehouse finishes, so a saturated warehouse never
+    holds up queries on other warehouses. Connections come from the
+    connector, so a pooled SnowflakeConnector shares its pool across the
+    worker threads.
+    """
+
+    def __init__(self, connector, max_workers: int = 8,
+                 warehouse_limits: Optional[Dict[str, int]] = None,
+                 default_limit: Optional[int] = None, executor=None):
+        """Initialize the batch executor.
+
+        Args:
+            connector: Database connector, ideally with a connection pool
+            max_workers: Number of worker threads
+            warehouse_limits: Maximum concurrent queries per warehouse name
+            default_limit: Limit for warehouses not listed, or None for
+                no limit beyond max_workers
+            executor: Optional QueryExecutor to run queries with
+        """
+        self.connector = connector
+        self.max_workers = max_workers
+        self.warehouse_limits = dict(warehouse_limits or {})
+        self.default_limit = default_limit
+        self.executor = executor or QueryExecutor(connector)
+        self._semaphores = {}
+        self._waiting = {}
+        self._lock = threading.Lock()
+
+    def execute_batch(self, queries: List[Any]) -> List[Dict[str, Any]]:
+        """Execute queries concurrently and collect their results.
+
+        Args:
+            queries: QueryBuilder instances or (sql, params) tuples
+
+        Returns:
+            One dictionary per query, in input order, with "rows",
+            "error", "warehouse", "wait_time" (seconds spent waiting for
+            a warehouse slot) and "execution_time"
+        """
+        if not queries:
+            return []
+
+        workers = min(self.max_workers, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for index, query in enumerate(queries):
+                future = Future()
+                # Routing may EXPLAIN the query, so it runs on a worker too
+                pool.submit(self._route, pool, index, query, future, time.perf_counter())
+                futures.append(future)
+            return [future.result() for future in futures]
+
+    def _route(self, pool, index: int, query, future: Future, queued_at: float):
+        """Resolve the warehouse a query will run on, then dispatch it.
+
+        The warehouse router and the cost guard's reroute both pick the
+        warehouse after the builder's hint, so the slot taken is the one
+        of the warehouse the query actually runs on.
+
+        Args:
+            pool: Worker thread pool
+            index: Position of the query in the batch
+            query: QueryBuilder instance or (sql, params) tuple
+            future: Future receiving the query's result
+            queued_at: perf_counter() time the query was queued at
+        """
+        default_warehouse = getattr(self.connector, "warehouse", None)
+        try:
+            warehouse = self.executor.target_warehouse(query)
+        except Exception:
+            # Running the query reports the error in its result
+            warehouse = (builder_warehouse(query, default_warehouse)
+                         if hasattr(query, "build") else default_warehouse)
+        self._dispatch((pool, index, query, warehouse, future, queued_at))
+
+    def _dispatch(self, job):
+        """Start a query now if its warehouse has a free slot, else queue it.
+
+        Args:
+            job: (pool, index, query, warehouse, future, queued_at) tuple
+        """
+        pool, _, _, warehouse, _, _ = job
+        semaphore = self._semaphore_for(warehouse)
+        if semaphore is not None:
+            with self._lock:
+                if not semaphore.acquire(blocking=False):
+                    self._waiting.setdefault(warehouse, deque()).append(job)
+                    return
+        pool.submit(self._run_job, job, semaphore)
+
+    def _run_job(self, job, semaphore):
+        """Run a dispatched query, then pass its slot to the next in line."""
+        _, index, query, warehouse, future, queued_at = job
+        try:
+            future.set_result(self._run_one(index, query, warehouse, queued_at))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            if semaphore is not None:
+                self._hand_over(warehouse, semaphore)
+
+    def _hand_over(self, warehouse: Optional[str], semaphore):
+        """Give a finished query's slot to a queued query or release it."""
+        with self._lock:
+            waiting = self._waiting.get(warehouse)
+            if not waiting:
+                semaphore.release()
+                return
+            job = waiting.popleft()
+        job[0].submit(self._run_job, job, semaphore)
+
+    def _run_one(self, index: int, query, warehouse: Optional[str],
+                 queued_at: float) -> Dict[str, Any]:
+        """Execute one query holding a slot of its warehouse.
+
+        Args:
+            index: Position of the query in the batch
+            query: QueryBuilder instance or (sql, params) tuple
+            warehouse: Warehouse the query runs on
+            queued_at: perf_counter() time the query was queued at
+
+        Returns:
+            Result dictionary for the query
+        """
+        result = {
+            "index": index,
+            "warehouse": warehouse,
+            "rows": None,
+            "error": None,
+            "wait_time": 0.0,
+            "execution_time": 0.0
+        }
+
+        started = time.perf_counter()
+        result["wait_time"] = started - queued_at
+
+        try:
+            if hasattr(query, "build"):
+                result["rows"] = self.executor.execute_builder(query)
+            else:
+                sql, params = query
+                result["rows"] = self.executor.execute(sql, params)
+        except Exception as e:
+            result["error"] = e
+        finally:
+            result["execution_time"] = time.perf_counter() - started
+
+        return result
+
+    def _semaphore_for(self, warehouse: Optional[str]):
+        """Get the semaphore enforcing a warehouse's concurrency limit."""
+        limit = self.warehouse_limits.get(warehouse, self.default_limit)
+        if limit is None:
+            return None
+
+        with self._lock:
+            if warehouse not in self._semaphores:
+                self._semaphores[warehouse] = threading.BoundedSemaphore(limit)
+            return self._semaphores[warehouse]
@@ -1,4 +1,6 @@
 """Core query builder interface for PyQueryBuilder."""
+import copy
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from discovery.metadata_inspector import MetadataInspector
@@ -7,6 +9,8 @@ from sql.hints import hints
 from .cte import CommonTableExpression
 from .set_operation import SetOperationType, SetOperation
 from ..sql.functions import fn
+from .metrics import BUILD_SECONDS
+from .query_stats import query_stats
 
 
 class QueryBuilder:
@@ -39,9 +43,23 @@ class QueryBuilder:
         self._limit = None
         self._offset = None
 
+        # Keyset pagination predicate resuming after a previous page
+        self._seek = None
+
+        # Generate canonical SQL text for server-side result cache reuse
+        self._canonical = False
+
         # CTE support
         self._with_ctes = []
 
+        # Set by build() when the filters can never match any row
+        self._always_false = False
+        self._fingerprint = None
+        self._build_time = None
+
+        # Set by build() to the tables the query reads
+        self._referenced_tables = []
+
     @classmethod
     def from_snowflake(cls, account, user, password,
                        warehouse, database, schema=None, **options):
@@ -114,6 +132,128 @@ class QueryBuilder:
         })
         return self
 
+    def limit(self, count: Optional[int]) -> 'QueryBuilder':
+        """Limit the number of rows returned.
+
+        Args:
+            count: Maximum number of rows, or None for no limit
+
+        Returns:
+            Self for method chaining
+        """
+        self._limit = count
+        return self
+
+    def offset(self, count: Optional[int]) -> 'QueryBuilder':
+        """Skip rows before returning results.
+
+        Prefer paginate() for walking large results; OFFSET rescans every
+        skipped row on each page.
+
+        Args:
+            count: Number of rows to skip
+
+        Returns:
+            Self for method chaining
+        """
+        self._offset = count
+        return self
+
+    def canonical(self, enabled: bool = True) -> 'QueryBuilder':
+        """Generate canonical SQL text.
+
+        Predicates, IN lists and independent joins are ordered
+        deterministically, whitespace and case are normalized and
+        parameters are named by position, so identical queries built in a
+        different order produce identical text for Snowflake's result cache.
+
+        Args:
+            enabled: Whether to generate canonical SQL
+
+        Returns:
+            Self for method chaining
+        """
+        self._canonical = enabled
+        return self
+
+    def clone(self) -> 'QueryBuilder':
+        """Copy this builder so the copy can be changed independently.
+
+        Returns:
+            New QueryBuilder with the same query components
+        """
+        clone = copy.copy(self)
+        for name in ("_hints", "_select_fields", "_joins", "_where_conditions",
+                     "_where_groups", "_group_by", "_order_by", "_with_ctes",
+                     "_referenced_tables"):
+            setattr(clone, name, list(getattr(self, name)))
+        return clone
+
+    def paginate(self, key_columns, page_size: int,
+                 descending: bool = False) -> "KeysetPaginator":
+        """Walk the results page by page with keyset (seek) pagination.
+
+        Args:
+            key_columns: Column or columns that uniquely order the rows
+            page_size: Rows per page
+            descending: Walk the keys in descending order
+
+        Returns:
+            KeysetPaginator iterating over the pages
+        """
+        from .pagination import KeysetPaginator
+        return KeysetPaginator(self, key_columns, page_size, descending)
+
+    def split(self, by: str, parts: int, strategy: str = "range",
+              **options) -> "PartitionedQuery":
+        """Split the query into disjoint slices extracted concurrently.
+
+        Args:
+            by: Column to split on
+            parts: Number of slices
+            strategy: "range", "quantile", "hash" or "date"
+            **options: Further PartitionedQuery options, e.g. executor,
+                max_workers, batch_size or bucket
+
+        Returns:
+            PartitionedQuery streaming the rows of every slice
+        """
+        from .partitioned import PartitionedQuery
+        return PartitionedQuery(self, by, parts, strategy, **options)
+
+    def insert_into(self, table: str, columns=None, **options) -> "InsertBuilder":
+        """Create an insert builder for a table of this builder's schema.
+
+        Args:
+            table: Target table
+            columns: Optional columns to insert, validated against the
+                schema registry
+            **options: Further InsertBuilder options, e.g. stage,
+                copy_threshold or batch_size
+
+        Returns:
+            InsertBuilder sharing this builder's registry and connector
+        """
+        from .insert import InsertBuilder
+        return InsertBuilder(self._schema_registry, table, columns,
+                             connector=self._connector, **options)
+
+    def merge_into(self, target: str, key_columns, **options) -> "MergeBuilder":
+        """Create an upsert builder for a table of this builder's schema.
+
+        Args:
+            target: Target table
+            key_columns: Column or columns identifying a row
+            **options: Further MergeBuilder options, e.g. columns,
+                batch_size or staging
+
+        Returns:
+            MergeBuilder sharing this builder's registry and connector
+        """
+        from .merge import MergeBuilder
+        return MergeBuilder(self._schema_registry, target, key_columns,
+                            connector=self._connector, **options)
+
     # pyquerybuilder/core/builder.py
     # Add these methods to the QueryBuilder class
 
@@ -160,6 +300,8 @@ class QueryBuilder:
         from ..query.analyzer import QueryAnalyzer
         from ..sql.generator import SQLGenerator
 
+        started = time.perf_counter()
+
         # Analyze the query
         analyzer = QueryAnalyzer(self._schema_registry)
         analyzed_query = analyzer.analyze(
@@ -174,16 +316,91 @@ class QueryBuilder:
             limit=self._limit,
             offset=self._offset,
             with_ctes=self._with_ctes,
-            hints=self._hints  # Add this line
-
+            hints=self._hints,  # Add this line
+            seek=self._seek
         )
 
         # Generate SQL
-        generator = SQLGenerator(dialect="snowflake")
+        generator = SQLGenerator(dialect="snowflake", canonical=self._canonical)
         sql, params = generator.generate(analyzed_query)
 
+        self._always_false = analyzed_query.get("always_false", False)
+        self._referenced_tables = self._collect_referenced_tables(analyzed_query)
+        self._fingerprint = generator.fingerprint
+        self._build_time = time.perf_counter() - started
+
+        query_stats.record_build(generator.fingerprint, self._build_time, generator.shape)
+        BUILD_SECONDS.observe(self._build_time)
+
         return sql, params
 
+    def _collect_referenced_tables(self, analyzed_query) -> List[str]:
+        """Collect tables read by this query, its subqueries and CTEs.
+
+        Subqueries in FROM, joins and WHERE conditions (including nested
+        condition groups) all count.
+
+        Args:
+            analyzed_query: Output of QueryAnalyzer.analyze
+
+        Returns:
+            Sorted list of table names
+        """
+        tables = set(analyzed_query.get("referenced_tables", []))
+
+        # Nested builders were built during generation
+        nested = [cte.query for cte in self._with_ctes]
+        if self._from_subquery is not None:
+            nested.append(getattr(self._from_subquery, "query_builder", None))
+        for join in self._joins:
+            nested.append(getattr(join.get("table"), "query_builder", None))
+        nested.extend(_condition_builders(self._where_conditions))
+        for group in self._where_groups:
+            nested.extend(_condition_builders(group.conditions))
+
+        for builder in nested:
+            if hasattr(builder, "referenced_tables"):
+                tables.update(builder.referenced_tables())
+
+        # CTE names are not physical tables
+        tables.difference_update(cte.name for cte in self._with_ctes)
+        return sorted(tables)
+
+    def referenced_tables(self) -> List[str]:
+        """Get the tables the last built query reads.
+
+        Returns:
+            Sorted list of table names
+        """
+        return list(self._referenced_tables)
+
+    def is_always_false(self) -> bool:
+        """Check whether the last built query can never return rows.
+
+        Returns:
+            True if the WHERE filters were found to be contradictory
+        """
+        return self._always_false
+
+    def fingerprint(self) -> Optional[str]:
+        """Get the fingerprint of the last built query's shape.
+
+        Queries differing only in literal or parameter values share a
+        fingerprint; see sql.fingerprint.
+
+        Returns:
+            Fingerprint string, or None if the query was not built yet
+        """
+        return self._fingerprint
+
+    def build_time(self) -> Optional[float]:
+        """Get the seconds the last build() spent analyzing and generating.
+
+        Returns:
+            Build time, or None if the query was not built yet
+        """
+        return self._build_time
+
     # pyquerybuilder/core/builder.py
     # Add or update these methods
 
@@ -235,7 +452,8 @@ class QueryBuilder:
             return self
 
         # Handle normal condition
-        if value is None and operator is not None:
+        if value is None and operator is not None \
+                and str(operator).upper() not in ("IS NULL", "IS NOT NULL"):
             # Shift parameters for convenience
             value = operator
             operator = "="
@@ -265,7 +483,8 @@ class QueryBuilder:
             return self
 
         # Handle normal condition
-        if value is None and operator is not None:
+        if value is None and operator is not None \
+                and str(operator).upper() not in ("IS NULL", "IS NOT NULL"):
             # Shift parameters for convenience
             value = operator
             operator = "="
@@ -500,3 +719,27 @@ class QueryBuilder:
             Self for method chaining
         """
         return self.with_hint(hints.comment(text))
+
+
+def _condition_builders(conditions) -> List[Any]:
+    """Find the builders of subqueries used in WHERE conditions.
+
+    Args:
+        conditions: Condition dictionaries of a builder or WhereGroup
+
+    Returns:
+        List of nested QueryBuilder instances
+    """
+    builders = []
+    for condition in conditions:
+        group = condition.get("group") if isinstance(condition, dict) else condition
+        if hasattr(group, "conditions"):
+            builders.extend(_condition_builders(group.conditions))
+            continue
+        for operand in (condition.get("field"), condition.get("value")):
+            builder = getattr(operand, "query_builder", None)
+            if builder is None and hasattr(operand, "referenced_tables"):
+                builder = operand
+            if builder is not None:
+                builders.append(builder)
+    return builders
@@ -0,0 +1,239 @@
+# pyquerybuilder/core/columnar.py
+"""Columnar result fetching (Arrow, NumPy or plain column lists)."""
+from typing import Any, Dict, Iterator, List
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .result_stream import DEFAULT_BATCH_SIZE
+
+# Output formats supported by fetch_columnar
+COLUMNAR_OUTPUTS = ("arrow", "numpy", "pydict")
+
+# Arrow types of Snowflake cursor.description type codes (FIXED, code 0,
+# depends on the scale); timestamps, variants and times are inferred
+_SNOWFLAKE_ARROW_TYPES = {
+    1: lambda: pyarrow.float64(),   # REAL
+    2: lambda: pyarrow.string(),    # TEXT
+    3: lambda: pyarrow.date32(),    # DATE
+    11: lambda: pyarrow.binary(),   # BINARY
+    13: lambda: pyarrow.bool_()     # BOOLEAN
+}
+
+
+def _require(module, name: str):
+    """Return an optional module or raise a helpful ImportError."""
+    if module is None:
+        raise ImportError(
+            f"{name} is required for this result format; "
+            f"install it with 'pip install {name}'"
+        )
+    return module
+
+
+def column_names(cursor) -> List[str]:
+    """Get the column names of an executed cursor."""
+    return [desc[0] for desc in cursor.description or []]
+
+
+def fetch_pydict(cursor, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, list]:
+    """Fetch all rows into one list per column.
+
+    Rows are transposed a batch at a time with zip(), which avoids
+    building a dictionary per row.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+        batch_size: Number of rows fetched per round trip
+
+    Returns:
+        Dictionary mapping column names to lists of values
+    """
+    names = column_names(cursor)
+    columns = [[] for _ in names]
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for column, values in zip(columns, zip(*rows)):
+            column.extend(values)
+
+    return dict(zip(names, columns))
+
+
+def described_arrow_types(cursor) -> List[Any]:
+    """Map the Snowflake type codes of cursor.description to Arrow types.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+
+    Returns:
+        One pyarrow.DataType per column, or None where the type code is
+        unknown or not reported and the type has to be inferred
+    """
+    pa = _require(pyarrow, "pyarrow")
+
+    types = []
+    for desc in cursor.description or []:
+        type_code = desc[1] if len(desc) > 1 else None
+        scale = desc[5] if len(desc) > 5 else None
+        if type_code == 0:
+            # FIXED: integers without scale, decimals otherwise
+            if scale:
+                precision = desc[4] if len(desc) > 4 and desc[4] else 38
+                types.append(pa.decimal128(precision, scale))
+            else:
+                types.append(pa.int64())
+        else:
+            factory = _SNOWFLAKE_ARROW_TYPES.get(type_code) if isinstance(type_code, int) else None
+            types.append(factory() if factory else None)
+    return types
+
+
+def iter_arrow_batches(cursor, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+    """Iterate over results as Arrow record batches.
+
+    Uses the connector's native Arrow result batches when the cursor
+    provides them, otherwise assembles batches from fetchmany() rows. The
+    assembled batches share one schema, taken from the column types of
+    cursor.description where known and from the first batch otherwise,
+    so a later batch of NULLs or of wider integers keeps the same types.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+        batch_size: Number of rows per batch for the row-based fallback
+
+    Returns:
+        Iterator of pyarrow.RecordBatch
+    """
+    pa = _require(pyarrow, "pyarrow")
+
+    if hasattr(cursor, "fetch_arrow_batches"):
+        for table in cursor.fetch_arrow_batches():
+            yield from table.to_batches()
+        return
+
+    # Every batch of the stream shares one schema: described column
+    # types first, the rest inferred from the first batch
+    names = column_names(cursor)
+    types = described_arrow_types(cursor)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        arrays = []
+        for index, values in enumerate(zip(*rows)):
+            if types[index] is None:
+                array = pa.array(values)
+                types[index] = array.type
+            else:
+                array = pa.array(values, type=types[index])
+            arrays.append(array)
+        yield pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def fetch_arrow(cursor, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Fetch all results as an Arrow table.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+        batch_size: Number of rows per batch for the row-based fallback
+
+    Returns:
+        pyarrow.Table
+    """
+    pa = _require(pyarrow, "pyarrow")
+
+    if hasattr(cursor, "fetch_arrow_all"):
+        table = cursor.fetch_arrow_all()
+        if table is not None:
+            return table
+        # The Snowflake connector returns None for an empty result
+        return pa.table({name: [] for name in column_names(cursor)})
+
+    return pa.table(fetch_pydict(cursor, batch_size))
+
+
+def fetch_numpy(cursor, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+    """Fetch all results as one NumPy array per column.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+        batch_size: Number of rows per batch for the row-based fallback
+
+    Returns:
+        Dictionary mapping column names to numpy.ndarray
+    """
+    np = _require(numpy, "numpy")
+
+    if pyarrow is not None and hasattr(cursor, "fetch_arrow_all"):
+        table = fetch_arrow(cursor, batch_size)
+        return {
+            name: table.column(name).to_numpy()
+            for name in table.column_names
+        }
+
+    return {
+        name: np.asarray(values)
+        for name, values in fetch_pydict(cursor, batch_size).items()
+    }
+
+
+def convert_table(table, output: str = "arrow"):
+    """Convert an Arrow table to another columnar output format.
+
+    Args:
+        table: pyarrow.Table
+        output: "arrow", "numpy" or "pydict"
+
+    Returns:
+        pyarrow.Table, dictionary of numpy arrays or dictionary of lists
+    """
+    if output == "arrow":
+        return table
+    if output == "numpy":
+        _require(numpy, "numpy")
+        return {
+            name: table.column(name).to_numpy()
+            for name in table.column_names
+        }
+    if output == "pydict":
+        return table.to_pydict()
+
+    raise ValueError(
+        f"Unsupported columnar output {output!r}; "
+        f"expected one of {', '.join(COLUMNAR_OUTPUTS)}"
+    )
+
+
+def fetch_columnar(cursor, output: str = "arrow",
+                   batch_size: int = DEFAULT_BATCH_SIZE):
+    """Fetch all results in a columnar format.
+
+    Args:
+        cursor: Cursor on which a query has been executed
+        output: "arrow", "numpy" or "pydict"
+        batch_size: Number of rows per batch for the row-based fallback
+
+    Returns:
+        pyarrow.Table, dictionary of numpy arrays or dictionary of lists
+    """
+    if output == "arrow":
+        return fetch_arrow(cursor, batch_size)
+    if output == "numpy":
+        return fetch_numpy(cursor, batch_size)
+    if output == "pydict":
+        return fetch_pydict(cursor, batch_size)
+
+    raise ValueError(
+        f"Unsupported columnar output {output!r}; "
+        f"expected one of {', '.join(COLUMNAR_OUTPUTS)}"
+    )
@@ -0,0 +1,195 @@
+# pyquerybuilder/core/cost_guard.py
+"""Pre-execution cost guard based on Snowflake EXPLAIN plans."""
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class QueryCostExceeded(Exception):
+    """Raised when a query's estimated cost is over the configured budget."""
+
+    def __init__(self, message: str, estimate: Dict[str, Any]):
+        """Initialize with the plan estimate that exceeded the budget.
+
+        Args:
+            message: Error message
+            estimate: Parsed plan estimate
+        """
+        super().__init__(message)
+        self.estimate = estimate
+
+
+def plan_fingerprint(sql: str) -> str:
+    """Compute a fingerprint identifying the shape of a SQL statement.
+
+    Bind parameters are not part of the text, so queries that differ only
+    in parameter values share a fingerprint.
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        Hex digest of the whitespace-normalized SQL
+    """
+    normalized = re.sub(r"\s+", " ", sql).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def parse_explain_json(plan_json) -> Dict[str, Any]:
+    """Extract the global estimates from an EXPLAIN USING JSON plan.
+
+    Args:
+        plan_json: JSON text or already decoded plan dictionary
+
+    Returns:
+        Dictionary with partitions_total, partitions_assigned and
+        bytes_assigned
+    """
+    plan = json.loads(plan_json) if isinstance(plan_json, (str, bytes)) else plan_json
+    stats = plan.get("GlobalStats", {}) if plan else {}
+
+    return {
+        "partitions_total": int(stats.get("partitionsTotal") or 0),
+        "partitions_assigned": int(stats.get("partitionsAssigned") or 0),
+        "bytes_assigned": int(stats.get("bytesAssigned") or 0)
+    }
+
+
+class ExplainCostGuard:
+    """Rejects or reroutes queries whose EXPLAIN estimate is over budget."""
+
+    def __init__(self, connector, max_bytes: Optional[int] = None,
+                 max_partitions: Optional[int] = None,
+                 reroute_connector=None, cache_size: int = 256):
+        """Initialize the cost guard.
+
+        Args:
+            connector: Database connector used to run EXPLAIN
+            max_bytes: Maximum estimated bytes assigned, or None
+            max_partitions: Maximum estimated partitions assigned, or None
+            reroute_connector: Connector to run over-budget queries on
+                instead of rejecting them (e.g. a larger warehouse)
+            cache_size: Number of plan estimates kept per fingerprint
+        """
+        self.connector = connector
+        self.max_bytes = max_bytes
+        self.max_partitions = max_partitions
+        self.reroute_connector = reroute_connector
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Plan cache counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def explain(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get the plan estimate for a query, using the fingerprint cache.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+
+        Returns:
+            Parsed plan estimate with its fingerprint
+        """
+        fingerprint = plan_fingerprint(sql)
+
+        with self._lock:
+            if fingerprint in self._cache:
+                self._cache.move_to_end(fingerprint)
+                self.hits += 1
+                return self._cache[fingerprint]
+            self.misses += 1
+
+        pooled = hasattr(self.connector, "acquire")
+        connection = self.connector.acquire() if pooled else self.connector.connect()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(f"EXPLAIN USING JSON {sql}", params or {})
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+        finally:
+            if pooled:
+                self.connector.release(connection)
+
+        estimate = parse_explain_json(row[0] if row else None)
+        estimate["fingerprint"] = fingerprint
+
+        with self._lock:
+            self._cache[fingerprint] = estimate
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+        return estimate
+
+    def is_over_budget(self, estimate: Dict[str, Any]) -> bool:
+        """Check a plan estimate against the configured budget.
+
+        Args:
+            estimate: Parsed plan estimate
+
+        Returns:
+            True if any configured limit is exceeded
+        """
+        if self.max_bytes is not None and estimate["bytes_assigned"] > self.max_bytes:
+            return True
+        if (self.max_partitions is not None
+                and estimate["partitions_assigned"] > self.max_partitions):
+            return True
+        return False
+
+    def check(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """Check a query before execution.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+
+        Returns:
+            Connector to run an over-budget query on, or None to run the
+            query on the default connector
+
+        Raises:
+            QueryCostExceeded: If the query is over budget and no reroute
+                connector is configured
+        """
+        estimate = self.explain(sql, params)
+        if not self.is_over_budget(estimate):
+            return None
+
+        if self.reroute_connector is not None:
+            return self.reroute_connector
+
+        raise QueryCostExceeded(
+            f"Query estimate of {estimate['bytes_assigned']} bytes in "
+            f"{estimate['partitions_assigned']}/{estimate['partitions_total']} "
+            f"partitions exceeds the configured budget",
+            estimate
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get plan cache usage statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+    def clear_cache(self):
+        """Forget all cached plan estimates."""
+        with self._lock:
+            self._cache.clear()
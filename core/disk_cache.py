@@ -0,0 +1,340 @@
+# pyquerybuilder/core/disk_cache.py
+"""Persistent result cache storing Arrow IPC files on disk."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+from .result_cache import make_cache_key
+
+ARROW_SUFFIX = ".arrow"
+PROVENANCE_SUFFIX = ".json"
+
+
+def cache_fingerprint(sql: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Compute the file name stem for a query's cached result.
+
+    Args:
+        sql: SQL query string
+        params: Optional parameters dictionary
+
+    Returns:
+        Hex digest of the normalized SQL and parameters
+    """
+    normalized, params_key, _ = make_cache_key(sql, params)
+    digest = hashlib.sha256()
+    digest.update(normalized.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(params_key.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DiskResultCache:
+    """Result cache of Arrow IPC files shared between processes.
+
+    Results are written atomically as ``<fingerprint>.arrow`` with a
+    ``<fingerprint>.json`` provenance record next to them. Reads memory-map
+    the file, so every process reading a result shares the same pages
+    instead of copying them. The total size is kept under ``max_bytes`` by
+    evicting the least recently used files (by modification time, which
+    is refreshed on every hit).
+
+    Entries expire after ``max_age`` seconds. When ``last_altered`` is
+    given, the LAST_ALTERED values of the tables a result read are stored
+    with it, and the entry is dropped once any of them changes; like
+    ResultCache, LAST_ALTERED is re-read at most once per
+    ``validation_interval`` per table.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 10 * 1024 ** 3,
+                 max_age: Optional[float] = 3600.0,
+                 last_altered: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+                 validation_interval: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache files
+            max_bytes: Maximum total size of the Arrow files
+            max_age: Seconds after which entries are ignored and removed,
+                or None to keep them until evicted or invalidated
+            last_altered: Callable mapping table names to their
+                LAST_ALTERED values, e.g. a partial of read_last_altered
+            validation_interval: Seconds a LAST_ALTERED value is trusted
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "pyarrow is required for DiskResultCache; "
+                "install it with 'pip install pyarrow'"
+            )
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.last_altered = last_altered
+        self.validation_interval = validation_interval
+        self._table_versions = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        # Counters of this process's lookups, for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """Read a cached result without copying it into memory.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+
+        Returns:
+            pyarrow.Table backed by a memory map, or None on a miss
+        """
+        path = self._path(cache_fingerprint(sql, params), ARROW_SUFFIX)
+        try:
+            if not self._is_current(path):
+                self._remove(path)
+                self.misses += 1
+                return None
+
+            # The table keeps the mapped pages alive after the file closes
+            with pyarrow.memory_map(path, "r") as source:
+                table = pyarrow.ipc.open_file(source).read_all()
+            # Mark the entry as recently used for LRU eviction
+            os.utime(path)
+        except (FileNotFoundError, pyarrow.ArrowInvalid):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return table
+
+    def put(self, sql: str, params: Optional[Dict[str, Any]], table,
+            tables: Iterable[str] = ()) -> Optional[str]:
+        """Store a result and its provenance.
+
+        Results larger than max_bytes are not stored.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            table: pyarrow.Table with the result
+            tables: Tables the query read, for invalidation
+
+        Returns:
+            Fingerprint the result was stored under, or None if it was
+            too large
+        """
+        # The IPC file is about the size of the table's buffers
+        if table.nbytes > self.max_bytes:
+            return None
+
+        tables = sorted(set(tables))
+        versions = {}
+        if tables and self.last_altered is not None:
+            versions = self._current_versions(tables)
+
+        fingerprint = cache_fingerprint(sql, params)
+        arrow_path = self._path(fingerprint, ARROW_SUFFIX)
+
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as sink:
+                with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            size = os.path.getsize(tmp_path)
+            if size > self.max_bytes:
+                os.remove(tmp_path)
+                return None
+
+            provenance = {
+                "fingerprint": fingerprint,
+                "sql": sql,
+                "params": {k: repr(v) for k, v in (params or {}).items()},
+                "tables": tables,
+                "last_altered": {t: _version_key(v) for t, v in versions.items()},
+                "row_count": table.num_rows,
+                "bytes": size,
+                "created_at": time.time()
+            }
+            self._write_json(self._path(fingerprint, PROVENANCE_SUFFIX), provenance)
+            os.replace(tmp_path, arrow_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+        return fingerprint
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """List the provenance of every cached result.
+
+        Returns:
+            Provenance dictionaries, most recently used first
+        """
+        entries = []
+        for arrow_path, mtime, _ in self._arrow_files():
+            provenance = self._read_json(arrow_path[:-len(ARROW_SUFFIX)] + PROVENANCE_SUFFIX)
+            if provenance is not None:
+                provenance["last_used"] = mtime
+                entries.append(provenance)
+        return sorted(entries, key=lambda e: e["last_used"], reverse=True)
+
+    def invalidate(self, sql: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Remove one cached result.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+
+        Returns:
+            True if a result was removed
+        """
+        return self._remove(self._path(cache_fingerprint(sql, params), ARROW_SUFFIX))
+
+    def clear(self):
+        """Remove every cached result."""
+        for arrow_path, _, _ in self._arrow_files():
+            self._remove(arrow_path)
+
+    def total_bytes(self) -> int:
+        """Get the total size of the cached Arrow files."""
+        return sum(size for _, _, size in self._arrow_files())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics.
+
+        Returns:
+            Dictionary with entries and bytes on disk, and this process's
+            hits, misses, evictions and invalidations
+        """
+        files = self._arrow_files()
+        return {
+            "entries": len(files),
+            "bytes_held": sum(size for _, _, size in files),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+    def _evict(self):
+        """Remove least recently used files until under max_bytes."""
+        files = sorted(self._arrow_files(), key=lambda f: f[1])
+        total = sum(size for _, _, size in files)
+        for arrow_path, _, size in files:
+            if total <= self.max_bytes:
+                break
+            if self._remove(arrow_path):
+                total -= size
+                self.evictions += 1
+
+    def _arrow_files(self):
+        """List cached files as (path, mtime, size) tuples."""
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(ARROW_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # Removed by another process meanwhile
+                continue
+            files.append((path, stat.st_mtime, stat.st_size))
+        return files
+
+    def _is_current(self, arrow_path: str) -> bool:
+        """Check an entry against max_age and its tables' LAST_ALTERED.
+
+        Raises:
+            FileNotFoundError: If the entry does not exist
+        """
+        provenance = self._read_json(arrow_path[:-len(ARROW_SUFFIX)] + PROVENANCE_SUFFIX)
+        if provenance is None:
+            created_at = os.path.getmtime(arrow_path)
+        else:
+            created_at = provenance["created_at"]
+        if self.max_age is not None and time.time() - created_at > self.max_age:
+            return False
+
+        tables = (provenance or {}).get("tables") or []
+        if tables and self.last_altered is not None:
+            current = self._current_versions(tables)
+            recorded = provenance.get("last_altered", {})
+            if any(_version_key(current.get(t)) != recorded.get(t) for t in tables):
+                self.invalidations += 1
+                return False
+        return True
+
+    def _current_versions(self, tables: List[str]) -> Dict[str, Any]:
+        """Get LAST_ALTERED values, re-reading those older than the interval."""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                t for t in tables
+                if t.upper() not in self._table_versions
+                or now - self._table_versions[t.upper()][1] >= self.validation_interval
+            ]
+
+        if stale:
+            fresh = self.last_altered(stale)
+            with self._lock:
+                for table in stale:
+                    self._table_versions[table.upper()] = (fresh.get(table), now)
+
+        with self._lock:
+            return {t: self._table_versions.get(t.upper(), (None, now))[0] for t in tables}
+
+    def _remove(self, arrow_path: str) -> bool:
+        """Remove an entry's files; existing memory maps stay valid."""
+        removed = False
+        for path in (arrow_path, arrow_path[:-len(ARROW_SUFFIX)] + PROVENANCE_SUFFIX):
+            try:
+                os.remove(path)
+                removed = True
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _path(self, fingerprint: str, suffix: str) -> str:
+        """Build the path of an entry file."""
+        return os.path.join(self.directory, fingerprint + suffix)
+
+    def _write_json(self, path: str, data: Dict[str, Any]):
+        """Write a JSON file atomically."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(data, handle)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict[str, Any]]:
+        """Read a JSON file, returning None if it is missing or invalid."""
+        try:
+            with open(path) as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+
+
+def _version_key(value) -> Optional[str]:
+    """Make a LAST_ALTERED value comparable after a JSON round trip."""
+    return None if value is None else str(value)
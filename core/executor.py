@@ -1,42 +1,681 @@
 # pyquerybuilder/core/executor.py
 """Executor for running SQL queries."""
+import time
 from typing import Dict, List, Any
 
+from .columnar import convert_table, fetch_arrow, fetch_columnar, iter_arrow_batches
+from .in_list import bind_in_lists, drop_in_list_sql, load_in_lists, split_in_lists
+from .metrics import (BYTES_FETCHED, EXECUTE_SECONDS, FETCH_SECONDS, QUERIES,
+                      QUERIES_IN_FLIGHT, ROWS_FETCHED, metrics)
+from .query_stats import query_stats
+from .result_cache import make_cache_key
+from .result_stream import DEFAULT_BATCH_SIZE, ResultStream
+from .row_types import ROW_FORMATS, make_rows
+from .session import apply_session, route_connector, session_settings
+from .stage import run_statement
+from .telemetry import QuerySpan, telemetry as default_telemetry
+from ..sql.fingerprint import fingerprint
+
 
 class QueryExecutor:
     """Executes SQL queries and processes results."""
 
-    def __init__(self, connector):
-        """Initialize with database connector."""
+    def __init__(self, connector, cost_guard=None, result_cache=None,
+                 disk_cache=None, semantic_cache=None, warehouse_router=None,
+                 telemetry=None, history=None, slow_query_log=None):
+        """Initialize with database connector.
+
+        Args:
+            connector: Database connector
+            cost_guard: Optional ExplainCostGuard checked before execution
+            result_cache: Optional ResultCache consulted by execute()
+            disk_cache: Optional DiskResultCache consulted by
+                execute_columnar()
+            semantic_cache: Optional SemanticCache consulted by
+                execute_builder_columnar()
+            warehouse_router: Optional WarehouseRouter choosing the
+                warehouse of built queries without a with_warehouse() hint
+            telemetry: Telemetry receiving a span per query; defaults to
+                the process-wide core.telemetry.telemetry
+            history: Optional QueryHistoryHarvester collecting
+                QUERY_HISTORY statistics of executed queries
+            slow_query_log: Optional SlowQueryLog receiving queries
+                slower than its threshold
+        """
         self.connector = connector
+        self.cost_guard = cost_guard
+        self.result_cache = result_cache
+        self.disk_cache = disk_cache
+        self.semantic_cache = semantic_cache
+        self.warehouse_router = warehouse_router
+        self.telemetry = telemetry or default_telemetry
+        self.history = history
+        self.slow_query_log = slow_query_log
+
+        # Caches and pools are read by the metrics registry when scraped
+        for component, kind in ((result_cache, "result_cache"), (disk_cache, "disk_cache"),
+                                (semantic_cache, "semantic_cache"), (cost_guard, "plan_cache"),
+                                (history, "query_history"),
+                                (slow_query_log, "slow_query_log")):
+            if hasattr(component, "stats"):
+                metrics.monitor(component, kind)
+        if hasattr(connector, "pool_stats") or (
+                hasattr(connector, "acquire") and hasattr(connector, "stats")):
+            metrics.monitor(connector, "pool")
 
-    def execute(self, sql, params=None):
+    def execute(self, sql, params=None, row_format="dict", tables=(), session=None):
         """Execute a SQL query with parameters.
 
         Args:
             sql: SQL query string
             params: Optional parameters dictionary
+            row_format: "dict" for dictionaries, or "compact" for tuple
+                rows of a class generated once per result shape that
+                still support row["col"] access
+            tables: Tables the query reads, used to invalidate cached
+                results when they change
+            session: Optional session settings with "query_tag" and
+                "warehouse", applied to the connection (see core.session)
 
         Returns:
-            List of dictionaries with query results
+            List of dictionaries (or Row tuples) with query results
+
+        Raises:
+            QueryCostExceeded: If the cost guard rejects the query
         """
-        # Connect to database
-        connection = self.connector.connect()
-        cursor = connection.cursor()
+        if row_format not in ROW_FORMATS:
+            raise ValueError(f"Unsupported row format {row_format!r}")
 
+        span = self._start_span(sql, session)
         try:
-            # Execute query
-            cursor.execute(sql, params or {})
+            results, _ = self._execute_rows(sql, params, row_format, tables, session, span)
+        except Exception as e:
+            self._finish_span(span, None, params, e)
+            raise
+
+        self._finish_span(span, results, params)
+        return results
+
+    def _execute_rows(self, sql, params, row_format, tables, session, span):
+        """Answer a query from the result cache or run it (see execute).
 
+        Returns:
+            Tuple of (results, "result" if they came from the result cache
+            or None if the query ran)
+        """
+        if self.result_cache is not None:
+            cache_key = make_cache_key(sql, params, row_format)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                if span is not None:
+                    span.set_attribute("pyquerybuilder.cache", "result")
+                return cached, "result"
+
+            results = self._fetch_all(sql, params, row_format, session, span)
+            self.result_cache.put(cache_key, results, tables)
+            return results, None
+
+        return self._fetch_all(sql, params, row_format, session, span), None
+
+    def _fetch_all(self, sql, params, row_format, session=None, span=None):
+        """Execute a query and fetch every row in the given row format."""
+        cursor = self._open_cursor(sql, params, session, span)
+        fetch_started = time.perf_counter()
+
+        try:
             # Fetch column names
             column_names = [desc[0] for desc in cursor.description]
 
-            # Fetch and process results
-            results = []
-            for row in cursor.fetchall():
-                result = dict(zip(column_names, row))
-                results.append(result)
+            if row_format == "compact":
+                results = make_rows(column_names, cursor.fetchall())
+            else:
+                # Fetch and process results
+                results = []
+                for row in cursor.fetchall():
+                    result = dict(zip(column_names, row))
+                    results.append(result)
+        finally:
+            cursor.close()
+
+        _record_fetch(span, fetch_started, results)
+        return results
+
+    def execute_iter(self, sql, params=None, batch_size=DEFAULT_BATCH_SIZE,
+                     row_format="dict", session=None) -> ResultStream:
+        """Execute a SQL query and stream its rows.
+
+        Rows are fetched with fetchmany() so memory stays bounded by the
+        batch size regardless of the result size. Use the returned stream
+        in a ``with`` block, or call close(), to release the cursor when
+        stopping early.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            batch_size: Number of rows fetched per round trip
+            row_format: "dict" or "compact" (see execute)
+            session: Optional session settings (see execute)
+
+        Returns:
+            ResultStream yielding row dictionaries or Row tuples
+        """
+        span = self._start_span(sql, session)
+        try:
+            cursor = self._open_cursor(sql, params, session, span)
+        except Exception as e:
+            self._finish_span(span, None, params, e)
+            raise
+
+        def finish(stream):
+            self._finish_stream(span, params, stream.rows_fetched, stream.fetch_time,
+                                stream.error)
+
+        try:
+            return ResultStream(cursor, batch_size, row_format, on_close=finish)
+        except Exception as e:
+            cursor.close()
+            self._finish_stream(span, params, 0, 0.0, e)
+            raise
+
+    def stream(self, sql, params=None, batch_size=DEFAULT_BATCH_SIZE,
+               row_format="dict", session=None):
+        """Execute a SQL query and yield its rows in batches.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            batch_size: Number of rows per batch
+            row_format: "dict" or "compact" (see execute)
+            session: Optional session settings (see execute)
+
+        Returns:
+            Iterator of lists of row dictionaries or Row tuples
+        """
+        with self.execute_iter(sql, params, batch_size,
+                               row_format, session) as result_stream:
+            yield from result_stream.batches()
+
+    def execute_columnar(self, sql, params=None, output="arrow",
+                         batch_size=DEFAULT_BATCH_SIZE, session=None, tables=()):
+        """Execute a SQL query and return its results column by column.
+
+        Uses the connector's Arrow result batches when available instead
+        of building a dictionary per row.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            output: "arrow" for a pyarrow.Table, "numpy" for a dictionary
+                of numpy arrays, or "pydict" for a dictionary of lists
+            batch_size: Rows per round trip for the row-based fallback
+            session: Optional session settings (see execute)
+            tables: Tables the query reads, used to invalidate results
+                cached on disk when they change
+
+        Returns:
+            Columnar query results in the requested format
+        """
+        span = self._start_span(sql, session)
+        try:
+            results, _ = self._execute_columnar(sql, params, output, batch_size, session,
+                                                span, tables)
+        except Exception as e:
+            self._finish_span(span, None, params, e)
+            raise
+
+        self._finish_span(span, results, params)
+        return results
+
+    def _execute_columnar(self, sql, params, output, batch_size, session, span, tables=()):
+        """Answer a query from the disk cache or run it (see execute_columnar).
+
+        Returns:
+            Tuple of (results, "disk" if they came from the disk cache or
+            None if the query ran)
+        """
+        if self.disk_cache is not None:
+            table = self.disk_cache.get(sql, params)
+            cache = None
+            if table is None:
+                cursor = self._open_cursor(sql, params, session, span)
+                fetch_started = time.perf_counter()
+                try:
+                    table = fetch_arrow(cursor, batch_size)
+                finally:
+                    cursor.close()
+                _record_fetch(span, fetch_started, table)
+                self.disk_cache.put(sql, params, table, tables)
+            else:
+                cache = "disk"
+                if span is not None:
+                    span.set_attribute("pyquerybuilder.cache", "disk")
+            return convert_table(table, output), cache
+
+        cursor = self._open_cursor(sql, params, session, span)
+        fetch_started = time.perf_counter()
+
+        try:
+            results = fetch_columnar(cursor, output, batch_size)
+        finally:
+            cursor.close()
+
+        _record_fetch(span, fetch_started, results)
+        return results, None
+
+    def stream_arrow(self, sql, params=None, batch_size=DEFAULT_BATCH_SIZE,
+                     session=None):
+        """Execute a SQL query and yield Arrow record batches.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            batch_size: Rows per batch for the row-based fallback
+            session: Optional session settings (see execute)
+
+        Returns:
+            Iterator of pyarrow.RecordBatch
+        """
+        span = self._start_span(sql, session)
+        try:
+            cursor = self._open_cursor(sql, params, session, span)
+        except Exception as e:
+            self._finish_span(span, None, params, e)
+            raise
+
+        rows = 0
+        fetch_time = 0.0
+        error = None
+        try:
+            batches = iter_arrow_batches(cursor, batch_size)
+            while True:
+                started = time.perf_counter()
+                batch = next(batches, None)
+                fetch_time += time.perf_counter() - started
+                if batch is None:
+                    break
+                rows += batch.num_rows
+                yield batch
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            cursor.close()
+            self._finish_stream(span, params, rows, fetch_time, error)
+
+    def _open_cursor(self, sql, params=None, session=None, span=None):
+        """Run the cost guard, then execute the query on a new cursor.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            session: Optional session settings (see execute)
+            span: Optional QuerySpan receiving checkout and execution
+                times, the query id and the warehouse
+
+        Returns:
+            Cursor on which the query has been executed
+        """
+        session = session or {}
+        opened = time.perf_counter()
+
+        # Route to the warehouse's own pool when the connector has one
+        connector, warehouse = route_connector(self.connector, session.get("warehouse"))
+
+        # Long IN lists externalized to temporary tables are loaded first
+        sql, params, in_lists = bind_in_lists(sql, params)
+
+        # Reject or reroute queries over the configured budget; EXPLAIN
+        # cannot see temporary tables of another session, so those skip it
+        if self.cost_guard is not None and not in_lists:
+            connector = self.cost_guard.check(sql, params) or connector
+
+        # Check a connection out of the pool when the connector has one
+        if hasattr(connector, "acquire"):
+            connection = connector.acquire()
+            release = connector.release
+        else:
+            connection = connector.connect()
+            release = None
+
+        try:
+            apply_session(connection, session.get("query_tag"), warehouse,
+                          getattr(connector, "warehouse", None))
+            load_in_lists(connection, in_lists)
+            cursor = connection.cursor()
+        except Exception:
+            if release is not None:
+                release(connection)
+            raise
+
+        cleanup = [drop_in_list_sql(name) for name, _ in in_lists]
+        cursor = _ReleasingCursor(cursor, connection, release, cleanup)
+        QUERIES_IN_FLIGHT.inc()
 
-            return results
+        executed = time.perf_counter()
+        try:
+            # Execute query
+            cursor.execute(sql, params or {})
+        except Exception:
+            QUERIES.inc(status="error")
+            cursor.close()
+            raise
+
+        execute_time = time.perf_counter() - executed
+        QUERIES.inc(status="ok")
+        EXECUTE_SECONDS.observe(execute_time)
+
+        if span is not None:
+            span.set_attribute("pyquerybuilder.execute_time", execute_time)
+            span.set_attribute("pyquerybuilder.checkout_time", executed - opened)
+            span.set_attribute("db.snowflake.query_id", getattr(cursor, "sfqid", None))
+            span.set_attribute("db.snowflake.warehouse",
+                               warehouse or getattr(connector, "warehouse", None))
+
+        if self.history is not None:
+            query_fingerprint = span.attributes.get("db.query.fingerprint") if span else None
+            self.history.track(getattr(cursor, "sfqid", None),
+                               query_fingerprint or fingerprint(sql), span)
+        return cursor
+
+    def target_warehouse(self, query):
+        """Get the warehouse a query will run on.
+
+        The warehouse is the one the builder asked for, the one the
+        warehouse router chooses, or the connector's default; the cost
+        guard may reroute an over-budget query to its own connector.
+
+        Args:
+            query: QueryBuilder instance or (sql, params) tuple
+
+        Returns:
+            Warehouse name, or None when the connector does not name one
+        """
+        if hasattr(query, "build"):
+            sql, params = query.build()
+            session, _ = self._builder_session(query)
+        else:
+            sql, params = query
+            session = {}
+
+        connector, warehouse = route_connector(self.connector, session.get("warehouse"))
+        params, in_lists = split_in_lists(params)
+        if self.cost_guard is not None and not in_lists:
+            rerouted = self.cost_guard.check(sql, params)
+            if rerouted is not None:
+                return getattr(rerouted, "warehouse", None)
+        return warehouse or getattr(connector, "warehouse", None)
+
+    def execute_builder(self, builder):
+        """Build and execute a query from a QueryBuilder.
+
+        Queries whose filters are contradictory are answered locally
+        without a round trip to the database.
+
+        Args:
+            builder: QueryBuilder instance
+
+        Returns:
+            List of dictionaries with query results
+        """
+        sql, params = builder.build()
+
+        if builder.is_always_false():
+            return []
+
+        session, routed = self._builder_session(builder)
+        span = self._start_span(sql, session, builder, timed=routed)
+        started = time.perf_counter()
+        try:
+            results, cache = self._execute_rows(sql, params, "dict",
+                                                builder.referenced_tables(), session, span)
+        except Exception as e:
+            _record_execution(builder, started, 0, error=True)
+            self._finish_span(span, None, params, e)
+            raise
+
+        _record_execution(builder, started, len(results), cache=cache)
+        if routed and cache is None:
+            self._record_route(builder, session, span)
+        self._finish_span(span, results, params)
+        return results
+
+    def execute_builder_columnar(self, builder, output="arrow"):
+        """Build and execute a query from a QueryBuilder, column by column.
+
+        With a semantic cache, queries that only refine a cached result
+        (extra filters, fewer columns, coarser grouping) are answered from
+        it locally, and new results are added to it.
+
+        Args:
+            builder: QueryBuilder instance
+            output: "arrow", "numpy" or "pydict" (see execute_columnar)
+
+        Returns:
+            Columnar query results in the requested format
+        """
+        sql, params = builder.build()
+        session, routed = self._builder_session(builder)
+        span = self._start_span(sql, session, builder, timed=routed)
+        started = time.perf_counter()
+
+        try:
+            if self.semantic_cache is None:
+                results, cache = self._execute_columnar(sql, params, output,
+                                                        DEFAULT_BATCH_SIZE, session, span,
+                                                        builder.referenced_tables())
+            else:
+                table = self.semantic_cache.lookup(builder)
+                if table is None:
+                    table, cache = self._execute_columnar(sql, params, "arrow",
+                                                          DEFAULT_BATCH_SIZE, session, span,
+                                                          builder.referenced_tables())
+                    self.semantic_cache.put(builder, table)
+                else:
+                    cache = "semantic"
+                    if span is not None:
+                        span.set_attribute("pyquerybuilder.cache", "semantic")
+                results = convert_table(table, output)
+        except Exception as e:
+            _record_execution(builder, started, 0, error=True)
+            self._finish_span(span, None, params, e)
+            raise
+
+        _record_execution(builder, started, _columnar_rows(results), cache=cache)
+        if routed and cache is None:
+            self._record_route(builder, session, span)
+        self._finish_span(span, results, params)
+        return results
+
+    def _builder_session(self, builder):
+        """Get the session settings of a built query.
+
+        Args:
+            builder: Built QueryBuilder instance
+
+        Returns:
+            Tuple of (session settings, whether the warehouse router chose
+            the warehouse)
+        """
+        session = session_settings(builder)
+        if self.warehouse_router is None or session["warehouse"]:
+            return session, False
+        session["warehouse"] = self.warehouse_router.choose(builder)
+        return session, True
+
+    def _record_route(self, builder, session, span):
+        """Feed the warehouse router the execution time of a routed query.
+
+        Only the time the warehouse spent executing counts; checkout,
+        fetch and conversion times do not depend on its size.
+
+        Args:
+            builder: Built QueryBuilder instance
+            session: Session settings holding the chosen warehouse
+            span: QuerySpan carrying the execution time
+        """
+        execute_time = span.attributes.get("pyquerybuilder.execute_time")
+        if execute_time is not None:
+            self.warehouse_router.record(builder.fingerprint(), session["warehouse"],
+                                         execute_time)
+
+    def _start_span(self, sql, session=None, builder=None, timed=False):
+        """Start a telemetry span for a query.
+
+        Args:
+            sql: SQL query string
+            session: Optional session settings
+            builder: QueryBuilder the query was built from, if any
+            timed: Start a span even without telemetry, because the
+                caller reads the query's timings from it
+
+        Returns:
+            QuerySpan, or None when neither telemetry nor the slow query
+            log is enabled and no timings are needed
+        """
+        attributes = {"db.system": "snowflake", "db.statement": sql}
+        span = self.telemetry.start_span("query", attributes)
+        if span is None:
+            if self.slow_query_log is None and not timed:
+                return None
+            # The slow query log and the warehouse router read their
+            # timings from an undelivered span
+            span = QuerySpan("query", attributes)
+
+        if builder is not None:
+            span.set_attribute("db.query.fingerprint", builder.fingerprint())
+            span.set_attribute("pyquerybuilder.build_time", builder.build_time())
+        else:
+            span.set_attribute("db.query.fingerprint", fingerprint(sql))
+        span.set_attribute("db.snowflake.query_tag", (session or {}).get("query_tag"))
+        return span
+
+    def _finish_stream(self, span, params, rows, fetch_time, error=None):
+        """Record a streamed query's fetch and finish its span.
+
+        Args:
+            span: QuerySpan from _start_span(), or None
+            params: Parameters the query was executed with
+            rows: Rows fetched before the stream was closed
+            fetch_time: Seconds spent fetching
+            error: Exception that ended the stream, if any
+        """
+        FETCH_SECONDS.observe(fetch_time)
+        ROWS_FETCHED.inc(rows)
+        if span is not None:
+            span.set_attribute("pyquerybuilder.fetch_time", fetch_time)
+            span.set_attribute("db.response.returned_rows", rows)
+        self._finish_span(span, None, params, error)
+
+    def _finish_span(self, span, results, params=None, error=None):
+        """Record the result size on a span, deliver it and log it if slow.
+
+        Args:
+            span: QuerySpan from _start_span(), or None
+            results: Query results, or None when the query failed
+            params: Parameters the query was executed with
+            error: Exception that failed the query, if any
+        """
+        if span is None:
+            return
+
+        if isinstance(results, list):
+            span.set_attribute("db.response.returned_rows", len(results))
+        elif results is not None:
+            span.set_attribute("db.response.returned_rows", _columnar_rows(results))
+            span.set_attribute("db.response.bytes", _columnar_bytes(results))
+        self.telemetry.finish(span, error)
+
+        if self.slow_query_log is not None:
+            self.slow_query_log.record(span, params, self.connector)
+
+
+def _record_execution(builder, started, rows, error=False, cache=None):
+    """Add an execution of a built query to its fingerprint's statistics.
+
+    Queries answered from a cache are recorded as cache hits instead.
+
+    Returns:
+        Seconds elapsed since ``started``
+    """
+    elapsed = time.perf_counter() - started
+    fingerprint = builder.fingerprint() if hasattr(builder, "fingerprint") else None
+    if fingerprint is not None:
+        if cache is not None:
+            query_stats.record_cache_hit(fingerprint)
+        else:
+            query_stats.record_execution(fingerprint, elapsed, rows, error)
+    return elapsed
+
+
+def _record_fetch(span, started, results):
+    """Record the time and size of a completed fetch."""
+    elapsed = time.perf_counter() - started
+    FETCH_SECONDS.observe(elapsed)
+
+    if isinstance(results, list):
+        ROWS_FETCHED.inc(len(results))
+    else:
+        ROWS_FETCHED.inc(_columnar_rows(results))
+        BYTES_FETCHED.inc(_columnar_bytes(results) or 0)
+
+    if span is not None:
+        span.set_attribute("pyquerybuilder.fetch_time", elapsed)
+
+
+def _columnar_bytes(results):
+    """Measure columnar results held in Arrow or NumPy buffers."""
+    if hasattr(results, "nbytes"):
+        return results.nbytes
+    if isinstance(results, dict) and all(hasattr(c, "nbytes") for c in results.values()):
+        return sum(column.nbytes for column in results.values())
+    return None
+
+
+def _columnar_rows(results):
+    """Count the rows of columnar results in any output format."""
+    if hasattr(results, "num_rows"):
+        return results.num_rows
+    for column in results.values():
+        return len(column)
+    return 0
+
+
+class _ReleasingCursor:
+    """Cursor wrapper that cleans up and releases its connection on close.
+
+    Closing also ends the query's count in the in-flight gauge.
+    """
+
+    def __init__(self, cursor, connection, release, cleanup=()):
+        """Wrap a cursor opened on a checked-out connection.
+
+        Args:
+            cursor: Cursor to delegate to
+            connection: Connection the cursor was opened on
+            release: Callable returning the connection to its pool, or
+                None for an unpooled connection
+            cleanup: Statements run on the connection before releasing it
+        """
+        self._cursor = cursor
+        self._connection = connection
+        self._release = release
+        self._cleanup = list(cleanup)
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped cursor."""
+        return getattr(self._cursor, name)
+
+    def close(self):
+        """Close the cursor and release the connection exactly once."""
+        connection, self._connection = self._connection, None
+        try:
+            self._cursor.close()
         finally:
-            cursor.close()
\ No newline at end of file
+            if connection is not None:
+                QUERIES_IN_FLIGHT.dec()
+                try:
+                    for statement in self._cleanup:
+                        run_statement(connection, statement)
+                finally:
+                    if self._release is not None:
+                        self._release(connection)
@@ -0,0 +1,119 @@
+# pyquerybuilder/core/in_list.py
+"""Temporary tables holding IN lists externalized by the WHERE generator."""
+import re
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import insert
+from .insert import InsertBuilder
+from .stage import run_statement
+from ..sql.generators.where_generator import InListTable, in_list_column_type
+
+
+def split_in_lists(params: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]],
+                                                               List[InListTable]]:
+    """Separate InListTable values from the parameters bound to a query.
+
+    Args:
+        params: Query parameters
+
+    Returns:
+        Tuple of (parameters without InListTable values, InListTables)
+    """
+    # Identical lists share one table, which is loaded only once
+    in_lists = list({
+        v.name: v for v in (params or {}).values() if isinstance(v, InListTable)
+    }.values())
+    if not in_lists:
+        return params, []
+    return {k: v for k, v in params.items() if not isinstance(v, InListTable)}, in_lists
+
+
+def bind_in_lists(sql: str, params: Optional[Dict[str, Any]]) -> Tuple[
+        str, Optional[Dict[str, Any]], List[Tuple[str, InListTable]]]:
+    """Give each IN list of a query a temporary table name of its own.
+
+    The name built into the SQL is a hash of the values, so two executions
+    of the same query on one session would create and drop the same table.
+    Each execution loads its tables under that name plus a unique suffix.
+
+    Args:
+        sql: SQL query string
+        params: Query parameters, possibly holding InListTable values
+
+    Returns:
+        Tuple of (SQL naming the tables of this execution, parameters
+        without InListTable values, (table name, InListTable) pairs)
+    """
+    params, in_lists = split_in_lists(params)
+    tables = []
+    for in_list in in_lists:
+        name = f"{in_list.name}_{uuid.uuid4().hex[:8].upper()}"
+        sql = re.sub(rf"\b{in_list.name}\b", name, sql)
+        tables.append((name, in_list))
+    return sql, params, tables
+
+
+def load_in_list(connection, name: str, in_list: InListTable):
+    """Create and fill the temporary table of an externalized IN list.
+
+    Args:
+        connection: Connection the query will run on
+        name: Table name returned by bind_in_lists()
+        in_list: InListTable parameter value
+    """
+    run_statement(
+        connection,
+        f"CREATE OR REPLACE TEMPORARY TABLE {name} (value {in_list.column_type})"
+    )
+    # Without pyarrow, lists of any length go through executemany()
+    strategy = "values" if insert.pyarrow is None else None
+    loader = InsertBuilder(None, name, ["value"])
+    loader.execute_on(connection, {"value": in_list.values}, strategy)
+
+
+def load_in_lists(connection, tables: List[Tuple[str, InListTable]]):
+    """Load several IN lists, dropping them all again if one fails.
+
+    Args:
+        connection: Connection the query will run on
+        tables: (table name, InListTable) pairs returned by bind_in_lists()
+    """
+    try:
+        for name, in_list in tables:
+            load_in_list(connection, name, in_list)
+    except Exception:
+        for name, _ in tables:
+            try:
+                run_statement(connection, drop_in_list_sql(name))
+            except Exception:
+                # The load error is the one worth raising
+                continue
+        raise
+
+
+@contextmanager
+def in_lists_loaded(connection, sql: str, params: Optional[Dict[str, Any]]):
+    """Load a query's IN-list tables for a ``with`` block and drop them after.
+
+    Args:
+        connection: Connection the query will run on
+        sql: SQL query string
+        params: Query parameters, possibly holding InListTable values
+
+    Returns:
+        Context manager yielding the SQL and parameters to execute
+    """
+    sql, params, tables = bind_in_lists(sql, params)
+    load_in_lists(connection, tables)
+    try:
+        yield sql, params
+    finally:
+        for name, _ in tables:
+            run_statement(connection, drop_in_list_sql(name))
+
+
+def drop_in_list_sql(name: str) -> str:
+    """Get the statement dropping an IN list's temporary table."""
+    return f"DROP TABLE IF EXISTS {name}"
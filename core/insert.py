@@ -0,0 +1,295 @@
+# pyquerybuilder/core/insert.py
+"""Builder for bulk INSERTs and COPY-based loads."""
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from .stage import SnowflakeStage, checkout, new_prefix
+
+# Loads with at least this many rows go through PUT and COPY INTO
+COPY_THRESHOLD = 10000
+
+# Rows per executemany() call on the VALUES path
+INSERT_BATCH_SIZE = 1000
+
+# Rows per Parquet file on the COPY path
+ROWS_PER_FILE = 500000
+
+
+def registry_columns(schema_registry, table: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Look up a table's column metadata, ignoring case.
+
+    Args:
+        schema_registry: Registry containing schema metadata
+        table: Table name, optionally qualified
+
+    Returns:
+        Dictionary of column metadata by name, or None if unknown
+    """
+    columns = getattr(schema_registry, "columns", None) or {}
+    name = table.split(".")[-1]
+    for table_name, table_columns in columns.items():
+        if table_name.upper() == name.upper():
+            return table_columns
+    return None
+
+
+def to_columns(rows, columns: Optional[Sequence[str]] = None) -> Tuple[List[str], List[Sequence[Any]]]:
+    """Normalize input rows into column names and one sequence per column.
+
+    Args:
+        rows: pyarrow.Table, dictionary of column sequences, list of row
+            dictionaries or list of row tuples
+        columns: Column names; required for row tuples
+
+    Returns:
+        Tuple of (column names, column value sequences); Arrow and NumPy
+        columns are returned as they are
+    """
+    # Columnar input is passed through so Arrow and NumPy data stay vectorized
+    if pyarrow is not None and isinstance(rows, pyarrow.Table):
+        names = list(columns or rows.column_names)
+        return names, [rows.column(name) for name in names]
+
+    if isinstance(rows, dict):
+        names = list(columns or rows.keys())
+        return names, [rows[name] for name in names]
+
+    rows = list(rows)
+    if not rows:
+        return list(columns or []), [[] for _ in columns or []]
+
+    if isinstance(rows[0], dict):
+        names = list(columns or rows[0].keys())
+        return names, [[row.get(name) for row in rows] for name in names]
+
+    if not columns:
+        raise ValueError("Column names are required for row tuples")
+    names = list(columns)
+    return names, list(zip(*rows))
+
+
+def _as_list(values) -> List[Any]:
+    """Convert an Arrow, NumPy or Python column to a list of Python values."""
+    if hasattr(values, "to_pylist"):
+        return values.to_pylist()
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+class InsertBuilder:
+    """Builds and runs INSERTs, choosing the load strategy by volume.
+
+    Small loads are sent as parameterized multi-row INSERTs through
+    executemany(), which the connector binds as arrays. Loads of at least
+    ``copy_threshold`` rows are converted to Parquet with pyarrow, written
+    to local files of ``rows_per_file`` rows, uploaded with PUT and loaded
+    with a single COPY INTO.
+    """
+
+    def __init__(self, schema_registry, table: str, columns: Optional[Sequence[str]] = None,
+                 connector=None, stage=None, copy_threshold: int = COPY_THRESHOLD,
+                 batch_size: int = INSERT_BATCH_SIZE, rows_per_file: int = ROWS_PER_FILE):
+        """Initialize the insert builder.
+
+        Args:
+            schema_registry: Registry used to validate the columns, or None
+                to skip validation
+            table: Target table
+            columns: Columns to insert; defaults to the columns of the data
+            connector: Database connector
+            stage: Stage for the COPY path; defaults to the table stage.
+                Pass a LocalStage to run the COPY path locally
+            copy_threshold: Row count from which PUT and COPY INTO is used
+            batch_size: Rows per executemany() call
+            rows_per_file: Rows per staged Parquet file
+        """
+        self._schema_registry = schema_registry
+        self._connector = connector
+        self.table = table
+        self.columns = list(columns) if columns else None
+        self.stage = stage or SnowflakeStage()
+        self.copy_threshold = copy_threshold
+        self.batch_size = batch_size
+        self.rows_per_file = rows_per_file
+
+        if self.columns:
+            self.validate_columns(self.columns)
+
+    def validate_columns(self, columns: Sequence[str]) -> List[str]:
+        """Check that columns exist in the target table.
+
+        Args:
+            columns: Column names
+
+        Returns:
+            Column names as stored in the registry
+
+        Raises:
+            ValueError: If the table or a column is not in the registry
+        """
+        if self._schema_registry is None:
+            return list(columns)
+
+        known = registry_columns(self._schema_registry, self.table)
+        if known is None:
+            raise ValueError(f"Table {self.table!r} is not in the schema registry")
+
+        by_upper = {name.upper(): name for name in known}
+        unknown = [c for c in columns if c.upper() not in by_upper]
+        if unknown:
+            raise ValueError(
+                f"Unknown columns for table {self.table!r}: {', '.join(unknown)}"
+            )
+        return [by_upper[c.upper()] for c in columns]
+
+    def build(self, columns: Optional[Sequence[str]] = None,
+              table: Optional[str] = None) -> str:
+        """Build the parameterized INSERT statement for one row.
+
+        Args:
+            columns: Column names; defaults to the builder's columns
+            table: Insert into this table instead of the builder's
+
+        Returns:
+            INSERT statement with :p0, :p1, ... placeholders
+        """
+        columns = list(columns or self.columns or [])
+        if not columns:
+            raise ValueError("No columns to insert")
+
+        placeholders = ", ".join(f":p{i}" for i in range(len(columns)))
+        return (
+            f"INSERT INTO {table or self.table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+    def strategy_for(self, row_count: int) -> str:
+        """Choose the load strategy for a number of rows.
+
+        Args:
+            row_count: Rows to load
+
+        Returns:
+            "values" or "copy"
+        """
+        return "copy" if row_count >= self.copy_threshold else "values"
+
+    def execute(self, rows, strategy: Optional[str] = None) -> Dict[str, Any]:
+        """Load rows into the table.
+
+        Args:
+            rows: pyarrow.Table, dictionary of column sequences, list of
+                row dictionaries or list of row tuples
+            strategy: Force "values" or "copy" instead of choosing by volume
+
+        Returns:
+            Dictionary with the "strategy" used, "rows" loaded, number of
+            "batches" (statements or files), "rows_loaded", the per-file
+            COPY INTO results as "files" (empty for "values") and
+            "elapsed" seconds
+        """
+        with checkout(self._connector) as connection:
+            return self.execute_on(connection, rows, strategy)
+
+    def execute_on(self, connection, rows, strategy: Optional[str] = None,
+                   table: Optional[str] = None) -> Dict[str, Any]:
+        """Load rows on an already checked-out connection.
+
+        Args:
+            connection: Connection to load on
+            rows: Rows in any format accepted by execute()
+            strategy: Force "values" or "copy"
+            table: Load into this table instead, e.g. a staging table
+
+        Returns:
+            Load summary as returned by execute()
+        """
+        started = time.perf_counter()
+        table = table or self.table
+
+        names, values = to_columns(rows, self.columns)
+        names = self.validate_columns(names)
+        row_count = len(values[0]) if values else 0
+
+        strategy = strategy or self.strategy_for(row_count)
+        if strategy not in ("values", "copy"):
+            raise ValueError(f"Unsupported load strategy {strategy!r}")
+
+        files = []
+        if row_count == 0:
+            batches = 0
+        elif strategy == "copy":
+            batches, files = self._copy(connection, table, names, values)
+        else:
+            batches = self._insert_values(connection, table, names, values)
+
+        return {
+            "strategy": strategy,
+            "rows": row_count,
+            "batches": batches,
+            "rows_loaded": (sum(f.get("rows_loaded") or 0 for f in files)
+                            if strategy == "copy" else row_count),
+            "files": files,
+            "elapsed": time.perf_counter() - started
+        }
+
+    def _insert_values(self, connection, table, names, values) -> int:
+        """Insert rows with executemany() in batches."""
+        sql = self.build(names, table)
+        keys = [f"p{i}" for i in range(len(names))]
+        rows = list(zip(*[_as_list(column) for column in values]))
+
+        batches = 0
+        cursor = connection.cursor()
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start:start + self.batch_size]
+                cursor.executemany(sql, [dict(zip(keys, row)) for row in batch])
+                batches += 1
+        finally:
+            cursor.close()
+        return batches
+
+    def _copy(self, connection, table, names, values) -> Tuple[int, List[Dict[str, Any]]]:
+        """Write Parquet files, PUT them and load them with COPY INTO.
+
+        Returns:
+            Number of files written and the COPY INTO result per file
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "pyarrow is required for COPY-based loads; "
+                "install it with 'pip install pyarrow'"
+            )
+
+        # Columnar conversion; no Python object per row is created
+        data = pyarrow.table(dict(zip(
+            names, [v if hasattr(v, "__array__") or hasattr(v, "to_pylist") else list(v)
+                    for v in values]
+        )))
+        prefix = new_prefix()
+        directory = tempfile.mkdtemp(prefix="pyquerybuilder_")
+
+        try:
+            files = 0
+            for start in range(0, data.num_rows, self.rows_per_file):
+                path = os.path.join(directory, f"{prefix}_{files}.parquet")
+                pyarrow.parquet.write_table(
+                    data.slice(start, self.rows_per_file), path, compression="snappy"
+                )
+                self.stage.put(connection, path, table, prefix)
+                files += 1
+
+            return files, self.stage.copy_into(connection, table, prefix)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
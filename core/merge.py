@@ -0,0 +1,189 @@
+# pyquerybuilder/core/merge.py
+"""Set-based upserts through a staging table and one MERGE per batch."""
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from .insert import InsertBuilder, registry_columns, to_columns
+from .stage import checkout, run_statement
+
+# Rows loaded and merged per batch
+MERGE_BATCH_SIZE = 100000
+
+
+class MergeBuilder:
+    """Upserts batches of rows into a table by key.
+
+    Each batch is bulk loaded into a temporary staging table created LIKE
+    the target (through executemany() or PUT and COPY INTO, see
+    InsertBuilder) and applied with a single MERGE. Keys must be unique
+    within a batch, as Snowflake rejects MERGEs where several source rows
+    match one target row.
+    """
+
+    def __init__(self, schema_registry, target: str, key_columns, connector=None,
+                 columns: Optional[Sequence[str]] = None,
+                 update_columns: Optional[Sequence[str]] = None,
+                 batch_size: int = MERGE_BATCH_SIZE, staging: Optional[str] = None,
+                 stage=None, copy_threshold: Optional[int] = None):
+        """Initialize the merge builder.
+
+        Args:
+            schema_registry: Registry with the target's column metadata
+            target: Target table
+            key_columns: Column or columns identifying a row
+            connector: Database connector
+            columns: Columns to merge; defaults to the registry columns
+            update_columns: Columns updated on a match; defaults to every
+                merged column that is not a key
+            batch_size: Rows loaded and merged per batch
+            staging: Force the "values" or "copy" load strategy for the
+                staging table instead of choosing by volume
+            stage: Stage for the COPY strategy (see InsertBuilder)
+            copy_threshold: Row count from which COPY is used
+        """
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        if not key_columns:
+            raise ValueError("At least one key column is required")
+        if staging not in (None, "values", "copy"):
+            raise ValueError(f"Unsupported staging strategy {staging!r}")
+
+        self._schema_registry = schema_registry
+        self._connector = connector
+        self.target = target
+        self.batch_size = batch_size
+        self.staging = staging
+
+        options = {"stage": stage}
+        if copy_threshold is not None:
+            options["copy_threshold"] = copy_threshold
+        self._loader = InsertBuilder(schema_registry, target, connector=connector,
+                                     **options)
+
+        self.key_columns = self._loader.validate_columns(key_columns)
+        if columns is None:
+            known = registry_columns(schema_registry, target) if schema_registry else None
+            if known is None:
+                raise ValueError(
+                    f"Columns are required; table {target!r} is not in the schema registry"
+                )
+            columns = list(known)
+        self.columns = self._loader.validate_columns(columns)
+
+        missing = [k for k in self.key_columns if k not in self.columns]
+        if missing:
+            raise ValueError(f"Key columns must be merged: {', '.join(missing)}")
+
+        if update_columns is None:
+            self.update_columns = [c for c in self.columns if c not in self.key_columns]
+        else:
+            self.update_columns = self._loader.validate_columns(update_columns)
+
+    def build(self, staging_table: str, columns: Optional[Sequence[str]] = None) -> str:
+        """Build the MERGE statement applying a staging table.
+
+        Args:
+            staging_table: Table holding the batch
+            columns: Columns present in the batch; defaults to the
+                builder's columns. Other columns keep their current value
+                on update and their default on insert
+
+        Returns:
+            MERGE statement
+        """
+        columns = list(columns or self.columns)
+        update_columns = [c for c in self.update_columns if c in columns]
+
+        on_clause = " AND ".join(f"t.{k} = s.{k}" for k in self.key_columns)
+        sql = f"MERGE INTO {self.target} t USING {staging_table} s ON {on_clause}"
+
+        if update_columns:
+            assignments = ", ".join(f"t.{c} = s.{c}" for c in update_columns)
+            sql += f" WHEN MATCHED THEN UPDATE SET {assignments}"
+
+        insert_columns = ", ".join(columns)
+        insert_values = ", ".join(f"s.{c}" for c in columns)
+        sql += (
+            f" WHEN NOT MATCHED THEN INSERT ({insert_columns})"
+            f" VALUES ({insert_values})"
+        )
+        return sql
+
+    def execute(self, rows) -> Dict[str, Any]:
+        """Upsert rows into the target in batches.
+
+        Args:
+            rows: pyarrow.Table, dictionary of column sequences, list of
+                row dictionaries or list of row tuples in column order
+
+        Returns:
+            Dictionary with total "rows", "inserted", "updated", "elapsed"
+            seconds and "batches", a list with the strategy, rows, load
+            time, merge time and counts of each batch
+        """
+        started = time.perf_counter()
+        names, values = to_columns(rows, None if _has_names(rows) else self.columns)
+        names = self._loader.validate_columns(names)
+
+        missing = [k for k in self.key_columns if k not in names]
+        if missing:
+            raise ValueError(f"Rows lack key columns: {', '.join(missing)}")
+
+        row_count = len(values[0]) if values else 0
+        staging_table = f"{self.target.split('.')[-1]}_STAGING_{uuid.uuid4().hex[:8].upper()}"
+        batches = []
+
+        with checkout(self._connector) as connection:
+            run_statement(connection,
+                          f"CREATE TEMPORARY TABLE {staging_table} LIKE {self.target}")
+            try:
+                for start in range(0, row_count, self.batch_size):
+                    batch = {
+                        name: column[start:start + self.batch_size]
+                        for name, column in zip(names, values)
+                    }
+                    batches.append(self._merge_batch(
+                        connection, staging_table, names, batch, start > 0
+                    ))
+            finally:
+                run_statement(connection, f"DROP TABLE IF EXISTS {staging_table}")
+
+        return {
+            "rows": row_count,
+            "inserted": sum(b["inserted"] for b in batches),
+            "updated": sum(b["updated"] for b in batches),
+            "elapsed": time.perf_counter() - started,
+            "batches": batches
+        }
+
+    def _merge_batch(self, connection, staging_table, columns, batch,
+                     truncate) -> Dict[str, Any]:
+        """Load one batch into the staging table and merge it."""
+        if truncate:
+            run_statement(connection, f"TRUNCATE TABLE {staging_table}")
+
+        load = self._loader.execute_on(connection, batch, self.staging,
+                                       table=staging_table)
+
+        merge_started = time.perf_counter()
+        result = run_statement(connection, self.build(staging_table, columns))
+        merge_time = time.perf_counter() - merge_started
+
+        # MERGE returns one row: (rows inserted, rows updated[, rows deleted])
+        counts = list(result[0]) if result else []
+        return {
+            "strategy": load["strategy"],
+            "rows": load["rows"],
+            "load_time": load["elapsed"],
+            "merge_time": merge_time,
+            "inserted": counts[0] if len(counts) > 0 else 0,
+            "updated": counts[1] if len(counts) > 1 else 0
+        }
+
+
+def _has_names(rows) -> bool:
+    """Check whether rows carry their own column names."""
+    if isinstance(rows, dict) or hasattr(rows, "column_names"):
+        return True
+    return isinstance(rows, list) and bool(rows) and isinstance(rows[0], dict)
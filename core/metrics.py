@@ -0,0 +1,353 @@
+# pyquerybuilder/core/metrics.py
+"""Process-wide metrics rendered in the Prometheus text format.
+
+Counters, gauges and histograms are updated by the builder and executor
+as queries run. Caches and connection pools already keep their own
+counters; they are monitored and read through their stats() method when
+the metrics are rendered, so they pay nothing per operation.
+"""
+import math
+import threading
+import weakref
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Buckets for query building, which takes microseconds to milliseconds
+BUILD_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Monitored stats() fields that only ever grow
+_COUNTER_FIELDS = ("hits", "misses", "evictions", "invalidations", "checkouts",
+                   "timeouts", "failed_health_checks", "wait_time", "harvested", "dropped",
+                   "slow_queries", "logged", "explained")
+
+# Prometheus names of stats() fields
+_FIELD_NAMES = {"wait_time": "wait_seconds"}
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    """Render a label set as {name="value",...}."""
+    if not labels:
+        return ""
+    parts = []
+    for name, value in sorted(labels.items()):
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Named metric with one value per label set."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            help_text: Description rendered as # HELP
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        """Order label values by the metric's label names."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Get (name, labels, value) samples."""
+        with self._lock:
+            return [
+                (self.name, dict(zip(self.labelnames, key)), value)
+                for key, value in self._values.items()
+            ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        """Increase the count.
+
+        Args:
+            amount: Non-negative increment
+            labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        """Set the value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        """Increase the value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        """Decrease the value."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            help_text: Description rendered as # HELP
+            labelnames: Names of the labels every sample carries
+            buckets: Upper bounds of the buckets; +Inf is added
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        """Record an observation."""
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Get bucket, sum and count samples."""
+        with self._lock:
+            values = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+
+        samples = []
+        for key, counts, total in values:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else _format_value(bound)
+                samples.append((f"{self.name}_bucket", dict(labels, le=le), cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metrics and monitored components."""
+
+    def __init__(self, prefix: str = "pyquerybuilder"):
+        """Initialize an empty registry.
+
+        Args:
+            prefix: Prefix of the names of monitored components' metrics
+        """
+        self.prefix = prefix
+        self._metrics = {}
+        self._monitored = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def monitor(self, component, kind: str, **labels):
+        """Report a component's stats() on every collection.
+
+        Numeric stats() fields become metrics named
+        ``<prefix>_<kind>_<field>``; growing fields such as hits and
+        evictions are counters, the rest gauges. Components with a
+        pool_stats() method (see SnowflakeConnector) report one pool per
+        warehouse. Components are held weakly and dropped once collected;
+        components sharing a kind and labels are summed.
+
+        Args:
+            component: Object with a stats() or pool_stats() method
+            kind: Component kind, e.g. "result_cache" or "pool"
+            labels: Extra labels identifying the component
+        """
+        with self._lock:
+            for reference, _, _ in self._monitored:
+                if reference() is component:
+                    return
+            self._monitored.append((weakref.ref(component), kind, labels))
+
+    def collect(self) -> List[Dict[str, Any]]:
+        """Collect every metric family.
+
+        Returns:
+            List of dictionaries with "name", "type", "help" and
+            "samples", a list of (name, labels, value) tuples
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            self._monitored = [m for m in self._monitored if m[0]() is not None]
+            monitored = list(self._monitored)
+
+        families = [
+            {"name": m.name, "type": m.kind, "help": m.help, "samples": m.samples()}
+            for m in metrics
+        ]
+        families.extend(self._collect_monitored(monitored))
+        return families
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            Text to serve with content type "text/plain; version=0.0.4"
+        """
+        lines = []
+        for family in self.collect():
+            if not family["samples"]:
+                continue
+            lines.append(f"# HELP {family['name']} {family['help']}")
+            lines.append(f"# TYPE {family['name']} {family['type']}")
+            for name, labels, value in family["samples"]:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, cls, name, help_text, labelnames, **options):
+        """Get an existing metric or create it."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **options)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered differently")
+            return metric
+
+    def _collect_monitored(self, monitored) -> List[Dict[str, Any]]:
+        """Read monitored components into metric families."""
+        totals = {}
+        for reference, kind, labels in monitored:
+            component = reference()
+            if component is None:
+                continue
+            if hasattr(component, "pool_stats"):
+                for warehouse, stats in component.pool_stats().items():
+                    _add_stats(totals, kind, dict(labels, warehouse=warehouse), stats)
+            else:
+                _add_stats(totals, kind, labels, component.stats())
+
+        families = {}
+        for (kind, field, label_items), value in totals.items():
+            counter = field in _COUNTER_FIELDS
+            name = f"{self.prefix}_{kind}_{_FIELD_NAMES.get(field, field)}"
+            if counter:
+                name += "_total"
+            family = families.setdefault(name, {
+                "name": name,
+                "type": "counter" if counter else "gauge",
+                "help": f"{field.replace('_', ' ').capitalize()} of monitored {kind} instances",
+                "samples": []
+            })
+            family["samples"].append((name, dict(label_items), value))
+
+        # Ratios are recomputed from summed hits and misses
+        for (kind, field, label_items), hits in list(totals.items()):
+            if field != "hits" or (kind, "misses", label_items) not in totals:
+                continue
+            lookups = hits + totals[(kind, "misses", label_items)]
+            name = f"{self.prefix}_{kind}_hit_ratio"
+            family = families.setdefault(name, {
+                "name": name,
+                "type": "gauge",
+                "help": f"Hit ratio of monitored {kind} instances",
+                "samples": []
+            })
+            family["samples"].append((name, dict(label_items), hits / lookups if lookups else 0.0))
+
+        return list(families.values())
+
+
+def _add_stats(totals, kind, labels, stats):
+    """Add a component's numeric stats() fields to running totals."""
+    label_items = tuple(sorted((k, str(v)) for k, v in labels.items()))
+    for field, value in (stats or {}).items():
+        if field == "hit_ratio" or isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        key = (kind, field, label_items)
+        totals[key] = totals.get(key, 0) + value
+
+
+# Registry shared by every builder, executor and monitored component
+metrics = MetricsRegistry()
+
+BUILD_SECONDS = metrics.histogram(
+    "pyquerybuilder_build_seconds", "Time spent analyzing and generating a query",
+    buckets=BUILD_BUCKETS
+)
+QUERIES = metrics.counter(
+    "pyquerybuilder_queries_total", "Queries sent to the database", ("status",)
+)
+QUERIES_IN_FLIGHT = metrics.gauge(
+    "pyquerybuilder_queries_in_flight", "Queries executing or being fetched"
+)
+EXECUTE_SECONDS = metrics.histogram(
+    "pyquerybuilder_execute_seconds", "Time until the database returned a result"
+)
+FETCH_SECONDS = metrics.histogram(
+    "pyquerybuilder_fetch_seconds", "Time spent fetching and converting results"
+)
+ROWS_FETCHED = metrics.counter(
+    "pyquerybuilder_rows_fetched_total", "Rows fetched from the database"
+)
+BYTES_FETCHED = metrics.counter(
+    "pyquerybuilder_bytes_fetched_total", "Bytes of columnar results fetched from the database"
+)
+
+
+def render_metrics() -> str:
+    """Render the process-wide metrics for a Prometheus scrape.
+
+    Returns:
+        Prometheus text exposition format
+    """
+    return metrics.render()
@@ -0,0 +1,143 @@
+# pyquerybuilder/core/pagination.py
+"""Keyset (seek) pagination over QueryBuilder results."""
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+def row_values(row, columns: Sequence[str]) -> List[Any]:
+    """Extract column values from a result row.
+
+    Column names are matched case-insensitively and without their table
+    qualifier, as Snowflake returns unquoted names in upper case.
+
+    Args:
+        row: Row dictionary or Row tuple
+        columns: Column references, e.g. "id" or "o.id"
+
+    Returns:
+        Values in column order
+
+    Raises:
+        KeyError: If a column is not in the result
+    """
+    names = {str(name).upper(): name for name in row.keys()}
+    values = []
+    for column in columns:
+        name = column.split(".")[-1].upper()
+        if name not in names:
+            raise KeyError(f"Column {column!r} is not in the result")
+        values.append(row[names[name]])
+    return values
+
+
+class KeysetPaginator:
+    """Iterates over a query's results one page at a time.
+
+    Each page is ordered by the key columns and limited to ``page_size``
+    rows; pages after the first add a predicate on the key columns that
+    resumes after the last row seen. Unlike OFFSET, the database never
+    reads the rows of earlier pages again, so every page costs the same.
+    The key columns must be non-null and unique together.
+    """
+
+    def __init__(self, builder, key_columns, page_size: int,
+                 descending: bool = False, executor=None):
+        """Initialize the paginator.
+
+        Args:
+            builder: QueryBuilder with the query to page through
+            key_columns: Column name or sequence of column names
+            page_size: Rows per page
+            descending: Walk the keys in descending order
+            executor: Optional QueryExecutor; defaults to one on the
+                builder's connector
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        if not key_columns:
+            raise ValueError("At least one key column is required")
+
+        self.builder = builder
+        self.key_columns = list(key_columns)
+        self.page_size = page_size
+        self.descending = descending
+        self.executor = executor
+        self.last_key = None
+
+    def page_builder(self, last_key: Optional[Sequence[Any]] = None):
+        """Build the query for the page after a key.
+
+        Args:
+            last_key: Key column values of the last row of the previous
+                page, or None for the first page
+
+        Returns:
+            QueryBuilder for the page
+        """
+        page = self.builder.clone()
+
+        # The key order replaces any ordering of the original query
+        direction = "desc" if self.descending else "asc"
+        page._order_by = [
+            {"field": column, "direction": direction}
+            for column in self.key_columns
+        ]
+        page.limit(self.page_size).offset(None)
+
+        if last_key is not None:
+            page._seek = {
+                "columns": list(self.key_columns),
+                "values": list(last_key),
+                "descending": self.descending
+            }
+
+        return page
+
+    def pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over the pages of the result.
+
+        Returns:
+            Iterator of lists of row dictionaries
+        """
+        executor = self._executor()
+
+        while True:
+            page = executor.execute_builder(self.page_builder(self.last_key))
+            if not page:
+                return
+
+            self.last_key = self.key_of(page[-1])
+            yield page
+
+            # A short page is the last one
+            if len(page) < self.page_size:
+                return
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the rows of every page."""
+        for page in self.pages():
+            yield from page
+
+    def reset(self):
+        """Start again from the first page."""
+        self.last_key = None
+
+    def key_of(self, row) -> List[Any]:
+        """Extract the key column values from a result row.
+
+        Args:
+            row: Row dictionary or Row tuple
+
+        Returns:
+            Key values in key column order
+        """
+        return row_values(row, self.key_columns)
+
+    def _executor(self):
+        """Get the executor, creating one on the builder's connector."""
+        if self.executor is None:
+            from .executor import QueryExecutor
+            self.executor = QueryExecutor(self.builder._connector)
+        return self.executor
@@ -0,0 +1,352 @@
+# pyquerybuilder/core/partitioned.py
+"""Parallel extraction of one query split into disjoint slices."""
+import datetime
+import heapq
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from .pagination import row_values
+from .result_stream import DEFAULT_BATCH_SIZE
+from .session import session_settings
+from ..query.where_group import WhereGroup
+from ..sql.functions import Max, Min
+from ..sql.functions.base_function import Function
+
+SPLIT_STRATEGIES = ("range", "quantile", "hash", "date")
+
+DATE_BUCKETS = ("day", "week", "month", "year")
+
+# Marks the end of a slice's batches in its queue
+_DONE = object()
+
+
+class PartitionedQuery:
+    """Splits a query on one column and extracts the slices concurrently.
+
+    Strategies:
+        range: equal-width ranges between MIN and MAX of the column
+        quantile: ranges between APPROX_PERCENTILE boundaries, for skewed
+            columns
+        hash: ``MOD(ABS(HASH(col)), parts) = i``, for columns without a
+            useful order
+        date: ranges between MIN and MAX aligned to calendar buckets, so
+            slices line up with date-clustered micro-partitions
+
+    Range-based strategies add one more slice for NULL keys. Each slice
+    streams through the executor on its own thread into a queue holding at
+    most ``queue_size`` batches, so memory stays bounded however large the
+    result is.
+    """
+
+    def __init__(self, builder, by: str, parts: int, strategy: str = "range",
+                 executor=None, max_workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, queue_size: int = 4,
+                 bucket: str = "day"):
+        """Initialize the partitioned query.
+
+        Args:
+            builder: QueryBuilder with the query to split
+            by: Column to split on
+            parts: Number of slices
+            strategy: One of SPLIT_STRATEGIES
+            executor: Optional QueryExecutor; defaults to one on the
+                builder's connector
+            max_workers: Slices running at once, defaults to parts
+            batch_size: Rows fetched per round trip
+            queue_size: Batches buffered per slice
+            bucket: Calendar unit for the "date" strategy
+        """
+        if strategy not in SPLIT_STRATEGIES:
+            raise ValueError(
+                f"Unsupported split strategy {strategy!r}; "
+                f"use one of {', '.join(SPLIT_STRATEGIES)}"
+            )
+        if bucket not in DATE_BUCKETS:
+            raise ValueError(f"Unsupported date bucket {bucket!r}")
+        if parts < 1:
+            raise ValueError("parts must be at least 1")
+
+        self.builder = builder
+        self.by = by
+        self.parts = parts
+        self.strategy = strategy
+        self.executor = executor
+        self.max_workers = max_workers or parts
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.bucket = bucket
+        self._boundaries = None
+
+    def boundaries(self) -> List[Any]:
+        """Get the inner boundaries between range slices.
+
+        Queried once and reused; empty for the "hash" strategy.
+
+        Returns:
+            Sorted distinct boundary values
+        """
+        if self._boundaries is None:
+            if self.strategy == "hash":
+                self._boundaries = []
+            elif self.strategy == "quantile":
+                self._boundaries = self._quantile_boundaries()
+            else:
+                self._boundaries = self._range_boundaries()
+        return self._boundaries
+
+    def slices(self) -> List[Any]:
+        """Build one builder per slice.
+
+        Returns:
+            QueryBuilder instances selecting disjoint sets of rows
+        """
+        if self.builder._limit is not None or self.builder._offset:
+            raise ValueError("Queries with LIMIT or OFFSET cannot be split")
+
+        if self.strategy == "hash":
+            expression = f"MOD(ABS(HASH({self.by})), {self.parts})"
+            return [
+                _isolated_clone(self.builder).where(expression, "=", i)
+                for i in range(self.parts)
+            ]
+
+        bounds = [None] + self.boundaries() + [None]
+        slices = []
+        for lower, upper in zip(bounds, bounds[1:]):
+            builder = _isolated_clone(self.builder)
+            if lower is not None:
+                builder.where(self.by, ">=", lower)
+            if upper is not None:
+                builder.where(self.by, "<", upper)
+            slices.append(builder)
+
+        # Comparisons never match NULL keys
+        slices.append(_isolated_clone(self.builder).where(self.by, "IS NULL", None))
+        return slices
+
+    def stream(self, ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """Run the slices concurrently and iterate over all rows.
+
+        Args:
+            ordered: Merge the slices by the builder's ORDER BY columns
+                instead of yielding rows as they arrive; every slice then
+                runs at once regardless of max_workers
+
+        Returns:
+            Iterator of row dictionaries
+        """
+        slices = self.slices()
+        stop = threading.Event()
+        executor = self._executor()
+
+        # Ordered merges need one queue per slice; otherwise slices share one
+        if ordered:
+            queues = [queue.Queue(maxsize=self.queue_size) for _ in slices]
+        else:
+            queues = [queue.Queue(maxsize=self.queue_size * len(slices))] * len(slices)
+
+        # A merge waits on every slice, so ordered slices must all run at once
+        workers = len(slices) if ordered else min(self.max_workers, len(slices))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for builder, slice_queue in zip(slices, queues):
+                pool.submit(self._produce, executor, builder, slice_queue, stop)
+
+            if ordered:
+                yield from self._merge_ordered(queues)
+            else:
+                yield from _drain_rows(queues[0], producers=len(slices))
+        finally:
+            # Unblock producers when the consumer stops early
+            stop.set()
+            for slice_queue in set(queues):
+                _drain(slice_queue)
+            pool.shutdown(wait=True)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all rows in arrival order."""
+        return self.stream()
+
+    def _produce(self, executor, builder, slice_queue, stop):
+        """Stream one slice into its queue until done or stopped."""
+        try:
+            sql, params = builder.build()
+            if not builder.is_always_false():
+                with executor.execute_iter(sql, params, self.batch_size,
+                                           session=session_settings(builder)) as rows:
+                    for batch in rows.batches():
+                        if not _put(slice_queue, batch, stop):
+                            return
+        except Exception as e:
+            _put(slice_queue, e, stop)
+        _put(slice_queue, _DONE, stop)
+
+    def _merge_ordered(self, queues) -> Iterator[Dict[str, Any]]:
+        """Merge slices that are each sorted by the builder's ORDER BY."""
+        order_by = self.builder._order_by
+        if not order_by:
+            raise ValueError("An ordered merge needs an ORDER BY on the builder")
+
+        columns = [spec["field"] for spec in order_by]
+        directions = {spec.get("direction", "asc").lower() for spec in order_by}
+        if len(directions) > 1 or not all(isinstance(c, str) for c in columns):
+            raise ValueError(
+                "An ordered merge needs ORDER BY columns in one direction"
+            )
+
+        return heapq.merge(
+            *[_drain_rows(slice_queue) for slice_queue in queues],
+            key=lambda row: _merge_key(row, columns),
+            reverse=directions == {"desc"}
+        )
+
+    def _range_boundaries(self) -> List[Any]:
+        """Compute equal-width boundaries from the column's MIN and MAX."""
+        low, high = self._aggregate_row([Min(self.by), Max(self.by)])
+        if low is None or high is None or low == high:
+            return []
+
+        boundaries = []
+        for i in range(1, self.parts):
+            if isinstance(low, int) and isinstance(high, int):
+                boundary = low + (high - low) * i // self.parts
+            else:
+                boundary = low + (high - low) * i / self.parts
+            if self.strategy == "date":
+                boundary = _truncate(boundary, self.bucket)
+            boundaries.append(boundary)
+
+        return _distinct_sorted(b for b in boundaries if b > low)
+
+    def _quantile_boundaries(self) -> List[Any]:
+        """Compute boundaries splitting the rows into equal counts."""
+        functions = [
+            Function("APPROX_PERCENTILE", self.by, i / self.parts)
+            for i in range(1, self.parts)
+        ]
+        if not functions:
+            return []
+        values = self._aggregate_row(functions)
+        return _distinct_sorted(v for v in values if v is not None)
+
+    def _aggregate_row(self, functions) -> List[Any]:
+        """Run an aggregate-only version of the query and return its row."""
+        stats = self.builder.clone()
+        stats._select_fields = list(functions)
+        stats._group_by = []
+        stats._order_by = []
+        stats.limit(None).offset(None)
+
+        rows = self._executor().execute_builder(stats)
+        if not rows:
+            return [None] * len(functions)
+        return list(rows[0].values())
+
+    def _executor(self):
+        """Get the executor, creating one on the builder's connector."""
+        if self.executor is None:
+            from .executor import QueryExecutor
+            self.executor = QueryExecutor(self.builder._connector)
+        return self.executor
+
+
+def _put(slice_queue, item, stop) -> bool:
+    """Put an item into a bounded queue unless the consumer stopped."""
+    while not stop.is_set():
+        try:
+            slice_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(slice_queue):
+    """Discard everything buffered in a queue."""
+    while True:
+        try:
+            slice_queue.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _drain_rows(slice_queue, producers: int = 1) -> Iterator[Dict[str, Any]]:
+    """Iterate over the rows producers put into a queue until all are done."""
+    while producers:
+        item = slice_queue.get()
+        if item is _DONE:
+            producers -= 1
+        elif isinstance(item, Exception):
+            raise item
+        else:
+            yield from item
+
+
+def _merge_key(row, columns) -> tuple:
+    """Sort key of a row that orders NULLs like Snowflake's default.
+
+    NULLs sort after every value, which is NULLS LAST ascending and,
+    with the merge reversed, NULLS FIRST descending.
+    """
+    return tuple((value is None, value) for value in row_values(row, columns))
+
+
+def _distinct_sorted(boundaries) -> List[Any]:
+    """Sort boundaries and drop duplicates."""
+    result = []
+    for boundary in sorted(boundaries):
+        if not result or boundary != result[-1]:
+            result.append(boundary)
+    return result
+
+
+def _isolated_clone(builder):
+    """Clone a builder so that added filters AND with all existing ones.
+
+    Top-level OR conditions would otherwise bind to the slice predicate,
+    so a builder using them has its filters moved into a single group.
+    """
+    clone = builder.clone()
+    has_or = any(
+        str(c.get("logic", "AND")).upper() == "OR" for c in clone._where_conditions
+    ) or any(getattr(g, "_is_or", False) for g in clone._where_groups)
+    if not has_or:
+        return clone
+
+    group = WhereGroup()
+    for condition in clone._where_conditions:
+        is_or = str(condition.get("logic", "AND")).upper() == "OR"
+        group.conditions.append({
+            "field": condition["field"],
+            "operator": condition["operator"],
+            "value": condition["value"],
+            "type": "or_condition" if is_or else "condition"
+        })
+    for nested in clone._where_groups:
+        is_or = getattr(nested, "_is_or", False)
+        group.conditions.append({
+            "group": nested,
+            "type": "or_group" if is_or else "and_group"
+        })
+
+    clone._where_conditions = []
+    clone._where_groups = [group]
+    return clone
+
+
+def _truncate(value, bucket: str):
+    """Truncate a date or timestamp to the start of its calendar bucket."""
+    if isinstance(value, datetime.datetime):
+        value = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif not isinstance(value, datetime.date):
+        return value
+
+    if bucket == "week":
+        return value - datetime.timedelta(days=value.weekday())
+    if bucket == "month":
+        return value.replace(day=1)
+    if bucket == "year":
+        return value.replace(month=1, day=1)
+    return value
@@ -0,0 +1,252 @@
+# pyquerybuilder/core/query_history.py
+"""Batched harvesting of server-side query statistics from QUERY_HISTORY."""
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .query_stats import query_stats
+from .stage import checkout, run_statement
+from .telemetry import telemetry as default_telemetry
+
+# QUERY_HISTORY columns harvested, with their names in harvested records;
+# times are reported by Snowflake in milliseconds and converted to seconds
+HISTORY_COLUMNS = (
+    ("BYTES_SCANNED", "bytes_scanned"),
+    ("PARTITIONS_SCANNED", "partitions_scanned"),
+    ("PARTITIONS_TOTAL", "partitions_total"),
+    ("COMPILATION_TIME", "compilation_time"),
+    ("EXECUTION_TIME", "server_execution_time"),
+    ("QUEUED_OVERLOAD_TIME", "queued_overload_time"),
+    ("BYTES_SPILLED_TO_LOCAL_STORAGE", "bytes_spilled_to_local_storage"),
+    ("BYTES_SPILLED_TO_REMOTE_STORAGE", "bytes_spilled_to_remote_storage"),
+    ("WAREHOUSE_SIZE", "warehouse_size")
+)
+
+_MILLISECOND_FIELDS = ("compilation_time", "server_execution_time", "queued_overload_time")
+
+
+def history_sql(count: int, lookback_minutes: int = 60, result_limit: int = 10000) -> str:
+    """Build the QUERY_HISTORY lookup for a batch of query ids.
+
+    The INFORMATION_SCHEMA table function is used rather than the
+    ACCOUNT_USAGE view, whose rows appear only after up to 45 minutes.
+
+    Args:
+        count: Number of query ids, bound as :q0, :q1, ...
+        lookback_minutes: How far back the table function searches
+        result_limit: Maximum rows the table function scans
+
+    Returns:
+        SQL string
+    """
+    columns = ", ".join(column for column, _ in HISTORY_COLUMNS)
+    placeholders = ", ".join(f":q{i}" for i in range(count))
+    return (
+        f"SELECT QUERY_ID, {columns} "
+        f"FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY("
+        f"END_TIME_RANGE_START => DATEADD('minute', -{int(lookback_minutes)}, "
+        f"CURRENT_TIMESTAMP()), RESULT_LIMIT => {int(result_limit)})) "
+        f"WHERE QUERY_ID IN ({placeholders})"
+    )
+
+
+class QueryHistoryHarvester:
+    """Collects QUERY_HISTORY statistics for executed queries in batches.
+
+    The executor tracks the query id of every query it runs. Pending ids
+    are looked up in batches of ``batch_size`` with one QUERY_HISTORY
+    query: when harvest() is called, or on a background thread every
+    ``interval`` seconds and whenever a batch fills up. Harvested
+    statistics are added to the fingerprint's entry in the query
+    statistics registry and, when the query had a telemetry span, emitted
+    as a child span of it. Queries not yet visible in QUERY_HISTORY are
+    retried up to ``max_attempts`` times; a failed lookup counts as an
+    attempt for every id of its batch and is reported with a warning.
+    """
+
+    def __init__(self, connector, batch_size: int = 100, interval: Optional[float] = None,
+                 telemetry=None, stats=None, max_attempts: int = 3,
+                 lookback_minutes: int = 60, max_pending: int = 10000):
+        """Initialize the harvester.
+
+        Args:
+            connector: Database connector used for the lookups
+            batch_size: Query ids looked up per QUERY_HISTORY query
+            interval: Seconds between background harvests, or None to
+                harvest only when harvest() is called
+            telemetry: Telemetry receiving "query.history" child spans;
+                defaults to the process-wide core.telemetry.telemetry
+            stats: QueryStatsRegistry to feed; defaults to the
+                process-wide registry
+            max_attempts: Harvests a query id is looked up in before it
+                is given up on
+            lookback_minutes: How far back QUERY_HISTORY is searched
+            max_pending: Query ids kept pending; the oldest are dropped
+                beyond this
+        """
+        self.connector = connector
+        self.batch_size = batch_size
+        self.interval = interval
+        self.telemetry = telemetry or default_telemetry
+        self.query_stats = stats or query_stats
+        self.max_attempts = max_attempts
+        self.lookback_minutes = lookback_minutes
+        self.max_pending = max_pending
+
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._harvest_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        # Counters for monitoring
+        self.harvested = 0
+        self.dropped = 0
+        self.failed_lookups = 0
+
+        if interval is not None:
+            self._thread = threading.Thread(
+                target=self._run, name="query-history-harvester", daemon=True
+            )
+            self._thread.start()
+
+    def track(self, query_id: str, fingerprint: Optional[str] = None, span=None):
+        """Queue an executed query for harvesting.
+
+        Args:
+            query_id: Snowflake query id
+            fingerprint: Fingerprint of the query's shape
+            span: Telemetry span of the query, if any
+        """
+        if not query_id:
+            return
+
+        with self._lock:
+            self._pending[query_id] = {"fingerprint": fingerprint, "span": span, "attempts": 0}
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            full = len(self._pending) >= self.batch_size
+
+        if full and self._thread is not None:
+            self._wakeup.set()
+
+    def pending(self) -> int:
+        """Get the number of query ids waiting to be harvested."""
+        with self._lock:
+            return len(self._pending)
+
+    def harvest(self) -> Dict[str, Dict[str, Any]]:
+        """Look up every pending query id, one batch at a time.
+
+        Returns:
+            Harvested statistics by query id
+        """
+        harvested = {}
+        with self._harvest_lock:
+            with self._lock:
+                batch_ids = list(self._pending)
+
+            for start in range(0, len(batch_ids), self.batch_size):
+                batch = batch_ids[start:start + self.batch_size]
+                try:
+                    results = self._lookup(batch)
+                except Exception as e:
+                    warnings.warn(f"QUERY_HISTORY lookup of {len(batch)} queries failed: {e}",
+                                  RuntimeWarning)
+                    with self._lock:
+                        self.failed_lookups += 1
+                    results = {}
+                harvested.update(results)
+                self._apply(batch, results)
+        return harvested
+
+    def stats(self) -> Dict[str, Any]:
+        """Get harvester usage statistics.
+
+        Returns:
+            Dictionary with pending, harvested and dropped counts and
+            the number of failed lookups
+        """
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "harvested": self.harvested,
+                "dropped": self.dropped,
+                "failed_lookups": self.failed_lookups
+            }
+
+    def close(self):
+        """Stop the background thread and harvest what is still pending."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.harvest()
+
+    def _lookup(self, query_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch QUERY_HISTORY rows for a batch of query ids."""
+        params = {f"q{i}": query_id for i, query_id in enumerate(query_ids)}
+        with checkout(self.connector) as connection:
+            rows = run_statement(
+                connection, history_sql(len(query_ids), self.lookback_minutes), params
+            )
+
+        results = {}
+        for row in rows:
+            record = {}
+            for (_, name), value in zip(HISTORY_COLUMNS, row[1:]):
+                if name in _MILLISECOND_FIELDS and value is not None:
+                    value = value / 1000.0
+                record[name] = value
+            results[row[0]] = record
+        return results
+
+    def _apply(self, query_ids: List[str], results: Dict[str, Dict[str, Any]]):
+        """Record harvested statistics and retire or retry the batch."""
+        finished = []
+        with self._lock:
+            for query_id in query_ids:
+                entry = self._pending.get(query_id)
+                if entry is None:
+                    continue
+                entry["attempts"] += 1
+                if query_id in results:
+                    finished.append((query_id, entry))
+                    del self._pending[query_id]
+                    self.harvested += 1
+                elif entry["attempts"] >= self.max_attempts:
+                    del self._pending[query_id]
+                    self.dropped += 1
+
+        for query_id, entry in finished:
+            record = results[query_id]
+            if entry["fingerprint"] is not None:
+                self.query_stats.record_history(entry["fingerprint"], record)
+            if entry["span"] is not None:
+                self._emit(query_id, entry, record)
+
+    def _emit(self, query_id, entry, record):
+        """Emit harvested statistics as a child span of the query's span."""
+        attributes = {"db.snowflake.query_id": query_id,
+                      "db.query.fingerprint": entry["fingerprint"]}
+        for name, value in record.items():
+            if value is not None:
+                attributes[f"db.snowflake.{name}"] = value
+
+        span = self.telemetry.start_span("query.history", attributes, parent=entry["span"])
+        self.telemetry.finish(span)
+
+    def _run(self):
+        """Harvest periodically until stopped."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.harvest()
+            except Exception as e:
+                # Statistics are best effort; never end the thread
+                warnings.warn(f"Query history harvest failed: {e}", RuntimeWarning)
@@ -0,0 +1,204 @@
+# pyquerybuilder/core/query_stats.py
+"""Process-wide statistics aggregated per query fingerprint."""
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class _FingerprintStats:
+    """Running totals for one query fingerprint."""
+
+    __slots__ = ("shape", "builds", "build_time", "executions", "execution_time",
+                 "max_execution_time", "rows", "errors", "cache_hits", "history")
+
+    def __init__(self, shape: Optional[str]):
+        """Initialize empty totals."""
+        self.shape = shape
+        self.builds = 0
+        self.build_time = 0.0
+        self.executions = 0
+        self.execution_time = 0.0
+        self.max_execution_time = 0.0
+        self.rows = 0
+        self.errors = 0
+        self.cache_hits = 0
+        # Sums of QUERY_HISTORY statistics, see record_history()
+        self.history = {}
+
+    def to_dict(self, fingerprint: str) -> Dict[str, Any]:
+        """Summarize the totals with averages."""
+        summary = {
+            "fingerprint": fingerprint,
+            "shape": self.shape,
+            "builds": self.builds,
+            "build_time": self.build_time,
+            "avg_build_time": self.build_time / self.builds if self.builds else 0.0,
+            "executions": self.executions,
+            "execution_time": self.execution_time,
+            "avg_execution_time": (
+                self.execution_time / self.executions if self.executions else 0.0
+            ),
+            "max_execution_time": self.max_execution_time,
+            "rows": self.rows,
+            "avg_rows": self.rows / self.executions if self.executions else 0.0,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits
+        }
+
+        history = dict(self.history)
+        samples = history.pop("samples", 0)
+        if samples:
+            summary["history_samples"] = samples
+            for key, total in history.items():
+                summary[key] = total
+                summary[f"avg_{key}"] = total / samples
+            if history.get("partitions_total"):
+                summary["scan_ratio"] = (
+                    history.get("partitions_scanned", 0) / history["partitions_total"]
+                )
+        return summary
+
+
+class QueryStatsRegistry:
+    """Thread-safe registry of build and execution totals per fingerprint.
+
+    QueryBuilder.build() records build times and QueryExecutor records
+    execution times and row counts under the fingerprint computed during
+    SQL generation, so statistics aggregate over every query of one shape.
+    """
+
+    def __init__(self, max_fingerprints: int = 10000):
+        """Initialize an empty registry.
+
+        Args:
+            max_fingerprints: Fingerprints tracked; new shapes beyond this
+                are not recorded, bounding memory for ad-hoc workloads
+        """
+        self.max_fingerprints = max_fingerprints
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record_build(self, fingerprint: str, seconds: float, shape: Optional[str] = None):
+        """Record one generation of a query.
+
+        Args:
+            fingerprint: Query fingerprint
+            seconds: Time spent analyzing and generating
+            shape: Literal-free SQL shape kept as an example
+        """
+        with self._lock:
+            stats = self._get(fingerprint, shape)
+            if stats is not None:
+                stats.builds += 1
+                stats.build_time += seconds
+
+    def record_execution(self, fingerprint: str, seconds: float, rows: int = 0,
+                         error: bool = False):
+        """Record one execution of a query.
+
+        Args:
+            fingerprint: Query fingerprint
+            seconds: Time spent executing and fetching
+            rows: Rows returned
+            error: Whether the execution failed
+        """
+        with self._lock:
+            stats = self._get(fingerprint, None)
+            if stats is not None:
+                stats.executions += 1
+                stats.execution_time += seconds
+                stats.max_execution_time = max(stats.max_execution_time, seconds)
+                stats.rows += rows
+                if error:
+                    stats.errors += 1
+
+    def record_cache_hit(self, fingerprint: str):
+        """Record a query answered from a client-side cache.
+
+        Cache hits are counted apart from executions so that execution
+        times and row counts describe the warehouse alone.
+
+        Args:
+            fingerprint: Query fingerprint
+        """
+        with self._lock:
+            stats = self._get(fingerprint, None)
+            if stats is not None:
+                stats.cache_hits += 1
+
+    def record_history(self, fingerprint: str, history: Dict[str, Any]):
+        """Record server-side statistics of one execution.
+
+        Numeric fields (bytes scanned, partitions, compilation and queue
+        times, spilled bytes, ...) are summed and reported with averages;
+        "spilled" counts executions that spilled at all.
+
+        Args:
+            fingerprint: Query fingerprint
+            history: Statistics harvested from QUERY_HISTORY
+        """
+        with self._lock:
+            stats = self._get(fingerprint, None)
+            if stats is None:
+                return
+            totals = stats.history
+            totals["samples"] = totals.get("samples", 0) + 1
+            for key, value in history.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[key] = totals.get(key, 0) + value
+            spilled = (history.get("bytes_spilled_to_local_storage") or 0) + \
+                (history.get("bytes_spilled_to_remote_storage") or 0)
+            totals["spilled"] = totals.get("spilled", 0) + (1 if spilled else 0)
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Get the statistics of one fingerprint.
+
+        Args:
+            fingerprint: Query fingerprint
+
+        Returns:
+            Statistics dictionary, or None if the fingerprint is unknown
+        """
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            return None if stats is None else stats.to_dict(fingerprint)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get the statistics of every fingerprint.
+
+        Returns:
+            List of statistics dictionaries
+        """
+        with self._lock:
+            return [stats.to_dict(fp) for fp, stats in self._stats.items()]
+
+    def top(self, n: int = 10, by: str = "execution_time") -> List[Dict[str, Any]]:
+        """Get the fingerprints with the largest value of a statistic.
+
+        Args:
+            n: Number of fingerprints
+            by: Statistic to sort by, e.g. "execution_time" or "rows"
+
+        Returns:
+            List of statistics dictionaries, largest first
+        """
+        return sorted(self.snapshot(), key=lambda s: s[by], reverse=True)[:n]
+
+    def reset(self):
+        """Forget every fingerprint."""
+        with self._lock:
+            self._stats.clear()
+
+    def _get(self, fingerprint: str, shape: Optional[str]):
+        """Get or create totals; must be called with the lock held."""
+        stats = self._stats.get(fingerprint)
+        if stats is None:
+            if len(self._stats) >= self.max_fingerprints:
+                return None
+            stats = self._stats[fingerprint] = _FingerprintStats(shape)
+        elif stats.shape is None:
+            stats.shape = shape
+        return stats
+
+
+# Registry shared by every builder and executor in the process
+query_stats = QueryStatsRegistry()
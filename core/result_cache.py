@@ -0,0 +1,286 @@
+# pyquerybuilder/core/result_cache.py
+"""In-process LRU cache for query results."""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..sql.canonical import collapse_whitespace
+
+
+def make_cache_key(sql: str, params: Optional[Dict[str, Any]] = None,
+                   row_format: str = "dict") -> Tuple[str, str, str]:
+    """Build a cache key from normalized SQL and parameters.
+
+    Args:
+        sql: SQL query string
+        params: Optional parameters dictionary
+        row_format: Row format the results are cached in
+
+    Returns:
+        Hashable cache key
+    """
+    normalized = collapse_whitespace(sql)
+    params_key = repr(sorted((params or {}).items()))
+    return normalized, params_key, row_format
+
+
+def estimate_size(rows: List[Any]) -> int:
+    """Estimate the memory held by a list of result rows.
+
+    Args:
+        rows: Row dictionaries or row tuples
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        values = row.values() if isinstance(row, dict) else row
+        for value in values:
+            size += sys.getsizeof(value)
+    return size
+
+
+def _copy_rows(rows: List[Any]) -> List[Any]:
+    """Copy a row list and its dictionary rows; tuple rows are immutable."""
+    return [dict(row) if isinstance(row, dict) else row for row in rows]
+
+
+class _Entry:
+    """Cached result with its bookkeeping."""
+
+    __slots__ = ("rows", "size", "expires_at", "tables", "last_altered")
+
+    def __init__(self, rows, size, expires_at, tables, last_altered):
+        """Initialize a cache entry."""
+        self.rows = rows
+        self.size = size
+        self.expires_at = expires_at
+        self.tables = tables
+        self.last_altered = last_altered
+
+
+class ResultCache:
+    """LRU result cache bounded by entry count and memory size.
+
+    Entries expire after ``ttl`` seconds and are invalidated when a table
+    they read is invalidated explicitly or, when ``last_altered`` is given,
+    when that table's LAST_ALTERED timestamp changes. LAST_ALTERED is
+    re-read at most once per ``validation_interval`` per table.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 256 * 1024 * 1024,
+                 ttl: Optional[float] = 300.0,
+                 last_altered: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+                 validation_interval: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum estimated bytes held
+            ttl: Seconds an entry stays valid, or None for no expiry
+            last_altered: Callable mapping table names to their
+                LAST_ALTERED values, e.g. a partial of read_last_altered
+            validation_interval: Seconds between LAST_ALTERED checks
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.last_altered = last_altered
+        self.validation_interval = validation_interval
+
+        self._entries = OrderedDict()
+        self._by_table = {}
+        self._table_versions = {}
+        self._lock = threading.RLock()
+        self.bytes_held = 0
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key) -> Optional[List[Any]]:
+        """Look up a cached result.
+
+        Args:
+            key: Key from make_cache_key
+
+        Returns:
+            Copy of the cached rows, or None on a miss; dictionary rows
+            are copied too, so callers cannot change the cached result
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None \
+                    and entry.expires_at < time.monotonic():
+                self._remove(key)
+                entry = None
+
+        if entry is not None and entry.tables and self.last_altered is not None:
+            current = self._current_versions(entry.tables)
+            changed = [
+                t for t in entry.tables
+                if current.get(t) != entry.last_altered.get(t)
+            ]
+            if changed:
+                # Keep the fresh versions so the next put() needs no lookup
+                self._invalidate(changed, forget_versions=False)
+                entry = None
+
+        with self._lock:
+            if entry is None or key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_rows(entry.rows)
+
+    def put(self, key, rows: List[Any], tables: Iterable[str] = ()):
+        """Store a result.
+
+        Args:
+            key: Key from make_cache_key
+            rows: Result rows
+            tables: Tables the query read, for invalidation
+        """
+        tables = tuple(tables)
+        size = estimate_size(rows)
+        if size > self.max_bytes:
+            return
+
+        versions = {}
+        if tables and self.last_altered is not None:
+            versions = self._current_versions(tables)
+
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(_copy_rows(rows), size, expires_at, tables, versions)
+            self.bytes_held += size
+            for table in tables:
+                self._by_table.setdefault(table.upper(), set()).add(key)
+
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self.bytes_held > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_table(self, table: str) -> int:
+        """Drop every entry that read a table.
+
+        Args:
+            table: Table name (case-insensitive)
+
+        Returns:
+            Number of entries removed
+        """
+        return self.invalidate_tables([table])
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop every entry that read any of the given tables.
+
+        Args:
+            tables: Table names (case-insensitive)
+
+        Returns:
+            Number of entries removed
+        """
+        return self._invalidate(tables, forget_versions=True)
+
+    def _invalidate(self, tables, forget_versions: bool) -> int:
+        """Drop entries reading the given tables.
+
+        Args:
+            tables: Table names (case-insensitive)
+            forget_versions: Also forget the tables' LAST_ALTERED values
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for table in tables:
+                if forget_versions:
+                    self._table_versions.pop(table.upper(), None)
+                for key in list(self._by_table.get(table.upper(), ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._by_table.clear()
+            self._table_versions.clear()
+            self.bytes_held = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics.
+
+        Returns:
+            Dictionary with entries, bytes held, hits, misses, hit ratio,
+            evictions and invalidations
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes_held": self.bytes_held,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def _current_versions(self, tables) -> Dict[str, Any]:
+        """Get LAST_ALTERED values, re-reading stale ones.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Dictionary mapping table names to LAST_ALTERED values
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                t for t in tables
+                if t.upper() not in self._table_versions
+                or now - self._table_versions[t.upper()][1] >= self.validation_interval
+            ]
+
+        if stale:
+            fresh = self.last_altered(stale)
+            with self._lock:
+                for table in stale:
+                    self._table_versions[table.upper()] = (fresh.get(table), now)
+
+        with self._lock:
+            return {
+                t: self._table_versions.get(t.upper(), (None, now))[0]
+                for t in tables
+            }
+
+    def _remove(self, key):
+        """Remove an entry; must be called with the lock held."""
+        entry = self._entries.pop(key)
+        self.bytes_held -= entry.size
+        for table in entry.tables:
+            keys = self._by_table.get(table.upper())
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table.upper()]
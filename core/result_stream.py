@@ -0,0 +1,129 @@
+# pyquerybuilder/core/result_stream.py
+"""Streaming access to query results with bounded memory."""
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .row_types import ROW_FORMATS, make_rows
+
+# Rows fetched per fetchmany() round trip by default
+DEFAULT_BATCH_SIZE = 10000
+
+
+class ResultStream:
+    """Iterates over an open cursor in fetchmany() batches.
+
+    The cursor is closed as soon as the results are exhausted, when the
+    stream is closed explicitly, or when a ``with`` block exits, so a
+    consumer that stops early does not leak the cursor.
+    """
+
+    def __init__(self, cursor, batch_size: int = DEFAULT_BATCH_SIZE,
+                 row_format: str = "dict",
+                 on_close: Optional[Callable[["ResultStream"], None]] = None):
+        """Initialize with an executed cursor.
+
+        Args:
+            cursor: Cursor on which a query has been executed
+            batch_size: Number of rows fetched per round trip
+            row_format: "dict" for dictionaries or "compact" for Row tuples
+            on_close: Called with the stream once its cursor is closed,
+                e.g. to record rows_fetched and fetch_time
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if row_format not in ROW_FORMATS:
+            raise ValueError(f"Unsupported row format {row_format!r}")
+
+        self._cursor = cursor
+        self.batch_size = batch_size
+        self.row_format = row_format
+        self.column_names = [desc[0] for desc in cursor.description or []]
+        self.rows_fetched = 0
+        # Seconds spent in fetchmany(), and the exception that ended it
+        self.fetch_time = 0.0
+        self.error = None
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        """Whether the underlying cursor has been released."""
+        return self._cursor is None
+
+    def fetch_batch(self) -> List[tuple]:
+        """Fetch the next batch of raw row tuples.
+
+        Returns:
+            List of row tuples, empty when the results are exhausted
+        """
+        if self._cursor is None:
+            return []
+
+        started = time.perf_counter()
+        try:
+            rows = self._cursor.fetchmany(self.batch_size)
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            self.fetch_time += time.perf_counter() - started
+        if not rows:
+            self.close()
+            return []
+
+        self.rows_fetched += len(rows)
+        return rows
+
+    def raw_batches(self) -> Iterator[List[tuple]]:
+        """Iterate over batches of raw row tuples.
+
+        Returns:
+            Iterator of row tuple lists
+        """
+        try:
+            while True:
+                rows = self.fetch_batch()
+                if not rows:
+                    return
+                yield rows
+        finally:
+            self.close()
+
+    def batches(self) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over batches of rows in the configured row format.
+
+        Returns:
+            Iterator of lists of row dictionaries or Row tuples
+        """
+        column_names = self.column_names
+        for rows in self.raw_batches():
+            if self.row_format == "compact":
+                yield make_rows(column_names, rows)
+            else:
+                yield [dict(zip(column_names, row)) for row in rows]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over rows in the configured row format."""
+        for batch in self.batches():
+            yield from batch
+
+    def close(self):
+        """Close the underlying cursor; safe to call more than once."""
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            try:
+                cursor.close()
+            finally:
+                if self._on_close is not None:
+                    self._on_close(self)
+
+    def __enter__(self) -> "ResultStream":
+        """Enter a context that closes the stream on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the stream when leaving the context."""
+        self.close()
+
+    def __del__(self):
+        """Release the cursor if the stream is garbage collected unread."""
+        self.close()
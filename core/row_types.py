@@ -0,0 +1,113 @@
+# pyquerybuilder/core/row_types.py
+"""Compact row types generated once per result shape."""
+import keyword
+from functools import lru_cache
+from typing import Any, Iterator, List, Sequence, Tuple
+
+# Row formats accepted by the executor
+ROW_FORMATS = ("dict", "compact")
+
+
+class Row(tuple):
+    """Base class for compact result rows.
+
+    Rows are tuples, so they carry no per-row key storage. Values can be
+    read by position, by column name (``row["col"]``) or as attributes
+    when the column name is a valid identifier.
+    """
+
+    __slots__ = ()
+
+    _fields: Tuple[str, ...] = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        """Get a value by column name, position or slice."""
+        if isinstance(key, str):
+            try:
+                key = self._index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by column name, with a default for unknown columns."""
+        index = self._index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Get the column names, in result order."""
+        return self._fields
+
+    def values(self) -> Tuple[Any, ...]:
+        """Get the values, in result order."""
+        return tuple(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (column name, value) pairs."""
+        return zip(self._fields, self)
+
+    def to_dict(self) -> dict:
+        """Convert the row to a plain dictionary."""
+        return dict(zip(self._fields, self))
+
+    def _asdict(self) -> dict:
+        """Convert the row to a plain dictionary, as on a namedtuple."""
+        return self.to_dict()
+
+    def __contains__(self, key) -> bool:
+        """Check whether a column name exists in this row."""
+        return key in self._index
+
+    def __repr__(self) -> str:
+        """Represent the row like a dictionary."""
+        pairs = ", ".join(f"{name!r}: {value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({{{pairs}}})"
+
+
+def _column_getter(index: int):
+    """Create a property reading one tuple position."""
+    return property(lambda self: tuple.__getitem__(self, index))
+
+
+@lru_cache(maxsize=256)
+def row_class_for(column_names: Tuple[str, ...]) -> type:
+    """Get the compact row class for a result shape.
+
+    Classes are cached per tuple of column names, so each shape is
+    generated only once.
+
+    Args:
+        column_names: Column names from cursor.description
+
+    Returns:
+        Row subclass with attribute access for identifier column names
+    """
+    namespace = {
+        "__slots__": (),
+        "_fields": tuple(column_names),
+        # On duplicate names the last column wins, as with dict(zip(...))
+        "_index": {name: index for index, name in enumerate(column_names)}
+    }
+
+    for name, index in namespace["_index"].items():
+        if (name.isidentifier() and not keyword.iskeyword(name)
+                and not hasattr(Row, name) and not name.startswith("_")):
+            namespace[name] = _column_getter(index)
+
+    return type("ResultRow", (Row,), namespace)
+
+
+def make_rows(column_names: Sequence[str], rows: List[tuple]) -> List[Row]:
+    """Wrap raw row tuples in the compact row class for their shape.
+
+    Args:
+        column_names: Column names from cursor.description
+        rows: Raw row tuples
+
+    Returns:
+        List of Row instances
+    """
+    row_class = row_class_for(tuple(column_names))
+    new = tuple.__new__
+    return [new(row_class, row) for row in rows]
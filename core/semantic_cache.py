@@ -0,0 +1,531 @@
+# pyquerybuilder/core/semantic_cache.py
+"""Semantic result cache answering refinements of cached queries locally."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+# Aggregates whose partial results can be aggregated again, and how
+REAGGREGATIONS = {"SUM": "sum", "COUNT": "sum", "MIN": "min", "MAX": "max"}
+
+# Comparison operators that can be evaluated locally
+LOCAL_OPERATORS = ("=", "!=", "<>", ">", ">=", "<", "<=", "IN", "NOT IN",
+                   "BETWEEN", "NOT BETWEEN", "IS NULL", "IS NOT NULL")
+
+
+def describe_query(builder) -> Optional[Dict[str, Any]]:
+    """Describe the structure of a builder for subsumption checks.
+
+    Only single-source SELECTs with AND-ed literal filters, plain columns
+    and simple aggregates are described; anything else (subqueries, CTEs,
+    WHERE groups, OR logic, other functions, keyset pages) is not cached.
+
+    Args:
+        builder: QueryBuilder instance
+
+    Returns:
+        Description dictionary, or None if the query is not supported
+    """
+    if (builder._from_subquery is not None or builder._with_ctes
+            or builder._where_groups or builder._seek is not None
+            or not isinstance(builder._from_table, str)):
+        return None
+
+    columns = []
+    aggregates = []
+    for field in builder._select_fields:
+        if isinstance(field, str):
+            source, output = _split_alias(field)
+            if source == "*":
+                columns = None
+                continue
+            if columns is not None:
+                columns.append((output, _column_key(source)))
+        elif _aggregate_key(field) is not None:
+            aggregates.append((_aggregate_output(field), _aggregate_key(field)))
+        else:
+            return None
+
+    filters = set()
+    for condition in builder._where_conditions:
+        key = _filter_key(condition)
+        if key is None or condition.get("logic", "AND").upper() == "OR":
+            return None
+        filters.add(key)
+
+    group_by = []
+    for field in builder._group_by:
+        if not isinstance(field, str):
+            return None
+        group_by.append(_column_key(field))
+
+    order_by = []
+    for spec in builder._order_by:
+        if not isinstance(spec["field"], str):
+            return None
+        order_by.append((_output_name(spec["field"]),
+                         spec.get("direction", "asc").lower()))
+
+    return {
+        "source": (_normalize(builder._from_table),
+                   tuple(sorted(repr(join) for join in builder._joins))),
+        "columns": columns,
+        "aggregates": aggregates,
+        "filters": frozenset(filters),
+        "conditions": {
+            _filter_key(c): c for c in builder._where_conditions
+        },
+        "group_by": tuple(group_by),
+        "order_by": order_by,
+        "limit": builder._limit,
+        "offset": builder._offset
+    }
+
+
+class SemanticCache:
+    """Cache of Arrow results that can answer strictly refined queries.
+
+    A cached result answers a new query over the same FROM and joins when
+    every cached filter is also in the new query and the new query only
+    adds filters, drops columns or groups by a subset of the cached
+    grouping columns with re-aggregatable aggregates (SUM, COUNT, MIN,
+    MAX). The extra work is done locally with pyarrow.compute.
+
+    Like ResultCache, entries expire after ``ttl`` seconds and are dropped
+    when a table they read is invalidated or, when ``last_altered`` is
+    given, when that table's LAST_ALTERED timestamp changes.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = 300.0,
+                 last_altered: Optional[Callable[[List[str]], Dict[str, Any]]] = None,
+                 validation_interval: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl: Seconds an entry stays valid, or None for no expiry
+            last_altered: Callable mapping table names to their
+                LAST_ALTERED values, e.g. a partial of read_last_altered
+            validation_interval: Seconds between LAST_ALTERED checks
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "pyarrow is required for SemanticCache; "
+                "install it with 'pip install pyarrow'"
+            )
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.last_altered = last_altered
+        self.validation_interval = validation_interval
+        self._entries = OrderedDict()
+        self._table_versions = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def put(self, builder, table) -> bool:
+        """Cache the result of a builder.
+
+        Args:
+            builder: QueryBuilder the result was produced by
+            table: pyarrow.Table with the result
+
+        Returns:
+            True if the query shape is supported and was cached
+        """
+        description = describe_query(builder)
+        if description is None or description["limit"] is not None \
+                or description["offset"] is not None:
+            return False
+
+        tables = tuple(builder.referenced_tables())
+        versions = {}
+        if tables and self.last_altered is not None:
+            versions = self._current_versions(tables)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        key = (description["source"], description["filters"],
+               description["group_by"], repr(description["columns"]),
+               repr(description["aggregates"]))
+        with self._lock:
+            self._entries[key] = (description, table, expires_at, tables, versions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def lookup(self, builder):
+        """Answer a query from a cached superset result.
+
+        Entries that have expired or whose tables changed are dropped
+        instead of used. A candidate that pyarrow cannot evaluate against,
+        e.g. because a literal does not match the column type, is skipped
+        as if it did not subsume the query.
+
+        Args:
+            builder: QueryBuilder to answer
+
+        Returns:
+            pyarrow.Table with the answer, or None if no entry subsumes it
+        """
+        wanted = describe_query(builder)
+        if wanted is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key for key, entry in self._entries.items()
+                if entry[2] is not None and entry[2] < now
+            ]
+            for key in expired:
+                del self._entries[key]
+            candidates = list(reversed(self._entries.items()))
+
+        for key, (cached, table, _, tables, versions) in candidates:
+            if cached["source"] != wanted["source"]:
+                continue
+            if tables and self.last_altered is not None:
+                current = self._current_versions(tables)
+                changed = [t for t in tables if current.get(t) != versions.get(t)]
+                if changed:
+                    with self._lock:
+                        if self._entries.pop(key, None) is not None:
+                            self.invalidations += 1
+                    continue
+
+            try:
+                answer = _answer_from(cached, table, wanted)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError,
+                    pyarrow.ArrowTypeError):
+                answer = None
+            if answer is not None:
+                with self._lock:
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                    self.hits += 1
+                return answer
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def invalidate_table(self, table: str) -> int:
+        """Drop every entry that read a table.
+
+        Args:
+            table: Table name (case-insensitive)
+
+        Returns:
+            Number of entries removed
+        """
+        return self.invalidate_tables([table])
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop every entry that read any of the given tables.
+
+        Args:
+            tables: Table names (case-insensitive)
+
+        Returns:
+            Number of entries removed
+        """
+        names = {table.upper() for table in tables}
+        with self._lock:
+            for name in names:
+                self._table_versions.pop(name, None)
+            stale = [
+                key for key, entry in self._entries.items()
+                if any(t.upper() in names for t in entry[3])
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._table_versions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations
+            }
+
+    def _current_versions(self, tables) -> Dict[str, Any]:
+        """Get LAST_ALTERED values, re-reading those older than the interval."""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                t for t in tables
+                if t.upper() not in self._table_versions
+                or now - self._table_versions[t.upper()][1] >= self.validation_interval
+            ]
+
+        if stale:
+            fresh = self.last_altered(stale)
+            with self._lock:
+                for table in stale:
+                    self._table_versions[table.upper()] = (fresh.get(table), now)
+
+        with self._lock:
+            return {t: self._table_versions.get(t.upper(), (None, now))[0] for t in tables}
+
+
+def _answer_from(cached, table, wanted):
+    """Derive the answer to a query from a cached result, if possible.
+
+    Args:
+        cached: Description of the cached query
+        table: Cached pyarrow.Table
+        wanted: Description of the new query
+
+    Returns:
+        pyarrow.Table or None if the cached result does not subsume it
+    """
+    if cached["source"] != wanted["source"]:
+        return None
+    if not cached["filters"] <= wanted["filters"]:
+        return None
+
+    # Map source columns of the cached result to its output names
+    names = {name.upper(): name for name in table.column_names}
+    if cached["columns"] is None:
+        available = {name.upper(): names[name.upper()] for name in names}
+    else:
+        available = {
+            source: names.get(output.upper())
+            for output, source in cached["columns"]
+            if output.upper() in names
+        }
+
+    extra = wanted["filters"] - cached["filters"]
+
+    if cached["group_by"] or cached["aggregates"]:
+        return _answer_aggregated(cached, table, wanted, available, extra, names)
+
+    if wanted["aggregates"] or wanted["group_by"]:
+        # Aggregating raw rows locally is possible, but only worthwhile for
+        # small results; leave it to the warehouse
+        return None
+
+    if any(_condition_column(key) not in available for key in extra):
+        return None
+
+    filtered = _apply_filters(table, wanted, extra, available)
+    if filtered is None:
+        return None
+
+    if wanted["columns"] is None:
+        if cached["columns"] is not None:
+            return None
+        projected = filtered
+    else:
+        if any(source not in available for _, source in wanted["columns"]):
+            return None
+        projected = pyarrow.table({
+            output: filtered.column(available[source])
+            for output, source in wanted["columns"]
+        })
+
+    return _finish(projected, wanted)
+
+
+def _answer_aggregated(cached, table, wanted, available, extra, names):
+    """Answer a query from a cached grouped result by re-aggregating."""
+    cached_groups = set(cached["group_by"])
+    if not set(wanted["group_by"]) <= cached_groups:
+        return None
+    if any(_condition_column(key) not in cached_groups for key in extra):
+        return None
+    if wanted["columns"] is None or any(
+            source not in set(wanted["group_by"]) for _, source in wanted["columns"]):
+        return None
+
+    cached_aggregates = {
+        agg_key: names.get(output.upper())
+        for output, agg_key in cached["aggregates"]
+    }
+    for _, agg_key in wanted["aggregates"]:
+        if cached_aggregates.get(agg_key) is None:
+            return None
+        if set(wanted["group_by"]) != cached_groups and (
+                agg_key[0] not in REAGGREGATIONS or agg_key[2]):
+            # AVG and DISTINCT aggregates cannot be combined again
+            return None
+    if any(available.get(group) is None for group in wanted["group_by"]):
+        return None
+
+    filtered = _apply_filters(table, wanted, extra, available)
+    if filtered is None:
+        return None
+
+    if set(wanted["group_by"]) == cached_groups:
+        result = {}
+        for output, source in wanted["columns"]:
+            result[output] = filtered.column(available[source])
+        for output, agg_key in wanted["aggregates"]:
+            result[output] = filtered.column(cached_aggregates[agg_key])
+        return _finish(pyarrow.table(result), wanted)
+
+    group_columns = [available[group] for group in wanted["group_by"]]
+    specs = [
+        (cached_aggregates[agg_key], REAGGREGATIONS[agg_key[0]])
+        for _, agg_key in wanted["aggregates"]
+    ]
+    grouped = filtered.group_by(group_columns).aggregate(specs)
+
+    result = {}
+    for output, source in wanted["columns"]:
+        result[output] = grouped.column(available[source])
+    for (output, agg_key), (column, function) in zip(wanted["aggregates"], specs):
+        result[output] = grouped.column(f"{column}_{function}")
+    return _finish(pyarrow.table(result), wanted)
+
+
+def _apply_filters(table, wanted, extra, available):
+    """Filter a table by the extra predicates of the new query."""
+    mask = None
+    for key in extra:
+        condition = wanted["conditions"][key]
+        predicate = _predicate(table.column(available[_condition_column(key)]),
+                               str(condition["operator"]).upper(), condition["value"])
+        if predicate is None:
+            return None
+        mask = predicate if mask is None else pyarrow.compute.and_kleene(mask, predicate)
+
+    return table if mask is None else table.filter(mask)
+
+
+def _predicate(column, operator, value):
+    """Build a boolean mask for one predicate with pyarrow.compute."""
+    pc = pyarrow.compute
+    if operator == "IS NULL":
+        return pc.is_null(column)
+    if operator == "IS NOT NULL":
+        return pc.is_valid(column)
+    if operator in ("IN", "NOT IN"):
+        values = list(value)
+        mask = pc.is_in(column, value_set=pyarrow.array(values), skip_nulls=True)
+        if operator == "IN":
+            return mask
+        if any(v is None for v in values):
+            # x NOT IN (..., NULL) is never true in SQL
+            return pyarrow.array([False] * len(column), type=pyarrow.bool_())
+        # NULL NOT IN (...) is NULL, not true
+        return pc.and_(pc.invert(mask), pc.is_valid(column))
+    if operator in ("BETWEEN", "NOT BETWEEN"):
+        mask = pc.and_kleene(pc.greater_equal(column, value[0]),
+                             pc.less_equal(column, value[1]))
+        return pc.invert(mask) if operator == "NOT BETWEEN" else mask
+
+    functions = {
+        "=": pc.equal, "!=": pc.not_equal, "<>": pc.not_equal,
+        ">": pc.greater, ">=": pc.greater_equal,
+        "<": pc.less, "<=": pc.less_equal
+    }
+    function = functions.get(operator)
+    return None if function is None else function(column, value)
+
+
+def _finish(table, wanted):
+    """Apply the new query's ORDER BY and LIMIT/OFFSET locally."""
+    if wanted["order_by"]:
+        names = {name.upper(): name for name in table.column_names}
+        sort_keys = []
+        for output, direction in wanted["order_by"]:
+            if output.upper() not in names:
+                return None
+            sort_keys.append((names[output.upper()],
+                              "descending" if direction == "desc" else "ascending"))
+        table = table.sort_by(sort_keys)
+
+    if wanted["limit"] is not None or wanted["offset"]:
+        table = table.slice(wanted["offset"] or 0, wanted["limit"])
+    return table
+
+
+def _normalize(text: str) -> str:
+    """Normalize an identifier expression for comparison."""
+    return " ".join(str(text).split()).upper()
+
+
+def _split_alias(field: str) -> Tuple[str, str]:
+    """Split "expr AS alias" into source expression and output name."""
+    lowered = field.lower()
+    if " as " in lowered:
+        index = lowered.index(" as ")
+        return field[:index].strip(), field[index + 4:].strip()
+    return field.strip(), _output_name(field)
+
+
+def _output_name(field: str) -> str:
+    """Get the result column name of a column reference."""
+    return field.strip().split(".")[-1]
+
+
+def _column_key(field: str) -> str:
+    """Normalize a column reference used as a grouping or filter column."""
+    return _normalize(field).split(".")[-1]
+
+
+def _aggregate_key(field) -> Optional[Tuple[str, str, bool]]:
+    """Identify an aggregate function over a single column."""
+    name = getattr(field, "name", None)
+    args = getattr(field, "args", ())
+    if name not in ("SUM", "COUNT", "MIN", "MAX", "AVG") or len(args) != 1 \
+            or not isinstance(args[0], str):
+        return None
+    return name, _column_key(args[0]), bool(getattr(field, "_distinct", False))
+
+
+def _aggregate_output(field) -> str:
+    """Get the result column name of an aggregate function."""
+    return field.alias or field.get_sql()
+
+
+def _filter_key(condition) -> Optional[Tuple[str, str, Any]]:
+    """Build a hashable key for a locally evaluable literal predicate."""
+    field = condition["field"]
+    operator = str(condition["operator"]).upper()
+    value = condition.get("value")
+
+    if not isinstance(field, str) or operator not in LOCAL_OPERATORS:
+        return None
+    if hasattr(value, "get_sql"):
+        return None
+    if isinstance(value, (list, tuple, set)):
+        if any(hasattr(v, "get_sql") for v in value):
+            return None
+        value = tuple(value)
+
+    key = (_column_key(field), operator, value)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _condition_column(key) -> str:
+    """Get the column a filter key applies to."""
+    return key[0]
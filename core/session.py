@@ -0,0 +1,125 @@
+# pyquerybuilder/core/session.py
+"""Session state applied to connections before running a query.
+
+Snowflake ignores QUERY_TAG and USE_WAREHOUSE written as query comments;
+both are session parameters. The executor applies them to the checked
+out connection instead and remembers what each connection was last set
+to, so repeated queries with the same tag and warehouse cost no extra
+round trips.
+"""
+import re
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+from .stage import run_statement
+
+# Hint types applied as session state rather than rendered into the SQL
+SESSION_HINTS = {"QUERY_TAG": "query_tag", "USE_WAREHOUSE": "warehouse"}
+
+_IDENTIFIER = re.compile(r'^(?:[A-Za-z_][A-Za-z0-9_$]*|"(?:[^"]|"")+")$')
+
+# Last applied settings per connection; entries vanish with the connection
+_applied = weakref.WeakKeyDictionary()
+_applied_lock = threading.Lock()
+
+
+def session_settings(builder) -> Dict[str, Optional[str]]:
+    """Collect the session hints of a builder.
+
+    Args:
+        builder: QueryBuilder instance
+
+    Returns:
+        Dictionary with "query_tag" and "warehouse", None when not hinted;
+        the last hint of each type wins
+    """
+    settings = {"query_tag": None, "warehouse": None}
+    for hint in getattr(builder, "_hints", []):
+        key = SESSION_HINTS.get(getattr(hint, "hint_type", None))
+        if key is not None:
+            settings[key] = hint.value
+    return settings
+
+
+def route_connector(connector, warehouse: Optional[str]):
+    """Get the connector serving a warehouse.
+
+    Connectors with per-warehouse pools (see
+    SnowflakeConnector.for_warehouse) hand out sessions that already use
+    the warehouse; other connectors are returned as they are and the
+    warehouse is switched with USE WAREHOUSE by apply_session().
+
+    Args:
+        connector: Database connector
+        warehouse: Requested warehouse, or None for the default
+
+    Returns:
+        Tuple of (connector, warehouse still to apply to the session)
+    """
+    if warehouse and hasattr(connector, "for_warehouse"):
+        return connector.for_warehouse(warehouse), None
+    return connector, warehouse
+
+
+def apply_session(connection, query_tag: Optional[str] = None,
+                  warehouse: Optional[str] = None, default_warehouse: Optional[str] = None):
+    """Bring a connection's session parameters in line with a query's hints.
+
+    Statements are only issued when the connection was last set to
+    something else. A tag left over from an earlier checkout is unset, and
+    a warehouse switched by an earlier checkout is switched back to the
+    default, so settings never leak into queries that did not ask for them.
+
+    Args:
+        connection: Checked-out connection
+        query_tag: QUERY_TAG for the query, or None for no tag
+        warehouse: Warehouse to switch to, or None for the default
+        default_warehouse: Warehouse the connection was opened with
+
+    Raises:
+        ValueError: If a warehouse name is not a valid identifier
+    """
+    target_warehouse = warehouse or default_warehouse
+    for name in (warehouse, default_warehouse):
+        if name is not None and not _IDENTIFIER.match(name):
+            raise ValueError(f"Invalid warehouse name {name!r}")
+
+    state = _state_of(connection)
+
+    if query_tag != state.get("query_tag"):
+        if query_tag is None:
+            run_statement(connection, "ALTER SESSION UNSET QUERY_TAG")
+        else:
+            escaped = str(query_tag).replace("\\", "\\\\").replace("'", "''")
+            run_statement(connection, f"ALTER SESSION SET QUERY_TAG = '{escaped}'")
+        state["query_tag"] = query_tag
+
+    # Connections start on their default warehouse
+    current = state.get("warehouse", default_warehouse)
+    if target_warehouse and (current or "").upper() != target_warehouse.upper():
+        run_statement(connection, f"USE WAREHOUSE {target_warehouse}")
+        state["warehouse"] = target_warehouse
+
+
+def forget_session(connection):
+    """Forget the settings recorded for a connection.
+
+    Args:
+        connection: Connection whose session was reset outside the executor
+    """
+    with _applied_lock:
+        try:
+            _applied.pop(connection, None)
+        except TypeError:
+            pass
+
+
+def _state_of(connection) -> Dict[str, Any]:
+    """Get the settings last applied to a connection."""
+    with _applied_lock:
+        try:
+            return _applied.setdefault(connection, {})
+        except TypeError:
+            # Not weakly referenceable; settings are re-applied every time
+            return {}
@@ -0,0 +1,286 @@
+# pyquerybuilder/core/slow_query_log.py
+"""Rotating local log of queries slower than a threshold."""
+import datetime
+import json
+import os
+import random
+import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from .stage import checkout, run_statement
+from ..sql.generators.where_generator import InListTable
+
+# Span attributes copied into log entries, with their names there
+_SPAN_FIELDS = (
+    ("db.query.fingerprint", "fingerprint"),
+    ("db.snowflake.query_id", "query_id"),
+    ("db.snowflake.warehouse", "warehouse"),
+    ("db.snowflake.query_tag", "query_tag"),
+    ("pyquerybuilder.cache", "cache"),
+    ("db.response.returned_rows", "rows")
+)
+
+# Span attributes reported under "timings"
+_TIMING_FIELDS = (
+    ("pyquerybuilder.build_time", "build"),
+    ("pyquerybuilder.checkout_time", "checkout"),
+    ("pyquerybuilder.execute_time", "execute"),
+    ("pyquerybuilder.fetch_time", "fetch")
+)
+
+_PLAN_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def redact_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Replace parameter values with their type and size.
+
+    Args:
+        params: Query parameters
+
+    Returns:
+        Dictionary with a placeholder such as "<str len=12>" per parameter
+    """
+    redacted = {}
+    for name, value in (params or {}).items():
+        if value is None:
+            redacted[name] = None
+        elif isinstance(value, InListTable):
+            redacted[name] = f"<in-list table len={len(value.values)}>"
+        elif isinstance(value, (str, bytes, list, tuple, set, dict)):
+            redacted[name] = f"<{type(value).__name__} len={len(value)}>"
+        else:
+            redacted[name] = f"<{type(value).__name__}>"
+    return redacted
+
+
+def redact_plan(plan: str, params: Optional[Dict[str, Any]]) -> str:
+    """Remove literal values from an EXPLAIN plan.
+
+    Plans show bound parameter values inside filter expressions, so
+    string literals become '?' and every parameter's value, wherever it
+    appears as a separate token, becomes ?. Numbers that happen to equal
+    a parameter are masked as well, which only over-redacts.
+
+    Args:
+        plan: EXPLAIN USING TEXT output
+        params: Parameters the query was executed with
+
+    Returns:
+        Plan text without the parameter values
+    """
+    plan = _PLAN_STRING.sub("'?'", plan)
+    for value in (params or {}).values():
+        if value is None or isinstance(value, (bool, InListTable)):
+            continue
+        text = str(value)
+        if text:
+            plan = re.sub(rf"(?<![\w.]){re.escape(text)}(?![\w.])", "?", plan)
+    return plan
+
+
+class SlowQueryLog:
+    """Appends queries slower than a threshold to a rotating JSON lines file.
+
+    Each entry holds the SQL, the redacted parameters, the fingerprint,
+    the wall time and its checkout, execution and fetch parts, and
+    optionally the query's EXPLAIN plan. A ``sample_rate`` below one logs
+    only that fraction of slow queries, and plans are captured at most
+    once per fingerprint every ``explain_interval`` seconds, so a burst of
+    slow queries costs neither a log line nor an EXPLAIN each: while one
+    query of a fingerprint runs EXPLAIN, the others log without a plan.
+    Plans pass through redact_plan unless ``redact_plans`` is False, in
+    which case they contain the bound parameter values.
+
+    Logging never fails a query; errors are reported as RuntimeWarnings.
+    """
+
+    def __init__(self, path: str, threshold: float = 1.0, sample_rate: float = 1.0,
+                 explain: bool = False, explain_interval: float = 3600.0,
+                 max_bytes: int = 10 * 1024 ** 2, backup_count: int = 5,
+                 redact: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]] = redact_params,
+                 max_plans: int = 1000, redact_plans: bool = True):
+        """Initialize the log.
+
+        Args:
+            path: File to append to; created if missing
+            threshold: Wall time in seconds above which a query is slow
+            sample_rate: Fraction of slow queries logged
+            explain: Capture EXPLAIN plans of logged queries
+            explain_interval: Seconds a captured plan is reused for other
+                queries with the same fingerprint
+            max_bytes: Size at which the file is rotated to path.1
+            backup_count: Rotated files kept (path.1 to path.N)
+            redact: Callable turning parameters into what is logged
+            max_plans: Fingerprints whose plans are kept
+            redact_plans: Remove parameter values from captured plans
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.path = path
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.explain = explain
+        self.explain_interval = explain_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.redact = redact
+        self.max_plans = max_plans
+        self.redact_plans = redact_plans
+
+        self._plans = OrderedDict()
+        self._explaining = set()
+        self._file = None
+        self._lock = threading.Lock()
+
+        # Counters for monitoring
+        self.slow_queries = 0
+        self.logged = 0
+        self.explained = 0
+
+    def record(self, span, params: Optional[Dict[str, Any]] = None, connector=None) -> bool:
+        """Log a finished query if it was slow and is sampled.
+
+        Args:
+            span: Finished QuerySpan of the query
+            params: Parameters the query was executed with
+            connector: Connector used for EXPLAIN
+
+        Returns:
+            True if the query was logged
+        """
+        try:
+            return self._record(span, params, connector)
+        except Exception as e:
+            warnings.warn(f"Slow query log {self.path!r} failed: {e}", RuntimeWarning)
+            return False
+
+    def _record(self, span, params, connector) -> bool:
+        """Log a finished query if it was slow and is sampled (see record)."""
+        if span is None or span.end_time is None:
+            return False
+
+        seconds = (span.end_time - span.start_time) / 1e9
+        if seconds <= self.threshold:
+            return False
+
+        with self._lock:
+            self.slow_queries += 1
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+
+        attributes = span.attributes
+        sql = attributes.get("db.statement")
+        entry = {
+            "time": datetime.datetime.fromtimestamp(
+                span.start_time / 1e9, datetime.timezone.utc
+            ).isoformat(),
+            "duration": seconds
+        }
+        for key, name in _SPAN_FIELDS:
+            entry[name] = attributes.get(key)
+        entry["timings"] = {
+            name: attributes[key] for key, name in _TIMING_FIELDS if key in attributes
+        }
+        entry["error"] = span.status.get("message")
+        entry["trace_id"] = span.trace_id
+        entry["sql"] = sql
+        entry["params"] = self.redact(params)
+
+        if self.explain and connector is not None and sql:
+            entry["plan"] = self._plan(entry["fingerprint"], sql, params, connector)
+
+        self._write(json.dumps(entry, default=str))
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get slow query log statistics.
+
+        Returns:
+            Dictionary with slow, logged and explained query counts
+        """
+        with self._lock:
+            return {
+                "slow_queries": self.slow_queries,
+                "logged": self.logged,
+                "explained": self.explained,
+                "plans": len(self._plans)
+            }
+
+    def close(self):
+        """Close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _plan(self, fingerprint, sql, params, connector) -> Optional[str]:
+        """Get the query's plan, running EXPLAIN unless a recent one is kept.
+
+        Only one query per fingerprint runs EXPLAIN at a time; the others
+        get the previous plan, if any.
+        """
+        # Temporary IN-list tables are gone once the query has finished
+        if any(isinstance(value, InListTable) for value in (params or {}).values()):
+            return None
+
+        key = fingerprint or sql
+        now = time.monotonic()
+        with self._lock:
+            cached = self._plans.get(key)
+            if key in self._explaining:
+                return None if cached is None else cached[1]
+            if cached is not None and now - cached[0] < self.explain_interval:
+                return cached[1]
+            self._explaining.add(key)
+
+        try:
+            try:
+                with checkout(connector) as connection:
+                    rows = run_statement(connection, f"EXPLAIN USING TEXT {sql}", params)
+                plan = "\n".join(str(row[0]) for row in rows)
+            except Exception as e:
+                plan = f"EXPLAIN failed: {type(e).__name__}: {e}"
+            if self.redact_plans:
+                plan = redact_plan(plan, params)
+
+            with self._lock:
+                self.explained += 1
+                self._plans[key] = (now, plan)
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.max_plans:
+                    self._plans.popitem(last=False)
+        finally:
+            with self._lock:
+                self._explaining.discard(key)
+        return plan
+
+    def _write(self, line: str):
+        """Append a line, rotating the file when it would grow too large."""
+        data = line + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            if self.max_bytes and self._file.tell() and (
+                    self._file.tell() + len(data.encode("utf-8")) > self.max_bytes):
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self.logged += 1
+
+    def _rotate(self):
+        """Shift path to path.1, path.1 to path.2 and so on."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
@@ -0,0 +1,218 @@
+# pyquerybuilder/core/stage.py
+"""Stages for bulk loading files with PUT and COPY INTO."""
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@contextmanager
+def checkout(connector):
+    """Check a connection out of a connector for a ``with`` block.
+
+    Temporary tables are tied to the session, so every step of a load
+    runs on the one connection checked out here.
+
+    Args:
+        connector: Database connector, pooled or not
+
+    Returns:
+        Context manager yielding a connection
+    """
+    if hasattr(connector, "acquire"):
+        connection = connector.acquire()
+        try:
+            yield connection
+        finally:
+            connector.release(connection)
+    else:
+        yield connector.connect()
+
+
+def run_statement(connection, sql: str, params: Optional[Dict[str, Any]] = None) -> List[tuple]:
+    """Execute one statement on a connection and fetch its result rows.
+
+    Args:
+        connection: Database connection
+        sql: SQL statement
+        params: Optional parameters dictionary
+
+    Returns:
+        Result rows as tuples, empty for statements without results
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params or {})
+        return cursor.fetchall() if cursor.description else []
+    finally:
+        cursor.close()
+
+
+# Leading columns of COPY INTO's per-file result rows
+COPY_RESULT_COLUMNS = ("file", "status", "rows_parsed", "rows_loaded",
+                       "error_limit", "errors_seen", "first_error")
+
+
+def table_stage(table: str) -> str:
+    """Get the stage of a table, keeping its database and schema qualifiers.
+
+    Args:
+        table: Table name, optionally qualified such as "db.schema.orders"
+
+    Returns:
+        Stage reference such as "@db.schema.%orders"
+    """
+    quoted = False
+    for index in range(len(table) - 1, -1, -1):
+        if table[index] == '"':
+            quoted = not quoted
+        elif table[index] == "." and not quoted:
+            return f"@{table[:index + 1]}%{table[index + 1:]}"
+    return f"@%{table}"
+
+
+def copy_results(rows: List[tuple]) -> List[Dict[str, Any]]:
+    """Turn COPY INTO result rows into one dictionary per file.
+
+    Args:
+        rows: Rows returned by COPY INTO
+
+    Returns:
+        List of dictionaries keyed by COPY_RESULT_COLUMNS; the single
+        status row of a COPY that found no files is left out
+    """
+    return [
+        dict(zip(COPY_RESULT_COLUMNS, row))
+        for row in rows if len(row) > 1
+    ]
+
+
+def new_prefix() -> str:
+    """Generate a unique stage prefix for one load."""
+    return f"load_{uuid.uuid4().hex}"
+
+
+class SnowflakeStage:
+    """Named, user or table stage that files are PUT to and copied from.
+
+    Files are uploaded under a unique prefix per load and purged by COPY
+    INTO once loaded, so concurrent loads through one stage never see each
+    other's files.
+    """
+
+    def __init__(self, name: Optional[str] = None, parallel: int = 4):
+        """Initialize the stage.
+
+        Args:
+            name: Stage reference such as "@my_stage" or "@~"; defaults to
+                the target table's own stage ("@%table")
+            parallel: Threads PUT uses to upload each file
+        """
+        self.name = name
+        self.parallel = parallel
+
+    def location(self, table: str, prefix: str) -> str:
+        """Get the stage location of a load's files.
+
+        Args:
+            table: Target table
+            prefix: Unique prefix of the load
+
+        Returns:
+            Stage path such as "@%orders/load_1234"
+        """
+        stage = self.name or table_stage(table)
+        return f"{stage.rstrip('/')}/{prefix}"
+
+    def put(self, connection, path: str, table: str, prefix: str):
+        """Upload a local file to the stage.
+
+        Args:
+            connection: Connection of the load's session
+            path: Local file path
+            table: Target table
+            prefix: Unique prefix of the load
+        """
+        file_url = "file://" + os.path.abspath(path).replace("\\", "/")
+        run_statement(
+            connection,
+            f"PUT '{file_url}' {self.location(table, prefix)} "
+            f"PARALLEL = {int(self.parallel)} AUTO_COMPRESS = FALSE OVERWRITE = TRUE"
+        )
+
+    def copy_into(self, connection, table: str, prefix: str) -> List[Dict[str, Any]]:
+        """Load a prefix's Parquet files into a table.
+
+        Args:
+            connection: Connection of the load's session
+            table: Target table
+            prefix: Unique prefix of the load
+
+        Returns:
+            One dictionary per file with its "file", "status",
+            "rows_parsed", "rows_loaded" and error columns
+        """
+        rows = run_statement(
+            connection,
+            f"COPY INTO {table} FROM {self.location(table, prefix)}/ "
+            "FILE_FORMAT = (TYPE = PARQUET) "
+            "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE"
+        )
+        return copy_results(rows)
+
+
+class LocalStage:
+    """Stage stand-in that keeps files in a local directory.
+
+    PUT copies files into the directory and COPY INTO reads them back into
+    ``self.loaded[table]`` as Arrow tables, so the bulk load path can be
+    exercised without a Snowflake account.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the stage.
+
+        Args:
+            directory: Directory standing in for the stage
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "pyarrow is required for LocalStage; "
+                "install it with 'pip install pyarrow'"
+            )
+
+        self.directory = directory
+        self.loaded = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def location(self, table: str, prefix: str) -> str:
+        """Get the local directory holding a load's files."""
+        return os.path.join(self.directory, table, prefix)
+
+    def put(self, connection, path: str, table: str, prefix: str):
+        """Copy a local file into the stage directory."""
+        location = self.location(table, prefix)
+        os.makedirs(location, exist_ok=True)
+        shutil.copy(path, location)
+
+    def copy_into(self, connection, table: str, prefix: str) -> List[Dict[str, Any]]:
+        """Read a load's files into ``self.loaded`` and remove them."""
+        location = self.location(table, prefix)
+        results = []
+        for name in sorted(os.listdir(location)):
+            loaded = pyarrow.parquet.read_table(os.path.join(location, name))
+            self.loaded.setdefault(table, []).append(loaded)
+            results.append({
+                "file": name, "status": "LOADED", "rows_parsed": loaded.num_rows,
+                "rows_loaded": loaded.num_rows, "error_limit": 1,
+                "errors_seen": 0, "first_error": None
+            })
+        shutil.rmtree(location)
+        return results
@@ -0,0 +1,243 @@
+# pyquerybuilder/core/telemetry.py
+"""Per-query telemetry spans delivered to pluggable sinks.
+
+Spans follow the OpenTelemetry span data model (trace and span ids,
+start and end times in Unix nanoseconds, status, attributes and events),
+so sinks can forward them to an OTLP exporter unchanged.
+"""
+import json
+import os
+import threading
+import time
+import warnings
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+
+class QuerySpan:
+    """Timing and attributes of one query."""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None,
+                 parent: Optional["QuerySpan"] = None):
+        """Start a span.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+            parent: Span this one belongs to, sharing its trace
+        """
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.span_id = os.urandom(8).hex()
+        self.start_time = time.time_ns()
+        self.end_time = None
+        self.attributes = dict(attributes or {})
+        self.events = []
+        self.status = {"code": "UNSET"}
+
+    def set_attribute(self, key: str, value: Any):
+        """Set an attribute; None values are ignored.
+
+        Args:
+            key: Attribute name, e.g. "db.snowflake.query_id"
+            value: Attribute value
+        """
+        if value is not None:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """Record a timestamped event within the span.
+
+        Args:
+            name: Event name
+            attributes: Optional event attributes
+        """
+        self.events.append({
+            "name": name,
+            "time_unix_nano": time.time_ns(),
+            "attributes": dict(attributes or {})
+        })
+
+    def end(self, error: Optional[BaseException] = None):
+        """End the span.
+
+        Args:
+            error: Exception that failed the query, if any
+        """
+        self.end_time = time.time_ns()
+        if error is None:
+            self.status = {"code": "OK"}
+        else:
+            self.status = {"code": "ERROR", "message": f"{type(error).__name__}: {error}"}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "kind": "CLIENT",
+            "start_time_unix_nano": self.start_time,
+            "end_time_unix_nano": self.end_time,
+            "status": dict(self.status),
+            "attributes": dict(self.attributes),
+            "events": list(self.events)
+        }
+
+
+class CallbackSink:
+    """Passes every span dictionary to a callable."""
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], Any]):
+        """Initialize the sink.
+
+        Args:
+            callback: Callable receiving each span dictionary
+        """
+        self.callback = callback
+
+    def emit(self, span: Dict[str, Any]):
+        """Deliver a span."""
+        self.callback(span)
+
+
+class JsonLinesSink:
+    """Appends every span as one JSON line to a file."""
+
+    def __init__(self, path: str):
+        """Initialize the sink.
+
+        Args:
+            path: File to append to; created if missing
+        """
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def emit(self, span: Dict[str, Any]):
+        """Append a span to the file."""
+        line = json.dumps(span, default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        """Close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RingBufferSink:
+    """Keeps the most recent spans in memory."""
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize the sink.
+
+        Args:
+            capacity: Number of spans kept; older spans are dropped
+        """
+        self._spans = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def emit(self, span: Dict[str, Any]):
+        """Store a span."""
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> List[Dict[str, Any]]:
+        """Get the stored spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """Drop every stored span."""
+        with self._lock:
+            self._spans.clear()
+
+
+class Telemetry:
+    """Creates query spans and delivers finished spans to sinks.
+
+    Without sinks no spans are created, so disabled telemetry costs one
+    attribute check per query.
+    """
+
+    def __init__(self, sinks=None):
+        """Initialize with optional sinks.
+
+        Args:
+            sinks: Objects with an emit(span_dict) method
+        """
+        self._sinks = list(sinks or [])
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any sink is registered."""
+        return bool(self._sinks)
+
+    def add_sink(self, sink):
+        """Register a sink.
+
+        Args:
+            sink: Object with an emit(span_dict) method
+        """
+        with self._lock:
+            self._sinks = self._sinks + [sink]
+
+    def remove_sink(self, sink):
+        """Unregister a sink.
+
+        Args:
+            sink: Previously registered sink
+        """
+        with self._lock:
+            self._sinks = [s for s in self._sinks if s is not sink]
+
+    def start_span(self, name: str = "query", attributes: Optional[Dict[str, Any]] = None,
+                   parent: Optional[QuerySpan] = None) -> Optional[QuerySpan]:
+        """Start a span if any sink is registered.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+            parent: Optional parent span, e.g. the query a follow-up
+                record such as harvested QUERY_HISTORY statistics belongs to
+
+        Returns:
+            QuerySpan, or None when telemetry is disabled
+        """
+        if not self._sinks:
+            return None
+        return QuerySpan(name, attributes, parent)
+
+    def finish(self, span: Optional[QuerySpan], error: Optional[BaseException] = None):
+        """End a span and deliver it to every sink.
+
+        A failing sink is reported with a warning and never fails the
+        query.
+
+        Args:
+            span: Span from start_span(), or None
+            error: Exception that failed the query, if any
+        """
+        if span is None:
+            return
+
+        span.end(error)
+        data = span.to_dict()
+        for sink in self._sinks:
+            try:
+                sink.emit(data)
+            except Exception as e:
+                warnings.warn(f"Telemetry sink {sink!r} failed: {e}", RuntimeWarning)
+
+
+# Telemetry shared by executors that are not given their own
+telemetry = Telemetry()
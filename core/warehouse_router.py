@@ -0,0 +1,297 @@
+# pyquerybuilder/core/warehouse_router.py
+"""Cost-based warehouse selection that learns from observed latencies."""
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .insert import registry_columns
+
+# Warehouses from smallest to largest with the most work each should take;
+# work is estimated scanned bytes times join fan-out, None means unlimited
+DEFAULT_LADDER = (
+    ("XSMALL", 10 * 1024 ** 3),
+    ("MEDIUM", 250 * 1024 ** 3),
+    ("XLARGE", None)
+)
+
+# Fraction of a table scanned when filtering on its clustering key
+PRUNED_FRACTIONS = {"=": 0.01, "IN": 0.05, "RANGE": 0.25}
+
+_RANGE_OPERATORS = (">", ">=", "<", "<=", "BETWEEN")
+
+# Identifiers in a clustering key expression that are neither function
+# names nor qualifiers
+_KEY_STRING = re.compile(r"'(?:[^']|'')*'")
+_KEY_IDENTIFIER = re.compile(
+    r'"((?:[^"]|"")+)"(?!\s*\.)|([A-Za-z_][A-Za-z0-9_$]*)(?![A-Za-z0-9_$])(?!\s*[(.])'
+)
+
+
+def _table_info(schema_registry, table: str) -> Dict[str, Any]:
+    """Look up a table's registry metadata, ignoring case and qualifiers."""
+    tables = getattr(schema_registry, "tables", None) or {}
+    name = str(table).split(".")[-1].upper()
+    for table_name, info in tables.items():
+        if table_name.upper() == name:
+            return info or {}
+    return {}
+
+
+def _column_name(field) -> Optional[str]:
+    """Get the unqualified, upper-cased column of a plain field reference."""
+    if not isinstance(field, str):
+        return None
+    return field.split(" ")[0].split(".")[-1].strip('"').upper()
+
+
+def clustering_columns(clustering_key: Optional[str]) -> set:
+    """Get the columns a clustering key is defined on.
+
+    Args:
+        clustering_key: CLUSTERING_KEY as reported by INFORMATION_SCHEMA,
+            e.g. "LINEAR(order_date, TO_DATE(shipped_at))"
+
+    Returns:
+        Set of upper-cased column names, including the arguments of key
+        expressions
+    """
+    key = _KEY_STRING.sub("", str(clustering_key or "")).strip()
+    match = re.match(r"^LINEAR\s*\((.*)\)$", key, re.IGNORECASE | re.DOTALL)
+    if match:
+        key = match.group(1)
+
+    columns = set()
+    for quoted, plain in _KEY_IDENTIFIER.findall(key):
+        if quoted:
+            columns.add(quoted.replace('""', '"').upper())
+        elif not plain[0].isdigit():
+            columns.add(plain.upper())
+    return columns
+
+
+def estimate_query(builder, schema_registry) -> Dict[str, Any]:
+    """Estimate the bytes a built query scans and the fan-out of its joins.
+
+    Scanned bytes come from the registry's table sizes ("bytes", as
+    discovered from INFORMATION_SCHEMA.TABLES), reduced for the selected
+    columns and for filters on the base table's clustering key. Joined
+    tables with more rows than the base table and no foreign key from the
+    base table to them multiply the rows processed by their row ratio.
+
+    Args:
+        builder: Built QueryBuilder instance
+        schema_registry: Registry with table statistics
+
+    Returns:
+        Dictionary with "bytes", "fan_out", "work" (bytes times fan-out)
+        and "tables"
+    """
+    base = builder._from_table if isinstance(builder._from_table, str) else None
+    tables = list(builder.referenced_tables())
+    base_info = _table_info(schema_registry, base) if base else {}
+    base_rows = base_info.get("row_count") or 0
+
+    scanned = 0.0
+    fan_out = 1.0
+    for table in tables:
+        info = _table_info(schema_registry, table)
+        table_bytes = float(info.get("bytes") or 0)
+
+        if base and table.upper() == base.upper():
+            table_bytes *= _projection_fraction(builder, schema_registry, table)
+            table_bytes *= _pruning_fraction(builder, info)
+        else:
+            rows = info.get("row_count") or 0
+            if base_rows and rows > base_rows and not _references(schema_registry, base, table):
+                fan_out *= rows / base_rows
+        scanned += table_bytes
+
+    return {
+        "bytes": int(scanned),
+        "fan_out": fan_out,
+        "work": scanned * fan_out,
+        "tables": tables
+    }
+
+
+def _projection_fraction(builder, schema_registry, table: str) -> float:
+    """Fraction of a table's columns the query reads."""
+    columns = registry_columns(schema_registry, table)
+    if not columns:
+        return 1.0
+
+    read = set()
+    fields = list(builder._select_fields) + [c.get("field") for c in builder._where_conditions]
+    fields += list(builder._group_by) + [spec.get("field") for spec in builder._order_by]
+    for field in fields:
+        name = _column_name(field)
+        if name is None or name == "*":
+            # Expressions and SELECT * may read any column
+            return 1.0
+        read.add(name)
+
+    known = {name.upper() for name in columns}
+    return max(len(read & known), 1) / len(known)
+
+
+def _pruning_fraction(builder, table_info: Dict[str, Any]) -> float:
+    """Fraction of a table left after pruning on its clustering key."""
+    key_columns = clustering_columns(table_info.get("clustering_key"))
+    if not key_columns:
+        return 1.0
+
+    fraction = 1.0
+    for condition in builder._where_conditions:
+        if str(condition.get("logic", "AND")).upper() == "OR":
+            return 1.0
+        name = _column_name(condition.get("field"))
+        if not name or name not in key_columns:
+            continue
+        operator = str(condition.get("operator", "")).upper()
+        if operator in _RANGE_OPERATORS:
+            operator = "RANGE"
+        fraction = min(fraction, PRUNED_FRACTIONS.get(operator, 1.0))
+    return fraction
+
+
+def _references(schema_registry, source: str, target: str) -> bool:
+    """Check whether a relationship leads from source to target (many-to-one)."""
+    for relationship in (getattr(schema_registry, "relationships", None) or {}).values():
+        if (str(relationship.get("source_table", "")).upper() == source.upper()
+                and str(relationship.get("target_table", "")).upper() == target.upper()):
+            return True
+    return False
+
+
+class WarehouseRouter:
+    """Picks the cheapest warehouse expected to meet a latency target.
+
+    A query shape first lands on the smallest tier of the ladder whose
+    work limit covers its estimate. Observed execution times are then
+    tracked per fingerprint and tier: a shape slower than the target moves
+    one tier up, and a shape well under the target moves one tier down
+    unless the smaller tier was already seen to miss the target.
+    """
+
+    def __init__(self, schema_registry, ladder: Sequence[Tuple[str, Optional[float]]] = DEFAULT_LADDER,
+                 latency_target: float = 5.0, downgrade_ratio: float = 0.3,
+                 smoothing: float = 0.3):
+        """Initialize the router.
+
+        Args:
+            schema_registry: Registry with table statistics
+            ladder: (warehouse, maximum work) pairs from smallest to
+                largest; the last tier's limit is ignored
+            latency_target: Execution seconds each query should stay under
+            downgrade_ratio: Fraction of the target under which a shape is
+                tried on the next smaller tier
+            smoothing: Weight of the newest observation in the moving
+                average of each shape's latency
+        """
+        if not ladder:
+            raise ValueError("The warehouse ladder needs at least one tier")
+
+        self.schema_registry = schema_registry
+        self.ladder = [(name, limit) for name, limit in ladder]
+        self.latency_target = latency_target
+        self.downgrade_ratio = downgrade_ratio
+        self.smoothing = smoothing
+        self._shapes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def warehouses(self) -> List[str]:
+        """Warehouse names from smallest to largest."""
+        return [name for name, _ in self.ladder]
+
+    def estimated_tier(self, estimate: Dict[str, Any]) -> int:
+        """Get the smallest tier whose work limit covers an estimate.
+
+        Args:
+            estimate: Output of estimate_query
+
+        Returns:
+            Index into the ladder
+        """
+        for index, (_, limit) in enumerate(self.ladder[:-1]):
+            if limit is None or estimate["work"] <= limit:
+                return index
+        return len(self.ladder) - 1
+
+    def choose(self, builder) -> str:
+        """Choose the warehouse for a built query.
+
+        Args:
+            builder: Built QueryBuilder instance
+
+        Returns:
+            Warehouse name
+        """
+        fingerprint = builder.fingerprint()
+        with self._lock:
+            shape = self._shapes.get(fingerprint)
+            if shape is not None:
+                return self.ladder[shape["tier"]][0]
+
+        tier = self.estimated_tier(estimate_query(builder, self.schema_registry))
+        with self._lock:
+            shape = self._shapes.setdefault(fingerprint, {"tier": tier, "latency": {}})
+            return self.ladder[shape["tier"]][0]
+
+    def record(self, fingerprint: str, warehouse: str, seconds: float):
+        """Learn from one execution of a query shape.
+
+        Args:
+            fingerprint: Query fingerprint
+            warehouse: Warehouse the query ran on
+            seconds: Observed execution time
+        """
+        tier = self._tier_of(warehouse)
+        if tier is None or fingerprint is None:
+            return
+
+        with self._lock:
+            shape = self._shapes.setdefault(fingerprint, {"tier": tier, "latency": {}})
+            latencies = shape["latency"]
+            previous = latencies.get(tier)
+            latency = seconds if previous is None else (
+                self.smoothing * seconds + (1 - self.smoothing) * previous
+            )
+            latencies[tier] = latency
+
+            if tier != shape["tier"]:
+                return
+
+            if latency > self.latency_target and tier < len(self.ladder) - 1:
+                shape["tier"] = tier + 1
+            elif (tier > 0 and latency <= self.latency_target * self.downgrade_ratio
+                  and latencies.get(tier - 1, 0.0) <= self.latency_target):
+                shape["tier"] = tier - 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the learned tier and latencies of every query shape.
+
+        Returns:
+            Dictionary by fingerprint with the current "warehouse" and
+            the smoothed "latency" per warehouse
+        """
+        with self._lock:
+            return {
+                fingerprint: {
+                    "warehouse": self.ladder[shape["tier"]][0],
+                    "latency": {self.ladder[t][0]: v for t, v in shape["latency"].items()}
+                }
+                for fingerprint, shape in self._shapes.items()
+            }
+
+    def reset(self):
+        """Forget everything learned."""
+        with self._lock:
+            self._shapes.clear()
+
+    def _tier_of(self, warehouse: str) -> Optional[int]:
+        """Find a warehouse's position in the ladder."""
+        for index, (name, _) in enumerate(self.ladder):
+            if name.upper() == str(warehouse).upper():
+                return index
+        return None
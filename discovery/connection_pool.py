@@ -0,0 +1,323 @@
+# pyquerybuilder/discovery/connection_pool.py
+"""Thread-safe database connection pool."""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the timeout."""
+
+
+class PoolClosed(Exception):
+    """Raised when checking out a connection from a closed pool."""
+
+
+def default_health_check(connection) -> bool:
+    """Check that a connection is still usable.
+
+    Args:
+        connection: DB-API connection
+
+    Returns:
+        True if the connection answered a trivial query
+    """
+    is_closed = getattr(connection, "is_closed", None)
+    if callable(is_closed) and is_closed():
+        return False
+
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+class ConnectionPool:
+    """Pool of connections with bounded size, timeouts and health checks.
+
+    Connections are created on demand by ``factory`` up to ``max_size``;
+    none are opened up front, so call warm() to open ``min_size`` of them
+    ahead of the first checkouts. Idle connections beyond ``min_size`` are
+    closed after ``idle_timeout`` seconds, and connections idle for longer than ``health_check_interval``
+    are validated before being handed out. After a fork the child process
+    drops every inherited connection instead of reusing the parent's
+    sockets.
+    """
+
+    def __init__(self, factory: Callable[[], Any], min_size: int = 0,
+                 max_size: int = 10, checkout_timeout: Optional[float] = 30.0,
+                 idle_timeout: Optional[float] = 600.0,
+                 health_check_interval: Optional[float] = 60.0,
+                 health_check: Callable[[Any], bool] = default_health_check):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable creating a new connection
+            min_size: Number of idle connections never evicted; they
+                are opened lazily, or by warm()
+            max_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection, or
+                None to wait forever
+            idle_timeout: Seconds after which idle connections above
+                min_size are closed, or None to keep them
+            health_check_interval: Seconds of idleness after which a
+                connection is validated on checkout, or None to skip
+            health_check: Callable returning False for a dead connection
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size >= 1")
+
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check = health_check
+
+        self._condition = threading.Condition()
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._pid = os.getpid()
+
+        # Counters for monitoring
+        self.checkouts = 0
+        self.timeouts = 0
+        self.evictions = 0
+        self.failed_health_checks = 0
+        self.wait_time = 0.0
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Check a connection out of the pool.
+
+        Args:
+            timeout: Seconds to wait, defaults to checkout_timeout
+
+        Returns:
+            Connection that must be given back with release()
+
+        Raises:
+            PoolTimeout: If no connection became available in time
+            PoolClosed: If the pool has been closed
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+
+        while True:
+            connection, last_used = self._reserve(deadline)
+
+            if connection is None:
+                # A slot was reserved; open the connection outside the lock
+                try:
+                    connection = self.factory()
+                except Exception:
+                    self._discard_slot()
+                    raise
+            elif not self._is_healthy(connection, last_used):
+                self.failed_health_checks += 1
+                self._close_quietly(connection)
+                self._discard_slot()
+                continue
+
+            with self._condition:
+                self.checkouts += 1
+                self.wait_time += time.monotonic() - started
+            return connection
+
+    def release(self, connection, discard: bool = False):
+        """Return a connection to the pool.
+
+        Args:
+            connection: Connection obtained from acquire()
+            discard: Close the connection instead of reusing it
+        """
+        with self._condition:
+            if self._pid != os.getpid():
+                # Connection belongs to the parent process; never reuse it
+                return
+
+            if discard or self._closed:
+                self._size -= 1
+                self._condition.notify()
+                to_close = connection
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+                to_close = None
+
+        if to_close is not None:
+            self._close_quietly(to_close)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Check out a connection for the duration of a ``with`` block.
+
+        Args:
+            timeout: Seconds to wait, defaults to checkout_timeout
+
+        Returns:
+            Context manager yielding a connection
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def warm(self):
+        """Open connections until min_size idle connections exist."""
+        while True:
+            with self._condition:
+                self._check_fork()
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self.factory()
+            except Exception:
+                self._discard_slot()
+                raise
+            self.release(connection)
+
+    def close(self):
+        """Close all idle connections and refuse further checkouts.
+
+        Connections currently checked out are closed when released.
+        """
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of pool usage.
+
+        Returns:
+            Dictionary with sizes and counters
+        """
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "evictions": self.evictions,
+                "failed_health_checks": self.failed_health_checks,
+                "wait_time": self.wait_time
+            }
+
+    def _reserve(self, deadline):
+        """Take an idle connection or reserve a slot for a new one.
+
+        Args:
+            deadline: time.monotonic() deadline, or None to wait forever
+
+        Returns:
+            Tuple of (connection, last used time), or (None, None) when a
+            slot for a new connection was reserved
+        """
+        evicted = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise PoolClosed("Connection pool is closed")
+
+                    self._check_fork()
+                    evicted.extend(self._evict_idle())
+
+                    if self._idle:
+                        # Most recently used first, so the rest can go idle
+                        return self._idle.pop()
+
+                    if self._size < self.max_size:
+                        self._size += 1
+                        return None, None
+
+                    remaining = (None if deadline is None
+                                 else deadline - time.monotonic())
+                    if remaining is not None and remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeout(
+                            f"No connection available within the checkout "
+                            f"timeout ({self.max_size} connections in use)"
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            for stale in evicted:
+                self._close_quietly(stale)
+
+    def _evict_idle(self):
+        """Remove connections idle for longer than idle_timeout.
+
+        Must be called with the lock held.
+
+        Returns:
+            List of evicted connections to close outside the lock
+        """
+        if self.idle_timeout is None:
+            return []
+
+        evicted = []
+        cutoff = time.monotonic() - self.idle_timeout
+        # The oldest idle connections sit at the left of the deque
+        while (self._idle and self._size > self.min_size
+               and self._idle[0][1] < cutoff):
+            connection, _ = self._idle.popleft()
+            self._size -= 1
+            self.evictions += 1
+            evicted.append(connection)
+        return evicted
+
+    def _check_fork(self):
+        """Forget inherited connections after a fork.
+
+        Must be called with the lock held. The parent's connections are
+        dropped without closing them, since closing would log out the
+        session the parent is still using.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._idle.clear()
+            self._size = 0
+
+    def _is_healthy(self, connection, last_used) -> bool:
+        """Validate a connection that has been idle for a while."""
+        if self.health_check is None or self.health_check_interval is None:
+            return True
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        return self.health_check(connection)
+
+    def _discard_slot(self):
+        """Give back a reserved slot without returning a connection."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        """Close a connection, ignoring errors from dead sessions."""
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -1,36 +1,167 @@
 # pyquerybuilder/discovery/snowflake/connector.py
 """Connector for Snowflake database interaction."""
-import snowflake.connector
+import os
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 
+import snowflake.connector
+
+from ..connection_pool import ConnectionPool
+from ...core.in_list import in_lists_loaded
+
 
 class SnowflakeConnector:
     """Manages connection to Snowflake and executes queries."""
 
     def __init__(self, account, user, password, warehouse,
-                 database, schema=None):
-        """Initialize Snowflake connection parameters."""
+                 database, schema=None, pool_options=None,
+                 keep_alive=False):
+        """Initialize Snowflake connection parameters.
+
+        Args:
+            account: Snowflake account identifier
+            user: User name
+            password: Password
+            warehouse: Default warehouse
+            database: Database name
+            schema: Schema name, defaults to PUBLIC
+            pool_options: Optional ConnectionPool keyword arguments; when
+                given, acquire() checks connections out of a pool
+            keep_alive: Keep idle sessions alive (client_session_keep_alive)
+        """
         self.account = account
         self.user = user
         self.password = password
         self.warehouse = warehouse
         self.database = database
         self.schema = schema or "PUBLIC"
+        self.keep_alive = keep_alive
         self._connection = None
+        self._connection_pid = None
+
+        # Optional pool shared by every caller of acquire()
+        self.pool = None
+        self.pool_options = pool_options
+        if pool_options is not None:
+            self.pool = ConnectionPool(self._create_connection, **pool_options)
+
+        # Connectors (and pools) for other warehouses, see for_warehouse()
+        self._warehouse_connectors = {}
+        self._warehouse_lock = threading.Lock()
+
+    def _create_connection(self):
+        """Open a new Snowflake session."""
+        return snowflake.connector.connect(
+            user=self.user,
+            password=self.password,
+            account=self.account,
+            warehouse=self.warehouse,
+            database=self.database,
+            schema=self.schema,
+            client_session_keep_alive=self.keep_alive
+        )
+
+    def for_warehouse(self, warehouse):
+        """Get a connector whose sessions run on another warehouse.
+
+        Each warehouse gets its own connector, and its own pool when this
+        connector is pooled, so routing a query never switches the
+        warehouse of a session other queries are using.
+
+        Args:
+            warehouse: Warehouse name
+
+        Returns:
+            This connector for its own warehouse, otherwise a connector
+            created on first use and reused afterwards
+        """
+        if not warehouse or warehouse.upper() == str(self.warehouse).upper():
+            return self
+
+        key = warehouse.upper()
+        with self._warehouse_lock:
+            connector = self._warehouse_connectors.get(key)
+            if connector is None:
+                connector = SnowflakeConnector(
+                    self.account, self.user, self.password, warehouse,
+                    self.database, self.schema, pool_options=self.pool_options,
+                    keep_alive=self.keep_alive
+                )
+                self._warehouse_connectors[key] = connector
+            return connector
+
+    def pool_stats(self):
+        """Get the usage of this connector's pools.
+
+        Returns:
+            Dictionary of ConnectionPool.stats() by warehouse, covering
+            the pools of connectors created by for_warehouse()
+        """
+        stats = {}
+        if self.pool is not None:
+            stats[self.warehouse] = self.pool.stats()
+        with self._warehouse_lock:
+            connectors = list(self._warehouse_connectors.values())
+        for connector in connectors:
+            stats.update(connector.pool_stats())
+        return stats
 
     def connect(self):
         """Establish connection to Snowflake."""
-        if not self._connection:
-            self._connection = snowflake.connector.connect(
-                user=self.user,
-                password=self.password,
-                account=self.account,
-                warehouse=self.warehouse,
-                database=self.database,
-                schema=self.schema
-            )
+        # Never reuse a session inherited from a parent process
+        if not self._connection or self._connection_pid != os.getpid():
+            self._connection = self._create_connection()
+            self._connection_pid = os.getpid()
         return self._connection
 
+    def acquire(self):
+        """Check out a connection for exclusive use.
+
+        Returns:
+            Pooled connection, or the shared connection without a pool
+        """
+        if self.pool is not None:
+            return self.pool.acquire()
+        return self.connect()
+
+    def release(self, connection, discard=False):
+        """Give back a connection obtained from acquire().
+
+        Args:
+            connection: Connection to release
+            discard: Close the connection instead of reusing it
+        """
+        if self.pool is not None:
+            self.pool.release(connection, discard)
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of a ``with`` block.
+
+        Returns:
+            Context manager yielding a connection
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        """Close the shared connection and the pools, if any."""
+        with self._warehouse_lock:
+            connectors = list(self._warehouse_connectors.values())
+            self._warehouse_connectors.clear()
+        for connector in connectors:
+            connector.close()
+
+        if self.pool is not None:
+            self.pool.close()
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
     def execute_query(self, sql, params=None):
         """Execute a SQL query and return results.
 
@@ -41,22 +172,55 @@ class SnowflakeConnector:
         Returns:
             List of dictionaries with query results
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self.connection() as conn, \
+                in_lists_loaded(conn, sql, params) as (sql, params):
+            cursor = conn.cursor()
 
-        try:
-            # Execute query
-            cursor.execute(sql, params or {})
+            try:
+                # Execute query
+                cursor.execute(sql, params or {})
 
-            # Fetch column names
-            column_names = [desc[0] for desc in cursor.description]
+                # Fetch column names
+                column_names = [desc[0] for desc in cursor.description]
 
-            # Fetch and process results
-            results = []
-            for row in cursor.fetchall():
-                result = dict(zip(column_names, row))
-                results.append(result)
+                # Fetch and process results
+                results = []
+                for row in cursor.fetchall():
+                    result = dict(zip(column_names, row))
+                    results.append(result)
 
-            return results
-        finally:
-            cursor.close()
\ No newline at end of file
+                return results
+            finally:
+                cursor.close()
+
+    def iter_query(self, sql, params=None, batch_size=10000):
+        """Execute a SQL query and yield result rows in bounded batches.
+
+        Args:
+            sql: SQL query string
+            params: Optional parameters dictionary
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator of row dictionaries
+        """
+        with self.connection() as conn, \
+                in_lists_loaded(conn, sql, params) as (sql, params):
+            cursor = conn.cursor()
+
+            try:
+                # Execute query
+                cursor.execute(sql, params or {})
+
+                # Fetch column names
+                column_names = [desc[0] for desc in cursor.description]
+
+                # Fetch and yield results batch by batch
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(zip(column_names, row))
+            finally:
+                cursor.close()
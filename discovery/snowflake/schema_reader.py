@@ -16,56 +16,68 @@ def discover_tables(connector, include_views=True,
     Returns:
         Dictionary of tables with their metadata
     """
-    conn = connector.connect()
+    conn = connector.acquire()
     cursor = conn.cursor()
 
-    # Build table type filter
-    table_type_filter = "TABLE"
-    if include_views:
-        table_type_filter = "('TABLE', 'VIEW')"
-
-    # Query for tables
-    query = f"""
-    SELECT 
-        TABLE_NAME, 
-        TABLE_TYPE,
-        TABLE_SCHEMA
-    FROM 
-        INFORMATION_SCHEMA.TABLES
-    WHERE 
-        TABLE_SCHEMA = '{connector.schema}'
-        AND TABLE_TYPE IN {table_type_filter}
-    """
-
-    # Add filter for specific tables if provided
-    if include_tables:
-        tables_list = "', '".join(include_tables)
-        query += f" AND TABLE_NAME IN ('{tables_list}')"
-
-    # Add exclusion filter if provided
-    if exclude_tables:
-        tables_list = "', '".join(exclude_tables)
-        query += f" AND TABLE_NAME NOT IN ('{tables_list}')"
-
-    cursor.execute(query)
-
-    tables = {}
-    for row in cursor.fetchall():
-        table_name = row[0]
-        table_type = row[1]
-        schema = row[2]
+    try:
+        # Build table type filter
+        table_type_filter = "TABLE"
+        if include_views:
+            table_type_filter = "('TABLE', 'VIEW')"
+
+        # Query for tables
+        query = f"""
+        SELECT 
+            TABLE_NAME, 
+            TABLE_TYPE,
+            TABLE_SCHEMA,
+            CLUSTERING_KEY,
+            ROW_COUNT,
+            BYTES
+        FROM 
+            INFORMATION_SCHEMA.TABLES
+        WHERE 
+            TABLE_SCHEMA = '{connector.schema}'
+            AND TABLE_TYPE IN {table_type_filter}
+        """
+
+        # Add filter for specific tables if provided
+        if include_tables:
+            tables_list = "', '".join(include_tables)
+            query += f" AND TABLE_NAME IN ('{tables_list}')"
+
+        # Add exclusion filter if provided
+        if exclude_tables:
+            tables_list = "', '".join(exclude_tables)
+            query += f" AND TABLE_NAME NOT IN ('{tables_list}')"
 
-        # Generate a simple alias (first letter of table name)
-        alias = table_name[0].lower()
+        cursor.execute(query)
 
-        tables[table_name] = {
-            "name": table_name,
-            "type": table_type,
-            "schema": schema,
-            "alias": alias
-        }
+        tables = {}
+        for row in cursor.fetchall():
+            table_name = row[0]
+            table_type = row[1]
+            schema = row[2]
+            clustering_key = row[3]
+            row_count = row[4]
+            bytes_ = row[5]
+
+            # Generate a simple alias (first letter of table name)
+            alias = table_name[0].lower()
+
+            tables[table_name] = {
+                "name": table_name,
+                "type": table_type,
+                "schema": schema,
+                "alias": alias,
+                "clustering_key": clustering_key,
+                "row_count": row_count,
+                "bytes": bytes_
+            }
+    finally:
+        cursor.close()
+        connector.release(conn)
 
-    cursor.close()
     return tables
 
 
@@ -79,59 +91,62 @@ def discover_columns(connector, tables):
     Returns:
         Dictionary mapping table names to their columns
     """
-    conn = connector.connect()
+    conn = connector.acquire()
     cursor = conn.cursor()
 
-    # Build list of table names
-    table_names = list(tables.keys())
-    if not table_names:
-        return {}
+    try:
+        # Build list of table names
+        table_names = list(tables.keys())
+        if not table_names:
+            return {}
+
+        # Query for columns
+        tables_list = "', '".join(table_names)
+        query = f"""
+        SELECT 
+            TABLE_NAME,
+            COLUMN_NAME,
+            DATA_TYPE,
+            IS_NULLABLE,
+            CHARACTER_MAXIMUM_LENGTH,
+            NUMERIC_PRECISION,
+            NUMERIC_SCALE
+        FROM 
+            INFORMATION_SCHEMA.COLUMNS
+        WHERE 
+            TABLE_SCHEMA = '{connector.schema}'
+            AND TABLE_NAME IN ('{tables_list}')
+        ORDER BY 
+            TABLE_NAME, ORDINAL_POSITION
+        """
 
-    # Query for columns
-    tables_list = "', '".join(table_names)
-    query = f"""
-    SELECT 
-        TABLE_NAME,
-        COLUMN_NAME,
-        DATA_TYPE,
-        IS_NULLABLE,
-        CHARACTER_MAXIMUM_LENGTH,
-        NUMERIC_PRECISION,
-        NUMERIC_SCALE
-    FROM 
-        INFORMATION_SCHEMA.COLUMNS
-    WHERE 
-        TABLE_SCHEMA = '{connector.schema}'
-        AND TABLE_NAME IN ('{tables_list}')
-    ORDER BY 
-        TABLE_NAME, ORDINAL_POSITION
-    """
+        cursor.execute(query)
+
+        columns = {}
+        for row in cursor.fetchall():
+            table_name = row[0]
+            column_name = row[1]
+            data_type = row[2]
+            is_nullable = row[3]
+            char_max_length = row[4]
+            numeric_precision = row[5]
+            numeric_scale = row[6]
+
+            if table_name not in columns:
+                columns[table_name] = {}
+
+            columns[table_name][column_name] = {
+                "name": column_name,
+                "type": data_type,
+                "nullable": is_nullable == "YES",
+                "max_length": char_max_length,
+                "precision": numeric_precision,
+                "scale": numeric_scale
+            }
+    finally:
+        cursor.close()
+        connector.release(conn)
 
-    cursor.execute(query)
-
-    columns = {}
-    for row in cursor.fetchall():
-        table_name = row[0]
-        column_name = row[1]
-        data_type = row[2]
-        is_nullable = row[3]
-        char_max_length = row[4]
-        numeric_precision = row[5]
-        numeric_scale = row[6]
-
-        if table_name not in columns:
-            columns[table_name] = {}
-
-        columns[table_name][column_name] = {
-            "name": column_name,
-            "type": data_type,
-            "nullable": is_nullable == "YES",
-            "max_length": char_max_length,
-            "precision": numeric_precision,
-            "scale": numeric_scale
-        }
-
-    cursor.close()
     return columns
 
 
@@ -146,58 +161,103 @@ def discover_relationships(connector, tables, columns):
     Returns:
         Dictionary of relationships
     """
-    conn = connector.connect()
+    conn = connector.acquire()
     cursor = conn.cursor()
 
-    # Query for foreign key relationships
-    query = f"""
-    SELECT 
-        rc.CONSTRAINT_NAME,
-        rc.TABLE_NAME as source_table,
-        kcu.COLUMN_NAME as source_column,
-        kcu.REFERENCED_TABLE_NAME as target_table,
-        kcu.REFERENCED_COLUMN_NAME as target_column
-    FROM 
-        INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
-    JOIN 
-        INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-        ON rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-        AND rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
-    WHERE 
-        rc.CONSTRAINT_SCHEMA = '{connector.schema}'
-        AND rc.TABLE_NAME IN ('{("', '".join(tables.keys()))}')
+    try:
+        # Query for foreign key relationships
+        query = f"""
+        SELECT 
+            rc.CONSTRAINT_NAME,
+            rc.TABLE_NAME as source_table,
+            kcu.COLUMN_NAME as source_column,
+            kcu.REFERENCED_TABLE_NAME as target_table,
+            kcu.REFERENCED_COLUMN_NAME as target_column
+        FROM 
+            INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+        JOIN 
+            INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+            ON rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+            AND rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
+        WHERE 
+            rc.CONSTRAINT_SCHEMA = '{connector.schema}'
+            AND rc.TABLE_NAME IN ('{("', '".join(tables.keys()))}')
+        """
+
+        relationships = {}
+        try:
+            cursor.execute(query)
+
+            for row in cursor.fetchall():
+                constraint_name = row[0]
+                source_table = row[1]
+                source_column = row[2]
+                target_table = row[3]
+                target_column = row[4]
+
+                relationships[constraint_name] = {
+                    "name": constraint_name,
+                    "source_table": source_table,
+                    "source_column": source_column,
+                    "target_table": target_table,
+                    "target_column": target_column,
+                    "type": "FOREIGN_KEY"
+                }
+        except Exception as e:
+            # Some Snowflake editions might not support referential constraints
+            # In that case, we'll infer relationships from naming conventions
+            pass
+
+        # If no relationships found through FK constraints, try to infer them
+        if not relationships:
+            relationships = _infer_relationships(tables, columns)
+    finally:
+        cursor.close()
+        connector.release(conn)
+
+    return relationships
+
+
+def read_last_altered(connector, table_names):
+    """Read the LAST_ALTERED timestamp of tables.
+
+    Args:
+        connector: Snowflake connector instance
+        table_names: Names of the tables to look up
+
+    Returns:
+        Dictionary mapping table names to their LAST_ALTERED value
     """
+    if not table_names:
+        return {}
+
+    conn = connector.acquire()
+    cursor = conn.cursor()
 
-    relationships = {}
     try:
-        cursor.execute(query)
+        tables_list = "', '".join(name.upper() for name in table_names)
+        query = f"""
+        SELECT 
+            TABLE_NAME,
+            LAST_ALTERED
+        FROM 
+            INFORMATION_SCHEMA.TABLES
+        WHERE 
+            TABLE_SCHEMA = '{connector.schema}'
+            AND TABLE_NAME IN ('{tables_list}')
+        """
 
-        for row in cursor.fetchall():
-            constraint_name = row[0]
-            source_table = row[1]
-            source_column = row[2]
-            target_table = row[3]
-            target_column = row[4]
-
-            relationships[constraint_name] = {
-                "name": constraint_name,
-                "source_table": source_table,
-                "source_column": source_column,
-                "target_table": target_table,
-                "target_column": target_column,
-                "type": "FOREIGN_KEY"
-            }
-    except Exception as e:
-        # Some Snowflake editions might not support referential constraints
-        # In that case, we'll infer relationships from naming conventions
-        pass
+        cursor.execute(query)
 
-    # If no relationships found through FK constraints, try to infer them
-    if not relationships:
-        relationships = _infer_relationships(tables, columns)
+        by_upper_name = {row[0].upper(): row[1] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+        connector.release(conn)
 
-    cursor.close()
-    return relationships
+    return {
+        name: by_upper_name.get(name.upper())
+        for name in table_names
+    }
 
 
 def _infer_relationships(tables, columns):
@@ -4,6 +4,8 @@ from typing import Dict, List, Any, Optional
 
 from .analyzers.field_analyzer import analyze_fields
 from .analyzers.join_analyzer import analyze_joins
+from .analyzers.sargable_rewriter import check_clustering_usage, rewrite_sargable
+from .analyzers.where_simplifier import simplify_where
 
 
 class QueryAnalyzer:
@@ -16,7 +18,8 @@ class QueryAnalyzer:
     def analyze(self, select_fields, from_table=None, from_subquery=None,
                 joins=None, where_conditions=None, where_groups=None,
                 group_by=None, order_by=None, limit=None, offset=None,
-                with_ctes=None, hints=None):
+                with_ctes=None, hints=None, simplify=True, sargable=True,
+                seek=None):
 
         """Analyze and validate query components."""
         # Either from_table or from_subquery must be provided
@@ -54,6 +57,24 @@ class QueryAnalyzer:
             where_groups or []
         )
 
+        # Unwrap date functions so the raw column can be pruned on
+        if sargable:
+            analyzed_where, analyzed_where_groups = rewrite_sargable(
+                analyzed_where, analyzed_where_groups
+            )
+            check_clustering_usage(
+                from_info, analyzed_where, analyzed_where_groups,
+                self.schema_registry
+            )
+
+        # Deduplicate, merge and fold the filters before generation
+        always_false = False
+        if simplify:
+            simplified = simplify_where(analyzed_where, analyzed_where_groups)
+            analyzed_where = simplified["where_conditions"]
+            analyzed_where_groups = simplified["where_groups"]
+            always_false = simplified["always_false"]
+
         # Return analyzed query components
         return {
             "select_fields": field_analysis["field_info"],
@@ -62,12 +83,17 @@ class QueryAnalyzer:
             "joins": join_analysis["resolved_joins"],
             "where_conditions": analyzed_where,
             "where_groups": analyzed_where_groups,
+            "always_false": always_false,
             "group_by": self._analyze_group_by(group_by or []),
             "order_by": self._analyze_order_by(order_by or []),
             "limit": limit,
             "offset": offset,
+            "seek": seek,
             "with_ctes": with_ctes or [],  # Add this line
-            "hints": hints or []  # Add this line
+            "hints": hints or [],  # Add this line
+            "referenced_tables": self._referenced_tables(
+                from_info, join_analysis["resolved_joins"]
+            )
 
 
         }
@@ -96,6 +122,28 @@ class QueryAnalyzer:
             # Already a dictionary or a subquery object
             return from_table
 
+    def _referenced_tables(self, from_info, joins):
+        """Collect the names of the tables a query reads directly.
+
+        Args:
+            from_info: Processed FROM table, or None for a subquery
+            joins: Resolved join dictionaries
+
+        Returns:
+            Sorted list of table names
+        """
+        tables = set()
+        if isinstance(from_info, dict) and from_info.get("table"):
+            tables.add(from_info["table"])
+
+        for join in joins:
+            table = join.get("table")
+            # Joined subqueries report their own tables when built
+            if isinstance(table, str):
+                tables.add(table)
+
+        return sorted(tables)
+
     def _analyze_where_conditions(self, where_conditions):
         """Analyze and validate WHERE conditions.
 
@@ -0,0 +1,365 @@
+# pyquerybuilder/query/analyzers/sargable_rewriter.py
+"""Rewriter turning date-function predicates into prunable column ranges."""
+import re
+import warnings
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ..where_group import WhereGroup
+
+# Precisions DATE_TRUNC can be inverted for (WEEK depends on WEEK_START)
+TRUNC_PRECISIONS = ("YEAR", "QUARTER", "MONTH", "DAY", "HOUR", "MINUTE", "SECOND")
+
+# Tables with at least this many rows are considered large for pruning
+LARGE_TABLE_ROWS = 100_000_000
+
+
+class PruningWarning(UserWarning):
+    """Warning for queries that cannot benefit from partition pruning."""
+
+
+def rewrite_sargable(conditions, where_groups=None):
+    """Rewrite DATE_TRUNC/DATE_PART predicates as ranges on the raw column.
+
+    ``DATE_TRUNC('day', col) = d`` becomes ``col >= d AND col < d + 1 day``
+    and ``DATE_PART('year', col) = 2024`` becomes a one-year half-open range,
+    so Snowflake can prune micro-partitions on the column itself.
+
+    Args:
+        conditions: List of basic condition dictionaries
+        where_groups: List of WhereGroup instances
+
+    Returns:
+        Tuple of (rewritten conditions, rewritten WHERE groups)
+    """
+    rewritten_conditions = []
+    for condition in conditions:
+        rewritten_conditions.extend(_rewrite_item(condition, "logic", "AND"))
+
+    rewritten_groups = [_rewrite_group(group) for group in where_groups or []]
+
+    return rewritten_conditions, rewritten_groups
+
+
+def _rewrite_group(group):
+    """Rewrite the conditions of a WhereGroup recursively.
+
+    Args:
+        group: WhereGroup instance
+
+    Returns:
+        New WhereGroup with rewritten conditions
+    """
+    rewritten = WhereGroup()
+    rewritten.conjunction = group.conjunction
+    if getattr(group, "_is_or", False):
+        rewritten._is_or = True
+
+    for item in group.conditions:
+        item_type = item.get("type", "condition")
+        if item_type in ("and_group", "or_group"):
+            rewritten.conditions.append({
+                "group": _rewrite_group(item["group"]),
+                "type": item_type
+            })
+        else:
+            rewritten.conditions.extend(_rewrite_item(item, "type", "condition"))
+
+    return rewritten
+
+
+def _rewrite_item(condition, connector_key, and_connector):
+    """Rewrite a single condition into one or more range conditions.
+
+    The first replacement keeps the original connector and the rest are
+    AND-ed to it, which keeps them in the same AND run as the original.
+
+    Args:
+        condition: Condition dictionary
+        connector_key: Key holding the connector ("logic" or "type")
+        and_connector: Connector value meaning AND for that key
+
+    Returns:
+        List of condition dictionaries
+    """
+    bounds = _column_bounds(condition)
+    if bounds is None:
+        return [condition]
+
+    column, lower, upper = bounds
+    replacements = []
+    if lower is not None:
+        replacements.append({"field": column, "operator": ">=", "value": lower})
+    if upper is not None:
+        replacements.append({"field": column, "operator": "<", "value": upper})
+
+    for idx, replacement in enumerate(replacements):
+        if idx == 0:
+            if connector_key in condition:
+                replacement[connector_key] = condition[connector_key]
+        else:
+            replacement[connector_key] = and_connector
+
+    return replacements
+
+
+def _column_bounds(condition):
+    """Compute the half-open column range equivalent to a condition.
+
+    Args:
+        condition: Condition dictionary
+
+    Returns:
+        Tuple of (column, lower bound, upper bound) or None if the
+        condition cannot be rewritten
+    """
+    field = condition["field"]
+    operator = condition["operator"].upper()
+    value = condition.get("value")
+
+    name = getattr(field, "name", None)
+    if name not in ("DATE_TRUNC", "DATE_PART") or getattr(field, "alias", None):
+        return None
+    if len(field.args) != 2 or hasattr(field.args[1], "get_sql"):
+        return None
+
+    part = str(field.args[0]).strip("'\"").upper()
+    column = field.args[1]
+
+    if operator == "BETWEEN":
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            return None
+        low = _bounds_for(name, part, ">=", value[0])
+        high = _bounds_for(name, part, "<=", value[1])
+        if low is None or high is None:
+            return None
+        return column, low[0], high[1]
+
+    bounds = _bounds_for(name, part, operator, value)
+    if bounds is None:
+        return None
+    return column, bounds[0], bounds[1]
+
+
+def _bounds_for(name, part, operator, value):
+    """Compute bounds for one comparison against a date function.
+
+    Args:
+        name: Function name (DATE_TRUNC or DATE_PART)
+        part: Upper-cased date part or precision
+        operator: Upper-cased comparison operator
+        value: Literal compared against
+
+    Returns:
+        Tuple of (lower, upper) with None for an open side, or None
+    """
+    if operator not in ("=", ">", ">=", "<", "<="):
+        return None
+
+    if name == "DATE_PART":
+        # Only YEAR maps to a contiguous range of the column
+        if part != "YEAR" or isinstance(value, bool) or not isinstance(value, int):
+            return None
+        start = date(value, 1, 1)
+        following = date(value + 1, 1, 1)
+    else:
+        if part not in TRUNC_PRECISIONS:
+            return None
+        parsed = _parse_temporal(value)
+        if parsed is None:
+            return None
+        start = _truncate(parsed, part)
+        following = _next(start, part)
+        if start != parsed:
+            # trunc(col) can never equal an unaligned value; every other
+            # comparison splits at the first boundary after it, so
+            # > and >= become col >= boundary, < and <= col < boundary
+            if operator == "=":
+                return None
+            boundary = _like(value, following)
+            if operator in (">", ">="):
+                return boundary, None
+            return None, boundary
+        start = _like(value, start)
+        following = _like(value, following)
+
+    if operator == "=":
+        return start, following
+    if operator == ">=":
+        return start, None
+    if operator == ">":
+        return following, None
+    if operator == "<":
+        return None, start
+    return None, following
+
+
+def _parse_temporal(value):
+    """Parse a date/datetime literal.
+
+    Args:
+        value: date, datetime or ISO-8601 string
+
+    Returns:
+        datetime instance or None if the value is not temporal
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _like(original, moment):
+    """Convert a computed datetime back to the type of the original literal."""
+    if isinstance(original, datetime):
+        return moment
+    if isinstance(original, date):
+        if moment.time() == datetime.min.time():
+            return moment.date()
+        return moment
+    if moment.time() == datetime.min.time() and len(original) <= 10:
+        return moment.date().isoformat()
+    return moment.isoformat(sep=" ")
+
+
+def _truncate(moment, part):
+    """Truncate a datetime to the given precision."""
+    if part == "YEAR":
+        return datetime(moment.year, 1, 1, tzinfo=moment.tzinfo)
+    if part == "QUARTER":
+        month = 3 * ((moment.month - 1) // 3) + 1
+        return datetime(moment.year, month, 1, tzinfo=moment.tzinfo)
+    if part == "MONTH":
+        return datetime(moment.year, moment.month, 1, tzinfo=moment.tzinfo)
+    if part == "DAY":
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if part == "HOUR":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    if part == "MINUTE":
+        return moment.replace(second=0, microsecond=0)
+    return moment.replace(microsecond=0)
+
+
+def _next(start, part):
+    """Return the start of the period following an aligned datetime."""
+    if part in ("YEAR", "QUARTER", "MONTH"):
+        months = {"YEAR": 12, "QUARTER": 3, "MONTH": 1}[part]
+        month_index = start.month - 1 + months
+        return start.replace(year=start.year + month_index // 12,
+                             month=month_index % 12 + 1)
+    step = {
+        "DAY": timedelta(days=1),
+        "HOUR": timedelta(hours=1),
+        "MINUTE": timedelta(minutes=1),
+        "SECOND": timedelta(seconds=1)
+    }[part]
+    return start + step
+
+
+def check_clustering_usage(from_table, conditions, where_groups, schema_registry,
+                           large_table_rows=LARGE_TABLE_ROWS):
+    """Warn when a large clustered table is filtered on no clustering column.
+
+    Args:
+        from_table: Analyzed FROM table dictionary
+        conditions: List of basic condition dictionaries
+        where_groups: List of WhereGroup instances
+        schema_registry: Schema information registry
+        large_table_rows: Row count above which a table counts as large
+
+    Returns:
+        True if a warning was issued
+    """
+    if not isinstance(from_table, dict) or not from_table.get("table"):
+        return False
+
+    table_info = _find_table(from_table["table"], schema_registry)
+    if not table_info:
+        return False
+
+    clustering_columns = parse_clustering_key(table_info.get("clustering_key"))
+    row_count = table_info.get("row_count") or 0
+    if not clustering_columns or row_count < large_table_rows:
+        return False
+
+    filtered = set()
+    for condition in conditions:
+        _collect_columns(condition["field"], filtered)
+    for group in where_groups or []:
+        _collect_group_columns(group, filtered)
+
+    if filtered & clustering_columns:
+        return False
+
+    warnings.warn(
+        f"Query on {table_info.get('name', from_table['table'])} "
+        f"({row_count} rows) does not filter on any clustering column "
+        f"({', '.join(sorted(clustering_columns))}); "
+        f"micro-partition pruning cannot be used",
+        PruningWarning,
+        stacklevel=3
+    )
+    return True
+
+
+def parse_clustering_key(clustering_key):
+    """Extract column names from a Snowflake CLUSTERING_KEY expression.
+
+    Args:
+        clustering_key: Value such as "LINEAR(created_at, TO_DATE(ts))"
+
+    Returns:
+        Set of upper-cased column names
+    """
+    if not clustering_key:
+        return set()
+
+    body = clustering_key.strip()
+    match = re.match(r"^LINEAR\s*\((.*)\)$", body, re.IGNORECASE | re.DOTALL)
+    if match:
+        body = match.group(1)
+
+    # Identifiers not followed by "(" are columns, the others are functions
+    columns = set()
+    for token in re.finditer(r'"([^"]+)"|([A-Za-z_][A-Za-z0-9_$.]*)\s*(\()?', body):
+        quoted, name, call = token.groups()
+        if quoted:
+            columns.add(quoted.upper())
+        elif name and not call and not name[0].isdigit():
+            columns.add(name.split(".")[-1].upper())
+    return columns
+
+
+def _find_table(table_name, schema_registry):
+    """Look up table metadata case-insensitively."""
+    tables = getattr(schema_registry, "tables", {})
+    if table_name in tables:
+        return tables[table_name]
+    for name, info in tables.items():
+        if name.lower() == str(table_name).lower():
+            return info
+    return None
+
+
+def _collect_columns(field, columns):
+    """Collect upper-cased column names referenced by a field or function."""
+    if hasattr(field, "get_sql"):
+        for arg in getattr(field, "args", ()):
+            _collect_columns(arg, columns)
+    elif isinstance(field, str) and not field.startswith("'"):
+        columns.add(field.split(".")[-1].strip().strip('"').upper())
+
+
+def _collect_group_columns(group, columns):
+    """Collect column names referenced anywhere in a WhereGroup."""
+    for item in group.conditions:
+        if "group" in item:
+            _collect_group_columns(item["group"], columns)
+        else:
+            _collect_columns(item["field"], columns)
@@ -0,0 +1,526 @@
+# pyquerybuilder/query/analyzers/where_simplifier.py
+"""Boolean simplification pass for WHERE conditions and groups."""
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..where_group import WhereGroup
+
+# Operators whose literal values can be merged into a single range
+RANGE_OPERATORS = ("=", ">", ">=", "<", "<=", "BETWEEN", "IN")
+
+
+class _Node:
+    """Boolean AND/OR node of the condition tree."""
+
+    def __init__(self, logic: str, children: List[Any]):
+        """Initialize the node.
+
+        Args:
+            logic: "AND" or "OR"
+            children: Child nodes or condition dictionaries
+        """
+        self.logic = logic
+        self.children = children
+
+
+# Sentinel for a predicate that can never be satisfied
+FALSE = object()
+
+
+def simplify_where(conditions, where_groups=None):
+    """Simplify WHERE conditions and groups before SQL generation.
+
+    Duplicate predicates are removed, ranges on the same column are merged
+    (into a single BETWEEN where possible), ORs of equalities on one column
+    are folded into IN, redundant nesting is flattened and contradictions
+    are detected.
+
+    Args:
+        conditions: List of basic condition dictionaries
+        where_groups: List of WhereGroup instances
+
+    Returns:
+        Dictionary with simplified "where_conditions", "where_groups"
+        and an "always_false" flag
+    """
+    tree = _parse_top_level(conditions or [], where_groups or [])
+    if tree is None:
+        return {
+            "where_conditions": [],
+            "where_groups": [],
+            "always_false": False
+        }
+
+    tree = _simplify(tree)
+    if tree is FALSE:
+        return {
+            "where_conditions": [],
+            "where_groups": [],
+            "always_false": True
+        }
+
+    simplified_conditions, simplified_groups = _render_top_level(tree)
+    return {
+        "where_conditions": simplified_conditions,
+        "where_groups": simplified_groups,
+        "always_false": False
+    }
+
+
+def _parse_top_level(conditions, where_groups):
+    """Parse top-level conditions and groups into a condition tree.
+
+    Args:
+        conditions: List of basic condition dictionaries
+        where_groups: List of WhereGroup instances
+
+    Returns:
+        Root node, or None if there is nothing to filter on
+    """
+    items = []
+    for condition in conditions:
+        connector = "OR" if condition.get("logic", "AND").upper() == "OR" else "AND"
+        items.append((connector, _strip_condition(condition)))
+
+    for group in where_groups:
+        connector = "OR" if getattr(group, "_is_or", False) else "AND"
+        node = _parse_group(group)
+        if node is not None:
+            items.append((connector, node))
+
+    return _combine(items)
+
+
+def _parse_group(group):
+    """Parse a WhereGroup recursively into a condition tree.
+
+    Args:
+        group: WhereGroup instance
+
+    Returns:
+        Node for the group, or None if the group is empty
+    """
+    items = []
+    for item in group.conditions:
+        item_type = item.get("type", "condition")
+
+        if item_type in ("condition", "or_condition"):
+            connector = "OR" if item_type == "or_condition" else "AND"
+            items.append((connector, _strip_condition(item)))
+        elif item_type in ("and_group", "or_group"):
+            connector = "OR" if item_type == "or_group" else "AND"
+            node = _parse_group(item["group"])
+            if node is not None:
+                items.append((connector, node))
+
+    return _combine(items)
+
+
+def _combine(items):
+    """Combine a connector sequence using SQL precedence (AND before OR).
+
+    Args:
+        items: List of (connector, node) tuples; the first connector is ignored
+
+    Returns:
+        Combined node, or None for an empty sequence
+    """
+    if not items:
+        return None
+
+    or_terms = []
+    current = []
+    for idx, (connector, node) in enumerate(items):
+        if idx > 0 and connector == "OR":
+            or_terms.append(current)
+            current = []
+        current.append(node)
+    or_terms.append(current)
+
+    terms = [_Node("AND", term) if len(term) > 1 else term[0] for term in or_terms]
+    return _Node("OR", terms) if len(terms) > 1 else terms[0]
+
+
+def _strip_condition(condition):
+    """Copy a condition without its connector keys.
+
+    Args:
+        condition: Condition dictionary
+
+    Returns:
+        Condition dictionary with field, operator and value
+    """
+    return {
+        "field": condition["field"],
+        "operator": condition["operator"],
+        "value": condition.get("value")
+    }
+
+
+def _simplify(node):
+    """Simplify a node of the condition tree.
+
+    Args:
+        node: Node or condition dictionary
+
+    Returns:
+        Simplified node, condition dictionary or FALSE
+    """
+    if not isinstance(node, _Node):
+        return node
+
+    children = []
+    for child in node.children:
+        child = _simplify(child)
+        # Flatten nested nodes using the same logic
+        if isinstance(child, _Node) and child.logic == node.logic:
+            children.extend(child.children)
+        else:
+            children.append(child)
+
+    if node.logic == "AND":
+        if any(child is FALSE for child in children):
+            return FALSE
+        children = _merge_ranges(_dedupe(children))
+        if children is FALSE:
+            return FALSE
+    else:
+        children = [child for child in children if child is not FALSE]
+        if not children:
+            return FALSE
+        children = _fold_equalities(_dedupe(children))
+
+    if len(children) == 1:
+        return children[0]
+
+    return _Node(node.logic, children)
+
+
+def _dedupe(children):
+    """Remove duplicate predicates while preserving order.
+
+    Args:
+        children: List of nodes or condition dictionaries
+
+    Returns:
+        List without duplicate predicates
+    """
+    seen = set()
+    unique = []
+    for child in children:
+        key = _condition_key(child) if isinstance(child, dict) else None
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(child)
+    return unique
+
+
+def _condition_key(condition):
+    """Build a hashable identity for a condition.
+
+    Args:
+        condition: Condition dictionary
+
+    Returns:
+        Hashable key, or None if the condition cannot be compared
+    """
+    value = condition["value"]
+    if hasattr(value, "get_sql"):
+        value_key = ("sql", value.get_sql())
+    elif isinstance(value, (list, tuple)):
+        value_key = ("seq", tuple(value))
+    elif isinstance(value, set):
+        value_key = ("set", frozenset(value))
+    else:
+        value_key = ("value", value)
+
+    key = (_field_sql(condition["field"]), condition["operator"].upper(), value_key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _field_sql(field):
+    """Render a field reference for comparison purposes."""
+    return field.get_sql() if hasattr(field, "get_sql") else str(field)
+
+
+def _is_literal(value):
+    """Check whether a value is a plain literal (not SQL, not NULL)."""
+    return value is not None and not hasattr(value, "get_sql")
+
+
+def _is_mergeable(condition):
+    """Check whether a condition takes part in range merging.
+
+    Args:
+        condition: Condition dictionary
+
+    Returns:
+        True if the operator and value can be merged
+    """
+    operator = condition["operator"].upper()
+    value = condition["value"]
+
+    if operator not in RANGE_OPERATORS:
+        return False
+    if operator == "BETWEEN":
+        return (isinstance(value, (list, tuple)) and len(value) == 2
+                and all(_is_literal(v) for v in value))
+    if operator == "IN":
+        return (isinstance(value, (list, tuple, set))
+                and all(_is_literal(v) for v in value))
+    return _is_literal(value)
+
+
+def _merge_ranges(children):
+    """Merge AND-ed range predicates on the same field.
+
+    Args:
+        children: List of AND-ed nodes or condition dictionaries
+
+    Returns:
+        Merged list of children, or FALSE if the ranges contradict
+    """
+    by_field = {}
+    for child in children:
+        if isinstance(child, dict) and _is_mergeable(child):
+            by_field.setdefault(_field_sql(child["field"]), []).append(child)
+
+    replacements = {}
+    for field_sql, predicates in by_field.items():
+        if len(predicates) < 2:
+            continue
+
+        try:
+            merged = _intersect(predicates)
+        except TypeError:
+            # Values are not mutually comparable; leave them alone
+            continue
+
+        if merged is FALSE:
+            return FALSE
+        replacements[field_sql] = (predicates, merged)
+
+    if not replacements:
+        return children
+
+    result = []
+    emitted = set()
+    for child in children:
+        field_sql = _field_sql(child["field"]) if isinstance(child, dict) else None
+        if field_sql in replacements and any(child is p for p in replacements[field_sql][0]):
+            if field_sql not in emitted:
+                result.extend(replacements[field_sql][1])
+                emitted.add(field_sql)
+            continue
+        result.append(child)
+    return result
+
+
+def _intersect(predicates):
+    """Intersect range and equality predicates on one field.
+
+    Args:
+        predicates: Mergeable condition dictionaries on the same field
+
+    Returns:
+        List of replacement conditions, or FALSE if the result is empty
+    """
+    field = predicates[0]["field"]
+    lower = None
+    upper = None
+    candidates = None
+
+    for predicate in predicates:
+        operator = predicate["operator"].upper()
+        value = predicate["value"]
+
+        if operator == "=":
+            candidates = _intersect_values(candidates, [value])
+        elif operator == "IN":
+            candidates = _intersect_values(candidates, list(value))
+        elif operator == "BETWEEN":
+            lower = _tighter_lower(lower, (value[0], True))
+            upper = _tighter_upper(upper, (value[1], True))
+        elif operator in (">", ">="):
+            lower = _tighter_lower(lower, (value, operator == ">="))
+        else:
+            upper = _tighter_upper(upper, (value, operator == "<="))
+
+    if candidates is not None:
+        candidates = [v for v in candidates if _within(v, lower, upper)]
+        if not candidates:
+            return FALSE
+        if len(candidates) == 1:
+            return [{"field": field, "operator": "=", "value": candidates[0]}]
+        return [{"field": field, "operator": "IN", "value": candidates}]
+
+    if lower and upper:
+        if lower[0] > upper[0] or (lower[0] == upper[0]
+                                   and not (lower[1] and upper[1])):
+            return FALSE
+        if lower[0] == upper[0]:
+            return [{"field": field, "operator": "=", "value": lower[0]}]
+        if lower[1] and upper[1]:
+            return [{"field": field, "operator": "BETWEEN",
+                     "value": (lower[0], upper[0])}]
+
+    merged = []
+    if lower:
+        merged.append({"field": field, "operator": ">=" if lower[1] else ">",
+                       "value": lower[0]})
+    if upper:
+        merged.append({"field": field, "operator": "<=" if upper[1] else "<",
+                       "value": upper[0]})
+    return merged
+
+
+def _intersect_values(candidates, values):
+    """Intersect a candidate value list with new values, keeping order."""
+    if candidates is None:
+        return _unique_values(values)
+    try:
+        lookup = set(values)
+    except TypeError:
+        # Unhashable values fall back to list membership
+        lookup = list(values)
+    return [v for v in candidates if v in lookup]
+
+
+def _unique_values(values):
+    """Remove duplicate values while preserving order."""
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:
+        unique = []
+        for value in values:
+            if value not in unique:
+                unique.append(value)
+        return unique
+
+
+def _tighter_lower(current, bound):
+    """Return the more restrictive of two lower bounds."""
+    if current is None or bound[0] > current[0]:
+        return bound
+    if bound[0] == current[0] and not bound[1]:
+        return bound
+    return current
+
+
+def _tighter_upper(current, bound):
+    """Return the more restrictive of two upper bounds."""
+    if current is None or bound[0] < current[0]:
+        return bound
+    if bound[0] == current[0] and not bound[1]:
+        return bound
+    return current
+
+
+def _within(value, lower, upper):
+    """Check whether a value satisfies optional lower and upper bounds."""
+    if lower and (value < lower[0] or (value == lower[0] and not lower[1])):
+        return False
+    if upper and (value > upper[0] or (value == upper[0] and not upper[1])):
+        return False
+    return True
+
+
+def _fold_equalities(children):
+    """Fold OR-ed equality and IN predicates on one field into a single IN.
+
+    Args:
+        children: List of OR-ed nodes or condition dictionaries
+
+    Returns:
+        Folded list of children
+    """
+    by_field = {}
+    for child in children:
+        if (isinstance(child, dict)
+                and child["operator"].upper() in ("=", "IN")
+                and _is_mergeable(child)):
+            by_field.setdefault(_field_sql(child["field"]), []).append(child)
+
+    result = []
+    emitted = set()
+    for child in children:
+        field_sql = _field_sql(child["field"]) if isinstance(child, dict) else None
+        predicates = by_field.get(field_sql, [])
+        if len(predicates) < 2 or not any(child is p for p in predicates):
+            result.append(child)
+            continue
+
+        if field_sql in emitted:
+            continue
+        emitted.add(field_sql)
+
+        values = []
+        for predicate in predicates:
+            if predicate["operator"].upper() == "=":
+                values.append(predicate["value"])
+            else:
+                values.extend(predicate["value"])
+
+        result.append({
+            "field": child["field"],
+            "operator": "IN",
+            "value": _unique_values(values)
+        })
+    return result
+
+
+def _render_top_level(tree):
+    """Render a simplified tree back into conditions and WHERE groups.
+
+    Args:
+        tree: Simplified node or condition dictionary
+
+    Returns:
+        Tuple of (conditions list, WhereGroup list)
+    """
+    if isinstance(tree, dict):
+        return [tree], []
+
+    if tree.logic == "OR":
+        return [], [_render_group(tree)]
+
+    conditions = []
+    groups = []
+    for child in tree.children:
+        if isinstance(child, dict):
+            conditions.append(child)
+        else:
+            groups.append(_render_group(child))
+    return conditions, groups
+
+
+def _render_group(node):
+    """Render a node as a WhereGroup.
+
+    Args:
+        node: Simplified node
+
+    Returns:
+        WhereGroup instance
+    """
+    group = WhereGroup()
+    is_or = node.logic == "OR"
+
+    for child in node.children:
+        if isinstance(child, dict):
+            condition = dict(child)
+            condition["type"] = "or_condition" if is_or and group.conditions else "condition"
+            group.conditions.append(condition)
+        else:
+            group.conditions.append({
+                "group": _render_group(child),
+                "type": "or_group" if is_or and group.conditions else "and_group"
+            })
+
+    group.conjunction = node.logic
+    return group
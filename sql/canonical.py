@@ -0,0 +1,246 @@
+# pyquerybuilder/sql/canonical.py
+"""Canonical ordering and formatting of generated SQL.
+
+Snowflake's result cache only reuses results for byte-identical query
+text, so semantically identical queries should be generated identically
+regardless of the order in which the builder methods were called.
+"""
+import re
+from typing import Any, Dict, List, Tuple
+
+from ..query.where_group import WhereGroup
+
+# Tokens normalize_sql leaves alone: string literals, dollar-quoted
+# strings, quoted identifiers and comments keep their text, "::" casts are
+# not placeholders, and placeholders are renamed
+_TOKENS = re.compile(r"""
+    (?P<literal>'(?:[^'\\]|\\.|'')*'|\$\$.*?\$\$|"(?:[^"]|"")*")
+  | (?P<line_comment>(?:--|//)[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<cast>::)
+  | (?<!\w):(?P<placeholder>\w+)
+""", re.S | re.X)
+
+
+def canonicalize_query(analyzed_query: Dict[str, Any]) -> Dict[str, Any]:
+    """Order the commutative parts of an analyzed query deterministically.
+
+    AND-ed predicates and groups are sorted, IN-list values are sorted and
+    deduplicated, and runs of INNER joins that do not refer to each other
+    are sorted.
+
+    Args:
+        analyzed_query: Output of QueryAnalyzer.analyze
+
+    Returns:
+        Copy of the analyzed query in canonical order
+    """
+    canonical = dict(analyzed_query)
+    conditions = [_canonical_condition(c) for c in analyzed_query.get("where_conditions", [])]
+    groups = [_canonical_group(g) for g in analyzed_query.get("where_groups", [])]
+
+    # Reordering is only safe when nothing is OR-ed at the top level
+    if not any(str(c.get("logic", "AND")).upper() == "OR" for c in conditions):
+        conditions.sort(key=_condition_key)
+        if not any(getattr(g, "_is_or", False) for g in groups):
+            groups.sort(key=_group_key)
+
+    canonical["where_conditions"] = conditions
+    canonical["where_groups"] = groups
+    canonical["joins"] = _canonical_joins(analyzed_query.get("joins", []))
+    return canonical
+
+
+def normalize_sql(sql: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Normalize whitespace and case and rename parameters by position.
+
+    Unquoted identifiers are case-insensitive in Snowflake, so everything
+    outside string literals, quoted identifiers, comments and placeholders
+    is upper cased. Parameters are renamed p0, p1, ... in order of
+    appearance; ":name" inside literals and comments and the "::" of casts
+    are left alone.
+
+    Args:
+        sql: Generated SQL
+        params: Parameters dictionary
+
+    Returns:
+        Tuple of (normalized SQL, renamed parameters dict)
+    """
+    renamed = {}
+    names = {}
+
+    def rename(name):
+        if name not in params:
+            return f":{name}"
+        if name not in names:
+            names[name] = f"p{len(names)}"
+            renamed[names[name]] = params[name]
+        return f":{names[name]}"
+
+    normalized = []
+    position = 0
+    after_line_comment = False
+    for match in _TOKENS.finditer(sql):
+        normalized.append(_normalize_text(sql[position:match.start()], after_line_comment))
+        after_line_comment = False
+        if match.group("placeholder") is not None:
+            normalized.append(rename(match.group("placeholder")))
+        elif match.group("line_comment") is not None:
+            # The comment runs to the end of the line, so the line must end
+            normalized.append(match.group(0).rstrip() + "\n")
+            after_line_comment = True
+        else:
+            normalized.append(match.group(0))
+        position = match.end()
+    normalized.append(_normalize_text(sql[position:], after_line_comment))
+    return "".join(normalized).strip(), renamed
+
+
+def collapse_whitespace(sql: str) -> str:
+    """Collapse runs of whitespace outside literals, identifiers and comments.
+
+    Whitespace inside string literals, quoted identifiers and comments is
+    part of the query's meaning and is kept; a line comment keeps the
+    newline that ends it.
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        SQL with whitespace collapsed to single spaces
+    """
+    collapsed = []
+    position = 0
+    after_line_comment = False
+    for match in _TOKENS.finditer(sql):
+        text = re.sub(r"\s+", " ", sql[position:match.start()])
+        collapsed.append(text.lstrip() if after_line_comment else text)
+        after_line_comment = match.group("line_comment") is not None
+        collapsed.append(match.group(0).rstrip() + "\n" if after_line_comment
+                         else match.group(0))
+        position = match.end()
+    text = re.sub(r"\s+", " ", sql[position:])
+    collapsed.append(text.lstrip() if after_line_comment else text)
+    return "".join(collapsed).strip()
+
+
+def _normalize_text(part: str, after_line_comment: bool = False) -> str:
+    """Collapse whitespace and upper-case SQL text between preserved tokens."""
+    if not part:
+        return part
+    text = " ".join(part.split()).upper()
+    if part[0].isspace() and not after_line_comment:
+        text = " " + text
+    if part[-1].isspace() and text.strip():
+        text += " "
+    # Tidy spacing around parentheses and commas
+    text = re.sub(r"\(\s+", "(", text)
+    text = re.sub(r"\s+\)", ")", text)
+    return re.sub(r"\s*,\s*", ", ", text)
+
+
+def _canonical_condition(condition: Dict[str, Any]) -> Dict[str, Any]:
+    """Sort and deduplicate the values of an IN list."""
+    value = condition.get("value")
+    if str(condition.get("operator", "")).upper() in ("IN", "NOT IN") \
+            and isinstance(value, (list, tuple, set)):
+        condition = dict(condition)
+        condition["value"] = _sorted_values(value)
+    return condition
+
+
+def _canonical_group(group):
+    """Copy a WhereGroup with AND-only items in canonical order."""
+    if not isinstance(group, WhereGroup):
+        return group
+
+    items = []
+    for item in group.conditions:
+        if "group" in item:
+            item = dict(item, group=_canonical_group(item["group"]))
+        else:
+            item = _canonical_condition(item)
+        items.append(item)
+
+    if all(item.get("type") in ("condition", "and_group") for item in items[1:]):
+        # The first item's connector is never rendered, so it may be "or_*"
+        items = [
+            dict(item, type="and_group" if "group" in item else "condition")
+            for item in items
+        ]
+        items.sort(key=lambda i: _group_key(i["group"]) if "group" in i else _condition_key(i))
+
+    canonical = WhereGroup()
+    canonical.conditions = items
+    canonical.conjunction = group.conjunction
+    if getattr(group, "_is_or", False):
+        canonical._is_or = True
+    return canonical
+
+
+def _canonical_joins(joins: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort runs of INNER joins whose conditions do not refer to each other."""
+    result = []
+    run = []
+
+    def flush():
+        names = {_join_name(j) for j in run}
+        independent = all(
+            not any(re.search(rf"\b{re.escape(name)}\.", str(j["condition"]))
+                    for name in names - {_join_name(j)})
+            for j in run
+        )
+        result.extend(sorted(run, key=_join_key) if independent else run)
+        run.clear()
+
+    for join in joins:
+        if str(join.get("type", "INNER")).upper() == "INNER" \
+                and not hasattr(join["table"], "get_sql"):
+            run.append(join)
+        else:
+            flush()
+            result.append(join)
+    flush()
+    return result
+
+
+def _sorted_values(values) -> List[Any]:
+    """Sort values of possibly mixed types and drop duplicates."""
+    try:
+        unique = list(dict.fromkeys(values))
+    except TypeError:
+        # Unhashable values, e.g. lists compared with ARRAY columns
+        unique = []
+        for value in values:
+            if value not in unique:
+                unique.append(value)
+    return sorted(unique, key=lambda v: (type(v).__name__, repr(v)))
+
+
+def _condition_key(condition: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Sort key of a condition."""
+    field = condition.get("field")
+    field_sql = field.get_sql() if hasattr(field, "get_sql") else str(field)
+    value = condition.get("value")
+    value_key = value.get_sql() if hasattr(value, "get_sql") else repr(value)
+    return field_sql.upper(), str(condition.get("operator", "")).upper(), value_key
+
+
+def _group_key(group) -> str:
+    """Sort key of a WHERE group: its conditions' keys."""
+    return repr([
+        _group_key(item["group"]) if "group" in item else _condition_key(item)
+        for item in getattr(group, "conditions", [])
+    ])
+
+
+def _join_name(join: Dict[str, Any]) -> str:
+    """Name a join's table is referred to by."""
+    return str(join.get("alias") or join["table"])
+
+
+def _join_key(join: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Sort key of a join."""
+    return str(join["table"]).upper(), str(join.get("alias") or "").upper(), \
+        str(join["condition"]).upper()
@@ -0,0 +1,57 @@
+# pyquerybuilder/sql/fingerprint.py
+"""Fingerprints identifying the shape of generated SQL."""
+import hashlib
+import re
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"(?<!:):\w+")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_TEMP_TABLE = re.compile(r"\bIN_LIST_[0-9A-F_]+\b", re.IGNORECASE)
+# IN lists externalized to a FLATTENed JSON array or a temporary table
+_EXTERNAL_IN_LIST = re.compile(
+    r"\(\s*SELECT\s+f\.value(?:\s*::\s*\w+(?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?)?"
+    r"\s+FROM\s+TABLE\s*\(\s*FLATTEN\s*\(\s*INPUT\s*=>\s*PARSE_JSON\s*\(\s*:\w+\s*\)"
+    r"\s*\)\s*\)\s*f\s*\)"
+    r"|\(\s*SELECT\s+value\s+FROM\s+IN_LIST_[0-9A-F_]+\s*\)",
+    re.IGNORECASE
+)
+
+
+def query_shape(sql: str) -> str:
+    """Strip literals and parameters from SQL, keeping its shape.
+
+    Placeholders, string and numeric literals become ``?``, value lists
+    of any length collapse to ``(?+)``, as do IN lists bound as a JSON
+    array or loaded into a temporary table, so an IN list has one shape
+    whatever its length. Whitespace and case are normalized.
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        Normalized SQL shape
+    """
+    shape = _EXTERNAL_IN_LIST.sub("(?+)", sql)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?+)", shape)
+    shape = _TEMP_TABLE.sub("IN_LIST", shape)
+    return " ".join(shape.split()).upper()
+
+
+def fingerprint(sql: str) -> str:
+    """Compute a stable fingerprint of a query's shape.
+
+    Queries differing only in literal or parameter values, or in the
+    length of their IN lists and so how those are bound, share a
+    fingerprint.
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        16 hex digit fingerprint
+    """
+    return hashlib.sha1(query_shape(sql).encode("utf-8")).hexdigest()[:16]
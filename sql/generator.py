@@ -4,24 +4,51 @@ from .generators.hint_generator import generate_hints
 from .generators.select_generator import generate_select
 from .generators.from_generator import generate_from
 from .generators.join_generator import generate_joins
-from .generators.where_generator import generate_where
+from .generators.where_generator import generate_seek, generate_where
 from .generators.group_generator import generate_group_by
 from .generators.order_generator import generate_order_by
+from .generators.limit_generator import generate_limit
 from .generators.with_generator import generate_with
+from .canonical import canonicalize_query, normalize_sql
+from .fingerprint import fingerprint, query_shape
 
 
 
 class SQLGenerator:
     """Generates SQL queries from analyzed components."""
 
-    def __init__(self, dialect="snowflake"):
-        """Initialize with SQL dialect."""
+    def __init__(self, dialect="snowflake", in_list_array_threshold=None,
+                 in_list_temp_table_threshold=None, canonical=False):
+        """Initialize with SQL dialect.
+
+        Args:
+            dialect: SQL dialect
+            in_list_array_threshold: IN-list length from which values are
+                bound as one array; defaults to the where generator's
+                IN_LIST_ARRAY_THRESHOLD
+            in_list_temp_table_threshold: IN-list length from which values
+                are loaded into a temporary table; defaults to
+                IN_LIST_TEMP_TABLE_THRESHOLD
+            canonical: Generate canonical SQL text, so semantically
+                identical queries hit Snowflake's result cache regardless
+                of the order the builder methods were called in
+        """
         self.dialect = dialect
+        self.canonical = canonical
+        self.in_list_array_threshold = in_list_array_threshold
+        self.in_list_temp_table_threshold = in_list_temp_table_threshold
+        # Shape and fingerprint of the last generated query
+        self.shape = None
+        self.fingerprint = None
 
     def generate(self, analyzed_query):
         """Generate SQL from analyzed query components."""
         params = {}
 
+        # Order commutative predicates and joins deterministically
+        if self.canonical:
+            analyzed_query = canonicalize_query(analyzed_query)
+
         # Generate hints if present
         hints_sql = generate_hints(
             analyzed_query.get("hints", [])
@@ -47,11 +74,25 @@ class SQLGenerator:
             analyzed_query.get("joins", [])
         )
 
-        where_clause, where_params = generate_where(
-            analyzed_query.get("where_conditions", []),
-            analyzed_query.get("where_groups", [])  # Added this line
-        )
-        params.update(where_params)
+        # A contradictory filter can never match any row
+        if analyzed_query.get("always_false"):
+            where_clause = "WHERE FALSE"
+        else:
+            where_clause, where_params = generate_where(
+                analyzed_query.get("where_conditions", []),
+                analyzed_query.get("where_groups", []),  # Added this line
+                array_threshold=self.in_list_array_threshold,
+                temp_table_threshold=self.in_list_temp_table_threshold
+            )
+            params.update(where_params)
+
+            # Keyset pagination resumes after the last row of the previous page
+            seek_sql, seek_params = generate_seek(analyzed_query.get("seek"))
+            if seek_sql and where_clause:
+                where_clause = f"WHERE ({where_clause[len('WHERE '):]}) AND ({seek_sql})"
+            elif seek_sql:
+                where_clause = f"WHERE {seek_sql}"
+            params.update(seek_params)
 
         group_clause = generate_group_by(
             analyzed_query.get("group_by", [])
@@ -61,6 +102,11 @@ class SQLGenerator:
             analyzed_query.get("order_by", [])
         )
 
+        limit_clause = generate_limit(
+            analyzed_query.get("limit"),
+            analyzed_query.get("offset")
+        )
+
         # Build final SQL with hints
         if hints_sql and select_clause:
             # Insert hints right after SELECT
@@ -69,12 +115,12 @@ class SQLGenerator:
             sql_parts = [
                 with_clause,  # Add this line
                 select_with_hints,
-                select_clause,
                 from_clause,
                 join_clause,
                 where_clause,
                 group_clause,
-                order_clause
+                order_clause,
+                limit_clause
             ]
 
         else:
@@ -86,11 +132,18 @@ class SQLGenerator:
                 join_clause,
                 where_clause,
                 group_clause,
-                order_clause
+                order_clause,
+                limit_clause
             ]
 
         sql = " ".join(part for part in sql_parts if part)
 
+        if self.canonical:
+            sql, params = normalize_sql(sql, params)
+
+        self.shape = query_shape(sql)
+        self.fingerprint = fingerprint(sql)
+
         return sql, params
 
 # # pyquerybuilder/sql/generator.py
@@ -14,6 +14,8 @@ def generate_hints(hints: List[QueryHint]) -> str:
     Returns:
         SQL string with hints
     """
+    # Session hints are applied to the connection by the executor
+    hints = [hint for hint in hints or [] if not getattr(hint, "session", False)]
     if not hints:
         return ""
 
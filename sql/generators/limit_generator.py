@@ -0,0 +1,26 @@
+# pyquerybuilder/sql/generators/limit_generator.py
+"""Generator for LIMIT/OFFSET clause in SQL queries."""
+from typing import Optional
+
+
+def generate_limit(limit: Optional[int], offset: Optional[int] = None):
+    """Generate a LIMIT clause with an optional OFFSET.
+
+    Args:
+        limit: Maximum number of rows, or None for no limit
+        offset: Number of rows to skip, or None
+
+    Returns:
+        LIMIT/OFFSET clause string
+    """
+    if limit is None and not offset:
+        return ""
+
+    # Snowflake needs a LIMIT before OFFSET; NULL means unlimited
+    limit_sql = "NULL" if limit is None else str(int(limit))
+    clause = f"LIMIT {limit_sql}"
+
+    if offset:
+        clause += f" OFFSET {int(offset)}"
+
+    return clause
@@ -6,16 +6,85 @@ from typing import List, Dict, Any, Tuple
 """Generator for WHERE clause in SQL queries with enhanced support."""
 from typing import List, Dict, Any, Tuple, Union
 
+import datetime
+import hashlib
+import json
+
 from ...query.where_group import WhereGroup
 
+# IN lists shorter than this get one placeholder per value
+IN_LIST_ARRAY_THRESHOLD = 1000
+
+# IN lists at least this long are loaded into a temporary table
+IN_LIST_TEMP_TABLE_THRESHOLD = 50000
+
+
+class InListTable:
+    """Parameter value standing for a temporary table of IN-list values.
+
+    QueryExecutor creates and loads the table on the query's session
+    before executing the query, under the name plus a suffix unique to
+    the execution, and drops it when the cursor is closed.
+    """
+
+    def __init__(self, values):
+        """Initialize with the values of the IN list.
+
+        The table name is derived from the values, so building the same
+        query twice gives the same SQL text and fingerprint; executions
+        rename it to a table of their own (see core.in_list.bind_in_lists).
+
+        Args:
+            values: Values the temporary table holds
+        """
+        self.values = list(values)
+        self.column_type = in_list_column_type(self.values)
+        digest = hashlib.sha256(
+            f"{self.column_type}:{self.values!r}".encode("utf-8")
+        ).hexdigest()
+        self.name = f"IN_LIST_{digest[:16].upper()}"
+
+    def __repr__(self):
+        """Summarize the table instead of printing every value."""
+        return f"InListTable({self.name}, {len(self.values)} values)"
+
+
+def in_list_column_type(values) -> str:
+    """Pick a Snowflake column type able to hold every IN-list value.
 
-def generate_where(conditions, where_groups=None, param_start_idx=0):
+    Args:
+        values: IN-list values
+
+    Returns:
+        Snowflake type name
+    """
+    types = {type(v) for v in values if v is not None}
+    if types <= {bool}:
+        return "BOOLEAN"
+    if types <= {int}:
+        return "NUMBER(38, 0)"
+    if types <= {int, float}:
+        return "FLOAT"
+    if types <= {datetime.datetime}:
+        return "TIMESTAMP_NTZ"
+    if types <= {datetime.date}:
+        return "DATE"
+    return "VARCHAR"
+
+
+def generate_where(conditions, where_groups=None, param_start_idx=0,
+                   array_threshold=None, temp_table_threshold=None):
     """Generate a WHERE clause from conditions and condition groups.
 
     Args:
         conditions: List of basic condition dictionaries
         where_groups: List of WhereGroup instances
         param_start_idx: Starting index for parameters
+        array_threshold: IN-list length from which the values are bound
+            as one JSON array; defaults to IN_LIST_ARRAY_THRESHOLD
+        temp_table_threshold: IN-list length from which the values are
+            loaded into a temporary table; defaults to
+            IN_LIST_TEMP_TABLE_THRESHOLD
 
     Returns:
         Tuple of (WHERE clause, parameters dict)
@@ -23,13 +92,26 @@ def generate_where(conditions, where_groups=None, param_start_idx=0):
     where_parts = []
     params = {}
     param_idx = param_start_idx
+    thresholds = (
+        IN_LIST_ARRAY_THRESHOLD if array_threshold is None else array_threshold,
+        IN_LIST_TEMP_TABLE_THRESHOLD if temp_table_threshold is None
+        else temp_table_threshold
+    )
 
     # Process basic conditions
     for condition in conditions:
         condition_sql, condition_params, param_idx = _process_condition(
-            condition, param_idx
+            condition, param_idx, thresholds
         )
-        where_parts.append(condition_sql)
+        logic = condition.get("logic", "AND").upper()
+
+        # Add with appropriate logic
+        if where_parts and logic == "OR":
+            where_parts.append(f"OR {condition_sql}")
+        elif where_parts:
+            where_parts.append(f"AND {condition_sql}")
+        else:
+            where_parts.append(condition_sql)
         params.update(condition_params)
 
     # Process condition groups
@@ -39,7 +121,7 @@ def generate_where(conditions, where_groups=None, param_start_idx=0):
             group_logic = "OR" if is_or else "AND"
 
             group_sql, group_params, param_idx = _process_where_group(
-                group, param_idx
+                group, param_idx, thresholds
             )
 
             # Add the group with appropriate logic
@@ -52,18 +134,19 @@ def generate_where(conditions, where_groups=None, param_start_idx=0):
 
     # Build the complete WHERE clause
     if where_parts:
-        where_clause = "WHERE " + " AND ".join(where_parts)
+        where_clause = "WHERE " + " ".join(where_parts)
         return where_clause, params
     else:
         return "", {}
 
 
-def _process_condition(condition, param_idx):
+def _process_condition(condition, param_idx, thresholds=None):
     """Process a single condition.
 
     Args:
         condition: Condition dictionary
         param_idx: Current parameter index
+        thresholds: Tuple of (array, temporary table) IN-list thresholds
 
     Returns:
         Tuple of (condition SQL, parameters dict, new param_idx)
@@ -72,6 +155,7 @@ def _process_condition(condition, param_idx):
     operator = condition["operator"]
     value = condition["value"]
     logic = condition.get("logic", "AND")
+    array_threshold, temp_table_threshold = thresholds or _default_thresholds()
 
     # Parameters dictionary
     params = {}
@@ -91,6 +175,12 @@ def _process_condition(condition, param_idx):
         if hasattr(value, 'get_sql'):
             value_sql = value.get_sql()
             condition_sql = f"{field_sql} {operator} {value_sql}"
+        # Bind long lists as a whole instead of one parameter per value
+        elif isinstance(value, (list, tuple, set)) and len(value) >= array_threshold:
+            condition_sql, list_params, param_idx = _externalize_in_list(
+                field_sql, operator, value, param_idx, temp_table_threshold
+            )
+            params.update(list_params)
         # Handle list of values
         elif isinstance(value, (list, tuple, set)):
             placeholders = []
@@ -136,12 +226,49 @@ def _process_condition(condition, param_idx):
     return condition_sql, params, param_idx
 
 
-def _process_where_group(group, param_idx):
+def _externalize_in_list(field_sql, operator, values, param_idx, temp_table_threshold):
+    """Rewrite a long IN list as a semi-join on an array or temporary table.
+
+    Args:
+        field_sql: SQL of the compared field
+        operator: "IN" or "NOT IN"
+        values: IN-list values
+        param_idx: Current parameter index
+        temp_table_threshold: Length from which a temporary table is used
+
+    Returns:
+        Tuple of (condition SQL, parameters dict, new param_idx)
+    """
+    param_name = f"p{param_idx}"
+    param_idx += 1
+
+    if len(values) >= temp_table_threshold:
+        table = InListTable(values)
+        source = f"SELECT value FROM {table.name}"
+        params = {param_name: table}
+    else:
+        # One JSON array parameter, unnested server-side; the VARIANT
+        # elements are cast so they compare like the bound values would
+        column_type = in_list_column_type(values)
+        source = (f"SELECT f.value::{column_type} "
+                  f"FROM TABLE(FLATTEN(INPUT => PARSE_JSON(:{param_name}))) f")
+        params = {param_name: json.dumps(list(values), default=str)}
+
+    return f"{field_sql} {operator} ({source})", params, param_idx
+
+
+def _default_thresholds():
+    """Get the module-level IN-list thresholds."""
+    return IN_LIST_ARRAY_THRESHOLD, IN_LIST_TEMP_TABLE_THRESHOLD
+
+
+def _process_where_group(group, param_idx, thresholds=None):
     """Process a WhereGroup recursively.
 
     Args:
         group: WhereGroup instance
         param_idx: Current parameter index
+        thresholds: Tuple of (array, temporary table) IN-list thresholds
 
     Returns:
         Tuple of (group SQL, parameters dict, new param_idx)
@@ -155,12 +282,14 @@ def _process_where_group(group, param_idx):
         if item_type in ("condition", "or_condition"):
             # Process simple condition
             condition_sql, condition_params, param_idx = _process_condition(
-                item, param_idx
+                item, param_idx, thresholds
             )
 
             # Add with appropriate logic
             if parts and item_type == "or_condition":
                 parts.append(f"OR {condition_sql}")
+            elif parts:
+                parts.append(f"AND {condition_sql}")
             else:
                 parts.append(condition_sql)
 
@@ -169,18 +298,50 @@ def _process_where_group(group, param_idx):
             # Process nested group
             nested_group = item["group"]
             group_sql, group_params, param_idx = _process_where_group(
-                nested_group, param_idx
+                nested_group, param_idx, thresholds
             )
 
             # Add with appropriate logic
             if parts and item_type == "or_group":
                 parts.append(f"OR ({group_sql})")
+            elif parts:
+                parts.append(f"AND ({group_sql})")
             else:
                 parts.append(f"({group_sql})")
 
             params.update(group_params)
 
-    return " AND ".join(parts), params, param_idx
+    return " ".join(parts), params, param_idx
+
+
+def generate_seek(seek):
+    """Generate the keyset pagination predicate resuming after a row.
+
+    Snowflake has no row-value comparison, so ``(a, b) > (:k0, :k1)`` is
+    expanded to ``a > :k0 OR (a = :k0 AND b > :k1)``.
+
+    Args:
+        seek: Dictionary with "columns" (key columns in sort order),
+            "values" (their values in the last row seen) and "descending"
+
+    Returns:
+        Tuple of (predicate SQL, parameters dict)
+    """
+    if not seek:
+        return "", {}
+
+    columns = seek["columns"]
+    comparison = "<" if seek.get("descending") else ">"
+    params = {f"k{i}": value for i, value in enumerate(seek["values"])}
+
+    alternatives = []
+    for i, column in enumerate(columns):
+        terms = [f"{columns[j]} = :k{j}" for j in range(i)]
+        terms.append(f"{column} {comparison} :k{i}")
+        alternative = " AND ".join(terms)
+        alternatives.append(f"({alternative})" if i else alternative)
+
+    return " OR ".join(alternatives), params
 
 # def generate_where(conditions, param_start_idx=0):
 #     """Generate a WHERE clause from conditions."""
@@ -260,4 +421,4 @@ def _process_where_group(group, param_idx):
 #             params[param_name] = value
 #
 #     where_clause = "WHERE " + " AND ".join(where_parts)
-#     return where_clause, params
\ No newline at end of file
+#     return where_clause, params
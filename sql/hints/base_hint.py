@@ -6,6 +6,9 @@ from typing import Any, Optional, Dict
 class QueryHint:
     """Base class for database query hints."""
 
+    # Session hints set session parameters instead of rendering into the SQL
+    session = False
+
     def __init__(self, hint_type: str, value: Any = None):
         """Initialize a query hint.
 
@@ -6,7 +6,12 @@ from .base_hint import QueryHint
 
 
 class SnowflakeQueryTag(QueryHint):
-    """Snowflake QUERY_TAG hint."""
+    """Snowflake QUERY_TAG hint.
+
+    The executor sets it as the session's QUERY_TAG parameter.
+    """
+
+    session = True
 
     def __init__(self, tag: str):
         """Initialize a QUERY_TAG hint.
@@ -26,7 +31,12 @@ class SnowflakeQueryTag(QueryHint):
 
 
 class SnowflakeWarehouse(QueryHint):
-    """Snowflake USE_WAREHOUSE hint."""
+    """Snowflake USE_WAREHOUSE hint.
+
+    The executor runs the query on a session of this warehouse.
+    """
+
+    session = True
 
     def __init__(self, warehouse: str):
         """Initialize a USE_WAREHOUSE hint.
@@ -0,0 +1,12 @@
+# pyquerybuilder/tests/conftest.py
+"""Make the repository importable as the ``pyquerybuilder`` package."""
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "pyquerybuilder" not in sys.modules:
+    package = types.ModuleType("pyquerybuilder")
+    package.__path__ = [ROOT]
+    sys.modules["pyquerybuilder"] = package
@@ -0,0 +1,225 @@
+# pyquerybuilder/tests/fakes.py
+"""In-memory stand-ins for Snowflake connectors used by the tests.
+
+The fake connector records every statement it runs and answers from
+canned results: EXPLAIN USING JSON statements get a canned plan, other
+statements the rows registered for the first matching SQL fragment.
+Asynchronous submission (execute_async) is simulated with a configurable
+server-side latency, and SYSTEM$CANCEL_QUERY calls are recorded.
+"""
+import itertools
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+
+def explain_plan(bytes_assigned: int = 0, partitions_assigned: int = 1,
+                 partitions_total: int = 1) -> str:
+    """Build the JSON text of an EXPLAIN USING JSON plan.
+
+    Args:
+        bytes_assigned: Estimated bytes scanned
+        partitions_assigned: Estimated partitions scanned
+        partitions_total: Partitions of the scanned tables
+
+    Returns:
+        JSON plan text
+    """
+    return json.dumps({"GlobalStats": {
+        "bytesAssigned": bytes_assigned,
+        "partitionsAssigned": partitions_assigned,
+        "partitionsTotal": partitions_total
+    }})
+
+
+class FakeCursor:
+    """DB-API cursor answering from its connection's canned results."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.sfqid = None
+        self.closed = False
+        self._rows = []
+        self._position = 0
+
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        connector = self.connection.connector
+        connector.statements.append((sql, params))
+        self.sfqid = connector.new_query_id()
+
+        cancel = _CANCEL_PATTERN.match(sql)
+        if cancel:
+            connector.cancelled.append(cancel.group(1))
+            self._load(("status",), [("query cancelled",)])
+        elif sql.startswith("EXPLAIN USING JSON"):
+            connector.explains += 1
+            self._load(("plan",), [(connector.plan_for(sql),)])
+        else:
+            self._load(*connector.run(sql, params))
+
+    def executemany(self, sql: str, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        self.connection.connector.statements.append((sql, seq_of_params))
+        self.rowcount = len(seq_of_params)
+        self._load((), [])
+
+    def execute_async(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        connector = self.connection.connector
+        time.sleep(connector.submit_latency)
+        connector.statements.append((sql, params))
+        self.sfqid = connector.new_query_id()
+        connector.submitted[self.sfqid] = (time.monotonic() + connector.latency, sql, params)
+
+    def get_results_from_sfqid(self, query_id: str):
+        _, sql, params = self.connection.connector.submitted[query_id]
+        self._load(*self.connection.connector.run(sql, params))
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int = 1):
+        time.sleep(self.connection.connector.fetch_latency)
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows))
+
+    def close(self):
+        self.closed = True
+
+    def _load(self, columns, rows):
+        self.description = [(name,) for name in columns] if columns else None
+        self._rows = list(rows)
+        self._position = 0
+
+
+_CANCEL_PATTERN = re.compile(r"SELECT SYSTEM\$CANCEL_QUERY\('([^']+)'\)")
+
+
+class FakeConnection:
+    """Connection handing out FakeCursors."""
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def get_query_status_throw_if_error(self, query_id: str) -> str:
+        connector = self.connector
+        connector.status_checks += 1
+        deadline = connector.submitted[query_id][0]
+        if query_id in connector.cancelled or time.monotonic() >= deadline:
+            return "SUCCESS"
+        return "RUNNING"
+
+    @staticmethod
+    def is_still_running(status: str) -> bool:
+        return status == "RUNNING"
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    """Connector with canned plans and results.
+
+    Args:
+        warehouse: Warehouse name reported to the executor
+        plan: Default EXPLAIN plan (see explain_plan)
+        columns: Default result columns
+        rows: Default result rows
+        latency: Seconds an asynchronously submitted query runs
+        submit_latency: Seconds execute_async() blocks
+        fetch_latency: Seconds each fetch blocks
+    """
+
+    def __init__(self, warehouse: str = "XSMALL", plan: Optional[str] = None,
+                 columns: Sequence[str] = ("A", "B"), rows=((1, 2), (3, 4)),
+                 latency: float = 0.0, submit_latency: float = 0.0,
+                 fetch_latency: float = 0.0):
+        self.warehouse = warehouse
+        self.latency = latency
+        self.submit_latency = submit_latency
+        self.fetch_latency = fetch_latency
+        self.statements = []
+        self.explains = 0
+        self.status_checks = 0
+        self.submitted = {}
+        self.cancelled = []
+        self._query_ids = itertools.count()
+        self._query_id_lock = threading.Lock()
+        self._default_plan = plan or explain_plan()
+        self._default_result = (tuple(columns), rows)
+        self._plans = []
+        self._results = []
+        self._connection = FakeConnection(self)
+
+    def add_plan(self, fragment: str, plan: str):
+        """Answer EXPLAINs of statements containing a fragment with a plan."""
+        self._plans.append((fragment, plan))
+
+    def add_result(self, fragment: str, columns: Sequence[str], rows):
+        """Answer statements containing a fragment with rows.
+
+        Args:
+            fragment: SQL fragment to match
+            columns: Result column names, empty for statements without rows
+            rows: Result rows, or a callable(sql, params) returning them
+        """
+        self._results.append((fragment, tuple(columns), rows))
+
+    def plan_for(self, sql: str) -> str:
+        for fragment, plan in self._plans:
+            if fragment in sql:
+                return plan
+        return self._default_plan
+
+    def result_for(self, sql: str):
+        for fragment, columns, rows in self._results:
+            if fragment in sql:
+                return columns, rows
+        return self._default_result
+
+    def run(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """Get the (columns, rows) result of a statement."""
+        columns, rows = self.result_for(sql)
+        if callable(rows):
+            rows = rows(sql, params)
+        return columns, rows
+
+    def new_query_id(self) -> str:
+        """Allocate a query id shaped like a Snowflake UUID."""
+        with self._query_id_lock:
+            return f"01b00000-0000-0000-0000-{next(self._query_ids):012d}"
+
+    def executed(self, prefix: str = ""):
+        """Get the executed statements starting with a prefix."""
+        return [sql for sql, _ in self.statements if sql.startswith(prefix)]
+
+    def connect(self):
+        return self._connection
+
+
+class FakePooledConnector(FakeConnector):
+    """FakeConnector with the acquire()/release() interface of a pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checked_out = 0
+        self.released = []
+
+    def acquire(self):
+        self.checked_out += 1
+        return self._connection
+
+    def release(self, connection, discard=False):
+        self.checked_out -= 1
+        self.released.append((connection, discard))
@@ -0,0 +1,134 @@
+# pyquerybuilder/tests/test_async_executor.py
+"""Tests for the asyncio executor against a latency-simulating fake."""
+import asyncio
+import threading
+import time
+
+from pyquerybuilder.core.async_executor import AsyncQueryExecutor
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.schema.registry import SchemaRegistry
+from pyquerybuilder.sql.generators.where_generator import InListTable
+
+from .fakes import FakeConnector, FakePooledConnector
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _cancel_after(executor, delay, query="SELECT * FROM t"):
+    """Start a query, cancel it after a delay and wait for it to end."""
+    task = asyncio.ensure_future(executor.execute(query))
+    await asyncio.sleep(delay)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        return True
+    return False
+
+
+def test_queries_wait_concurrently():
+    connector = FakeConnector(latency=0.2)
+    executor = AsyncQueryExecutor(connector, poll_interval=0.01)
+
+    async def main():
+        return await asyncio.gather(*[executor.execute("SELECT a, b FROM t") for _ in range(10)])
+
+    started = time.monotonic()
+    results = _run(main())
+
+    assert time.monotonic() - started < 1.0
+    assert results == [[{"A": 1, "B": 2}, {"A": 3, "B": 4}]] * 10
+    assert connector.status_checks > 10
+    assert executor.in_flight == []
+
+
+def test_rows_are_fetched_in_batches():
+    connector = FakeConnector(columns=("N",), rows=[(i,) for i in range(5)])
+    executor = AsyncQueryExecutor(connector, batch_size=2)
+
+    async def main():
+        return [row["N"] async for row in executor.stream("SELECT n FROM t")]
+
+    assert _run(main()) == [0, 1, 2, 3, 4]
+
+
+def test_cancel_while_running_cancels_on_server():
+    connector = FakePooledConnector(latency=5.0)
+    executor = AsyncQueryExecutor(connector, poll_interval=0.01)
+
+    assert _run(_cancel_after(executor, 0.1))
+    assert len(connector.cancelled) == 1
+    assert connector.cancelled[0] in connector.submitted
+    assert executor.in_flight == []
+    assert connector.checked_out == 0
+
+
+def test_cancel_during_submission_cancels_once_submitted():
+    connector = FakePooledConnector(latency=5.0, submit_latency=0.2)
+    executor = AsyncQueryExecutor(connector, poll_interval=0.01)
+
+    assert _run(_cancel_after(executor, 0.05))
+    assert connector.cancelled == list(connector.submitted)
+    assert connector.checked_out == 0
+
+
+def test_cancel_during_fetch_cancels_on_server():
+    connector = FakePooledConnector(fetch_latency=0.2)
+    executor = AsyncQueryExecutor(connector, poll_interval=0.01)
+
+    assert _run(_cancel_after(executor, 0.1))
+    assert connector.cancelled == list(connector.submitted)
+    assert connector.checked_out == 0
+
+
+def test_builder_session_settings_are_applied():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    builder.with_query_tag("nightly").with_warehouse("LARGE_WH")
+    connector = FakeConnector()
+
+    _run(AsyncQueryExecutor(connector).execute(builder))
+
+    executed = [sql for sql, _ in connector.statements]
+    assert executed[:2] == ["ALTER SESSION SET QUERY_TAG = 'nightly'", "USE WAREHOUSE LARGE_WH"]
+    assert "QUERY_TAG" not in executed[2] and "LARGE_WH" not in executed[2]
+
+
+def test_in_list_tables_are_loaded_and_dropped():
+    in_list = InListTable([1, 2, 3])
+    connector = FakeConnector()
+    sql = f"SELECT * FROM t WHERE id IN (SELECT value FROM {in_list.name}) AND a = :p1"
+
+    _run(AsyncQueryExecutor(connector).execute(sql, {"p0": in_list, "p1": 7}))
+
+    statements = connector.statements
+    table = statements[0][0].split()[5]
+    assert table.startswith(f"{in_list.name}_")
+    assert statements[0][0].startswith(f"CREATE OR REPLACE TEMPORARY TABLE {table} ")
+    assert statements[1][0].startswith(f"INSERT INTO {table} ")
+    assert statements[2] == (sql.replace(in_list.name, table), {"p1": 7})
+    assert statements[-1][0] == f"DROP TABLE IF EXISTS {table}"
+
+
+def test_stream_cleanup_runs_off_the_event_loop():
+    threads = {}
+
+    class RecordingConnector(FakePooledConnector):
+        def release(self, connection, discard=False):
+            threads["release"] = threading.get_ident()
+            super().release(connection, discard)
+
+    executor = AsyncQueryExecutor(RecordingConnector())
+
+    async def main():
+        threads["loop"] = threading.get_ident()
+        async for _ in executor.stream("SELECT a, b FROM t"):
+            break
+
+    _run(main())
+
+    assert threads["release"] != threads["loop"]
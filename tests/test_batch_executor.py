@@ -0,0 +1,103 @@
+# pyquerybuilder/tests/test_batch_executor.py
+"""Tests for concurrent batch execution with per-warehouse limits."""
+import threading
+import time
+
+from pyquerybuilder.core.batch_executor import BatchQueryExecutor
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.cost_guard import ExplainCostGuard
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+from .fakes import FakePooledConnector, explain_plan
+
+
+def _builder(table, warehouse=None):
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {table: {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = table
+    if warehouse:
+        builder.with_warehouse(warehouse)
+    return builder
+
+
+class _SlowTables:
+    """Result callable sleeping per query and tracking concurrency per table."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.running = {}
+        self.peak = {}
+        self.finished = {}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __call__(self, sql, params):
+        table = sql.split("FROM ")[1].split()[0]
+        with self._lock:
+            self.running[table] = self.running.get(table, 0) + 1
+            self.peak[table] = max(self.peak.get(table, 0), self.running[table])
+        time.sleep(self.seconds)
+        with self._lock:
+            self.running[table] -= 1
+            self.finished.setdefault(table, []).append(time.monotonic() - self.started)
+        return [(table,)]
+
+
+def test_results_keep_input_order_and_errors_are_collected():
+    connector = FakePooledConnector()
+    connector.add_result("FROM broken", ("T",), lambda sql, params: 1 / 0)
+    batch = BatchQueryExecutor(connector, max_workers=4)
+
+    results = batch.execute_batch([("SELECT 1 FROM a", None), ("SELECT 1 FROM broken", None),
+                                   _builder("orders")])
+
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert results[0]["rows"] == [{"A": 1, "B": 2}, {"A": 3, "B": 4}]
+    assert isinstance(results[1]["error"], ZeroDivisionError)
+    assert results[2]["error"] is None and results[2]["rows"]
+
+
+def test_warehouse_limit_is_enforced():
+    slow = _SlowTables(0.05)
+    connector = FakePooledConnector(warehouse="SMALL_WH")
+    connector.add_result("FROM", ("T",), slow)
+    batch = BatchQueryExecutor(connector, max_workers=8, warehouse_limits={"SMALL_WH": 2})
+
+    results = batch.execute_batch([_builder("orders") for _ in range(6)])
+
+    assert all(r["error"] is None for r in results)
+    assert slow.peak["orders"] == 2
+    assert max(r["wait_time"] for r in results) > 0.05
+
+
+def test_capped_warehouse_does_not_block_other_warehouses():
+    slow = _SlowTables(0.2)
+    connector = FakePooledConnector(warehouse="SMALL_WH")
+    connector.add_result("FROM", ("T",), slow)
+    batch = BatchQueryExecutor(connector, max_workers=2, warehouse_limits={"SMALL_WH": 1})
+
+    queries = [_builder("capped") for _ in range(3)] + [_builder("other", "BIG_WH")]
+    results = batch.execute_batch(queries)
+
+    assert all(r["error"] is None for r in results)
+    assert results[3]["warehouse"] == "BIG_WH"
+    # The uncapped query runs alongside the first capped one
+    assert slow.finished["other"][0] < 0.35
+    assert slow.peak["capped"] == 1
+
+
+def test_rerouted_queries_hold_a_slot_of_the_warehouse_they_run_on():
+    slow = _SlowTables(0.05)
+    connector = FakePooledConnector(warehouse="SMALL_WH", plan=explain_plan(10 ** 12))
+    large = FakePooledConnector(warehouse="XLARGE")
+    large.add_result("FROM", ("T",), slow)
+    guard = ExplainCostGuard(connector, max_bytes=10 ** 9, reroute_connector=large)
+    batch = BatchQueryExecutor(connector, max_workers=4, warehouse_limits={"XLARGE": 1},
+                               executor=QueryExecutor(connector, guard))
+
+    results = batch.execute_batch([_builder("huge") for _ in range(3)])
+
+    assert all(r["error"] is None and r["warehouse"] == "XLARGE" for r in results)
+    assert slow.peak["huge"] == 1
@@ -0,0 +1,24 @@
+# pyquerybuilder/tests/test_builder.py
+"""Tests for QueryBuilder conditions."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+
+def _orders():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    return builder
+
+
+def test_null_operators_are_not_shifted_into_values():
+    builder = _orders()
+    builder.where("status", "IS NULL").or_where("region", "IS NOT NULL", None)
+    builder.or_where("id", 5)
+
+    assert builder._where_conditions == [
+        {"field": "status", "operator": "IS NULL", "value": None},
+        {"field": "region", "operator": "IS NOT NULL", "value": None, "logic": "OR"},
+        {"field": "id", "operator": "=", "value": 5, "logic": "OR"}
+    ]
@@ -0,0 +1,21 @@
+# pyquerybuilder/tests/test_canonical.py
+"""Tests for canonical SQL normalization."""
+from pyquerybuilder.sql.canonical import _sorted_values, normalize_sql
+
+
+def test_literals_comments_and_casts_are_left_alone():
+    sql = ("select /*+ query_tag('nightly') */ a::varchar, ':p1 stays' "
+           "-- keep :p1 here\n from t where b = :p1 and c = :p0")
+
+    normalized, params = normalize_sql(sql, {"p0": "x", "p1": "y"})
+
+    assert normalized == (
+        "SELECT /*+ query_tag('nightly') */ A::VARCHAR, ':p1 stays' "
+        "-- keep :p1 here\nFROM T WHERE B = :p0 AND C = :p1"
+    )
+    assert params == {"p0": "y", "p1": "x"}
+
+
+def test_sorted_values_deduplicates_hashable_and_unhashable_values():
+    assert _sorted_values([3, 1, 3, 2, 1]) == [1, 2, 3]
+    assert _sorted_values([[2], [1], [2]]) == [[1], [2]]
@@ -0,0 +1,52 @@
+# pyquerybuilder/tests/test_columnar.py
+"""Tests for columnar result fetching."""
+import pytest
+
+from pyquerybuilder.core.columnar import fetch_pydict, iter_arrow_batches
+from pyquerybuilder.core.executor import QueryExecutor
+
+from .fakes import FakeConnector
+
+
+def test_fetch_pydict_transposes_rows():
+    connector = FakeConnector(columns=("A", "B"), rows=[(1, "x"), (2, "y"), (3, "z")])
+    cursor = connector.connect().cursor()
+    cursor.execute("SELECT a, b FROM t")
+
+    assert fetch_pydict(cursor, batch_size=2) == {"A": [1, 2, 3], "B": ["x", "y", "z"]}
+
+
+def test_execute_columnar_pydict():
+    connector = FakeConnector(columns=("A",), rows=[(1,), (2,)])
+
+    assert QueryExecutor(connector).execute_columnar("SELECT a FROM t", output="pydict") == {
+        "A": [1, 2]
+    }
+
+
+def test_arrow_batches_share_the_first_batch_schema():
+    pa = pytest.importorskip("pyarrow")
+    rows = [(1, "a"), (2, "b"), (None, None), (None, None), (3, None)]
+    connector = FakeConnector(columns=("N", "S"), rows=rows)
+    cursor = connector.connect().cursor()
+    cursor.execute("SELECT n, s FROM t")
+
+    batches = list(iter_arrow_batches(cursor, batch_size=2))
+
+    assert [batch.schema for batch in batches] == [batches[0].schema] * 3
+    assert batches[0].schema.types == [pa.int64(), pa.string()]
+    assert pa.Table.from_batches(batches).column("N").to_pylist() == [1, 2, None, None, 3]
+
+
+def test_arrow_batches_use_described_types():
+    pa = pytest.importorskip("pyarrow")
+    connector = FakeConnector(columns=("N",), rows=[(None,), (1.5,)])
+    cursor = connector.connect().cursor()
+    cursor.execute("SELECT n FROM t")
+    # Snowflake reports (name, type_code, display_size, internal_size,
+    # precision, scale, is_nullable); type code 1 is REAL
+    cursor.description = [("N", 1, None, None, None, None, True)]
+
+    batches = list(iter_arrow_batches(cursor, batch_size=1))
+
+    assert [batch.schema.types for batch in batches] == [[pa.float64()], [pa.float64()]]
@@ -0,0 +1,103 @@
+# pyquerybuilder/tests/test_connection_pool.py
+"""Tests for the thread-safe connection pool."""
+import os
+import threading
+
+import pytest
+
+from pyquerybuilder.discovery import connection_pool
+from pyquerybuilder.discovery.connection_pool import ConnectionPool, PoolTimeout
+
+
+class _Connection:
+    """Connection stand-in recording whether it was closed."""
+
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+        self.alive = True
+
+    def close(self):
+        self.closed = True
+
+
+class _Factory:
+    """Connector factory numbering the connections it opens."""
+
+    def __init__(self):
+        self.opened = []
+
+    def __call__(self):
+        connection = _Connection(len(self.opened))
+        self.opened.append(connection)
+        return connection
+
+
+def _pool(**options):
+    factory = _Factory()
+    options.setdefault("health_check", lambda connection: connection.alive)
+    return ConnectionPool(factory, **options), factory
+
+
+def test_checkout_waits_for_a_release_and_times_out():
+    pool, factory = _pool(max_size=1)
+    connection = pool.acquire()
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire(timeout=0.05)
+
+    threading.Timer(0.05, pool.release, (connection,)).start()
+    assert pool.acquire(timeout=2) is connection
+    assert len(factory.opened) == 1
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_discarded_connections_are_closed_and_replaced():
+    pool, factory = _pool(max_size=1)
+    connection = pool.acquire()
+
+    pool.release(connection, discard=True)
+
+    assert connection.closed
+    assert pool.stats()["size"] == 0
+    assert pool.acquire(timeout=0.05) is factory.opened[1]
+
+
+def test_stale_connections_are_validated_on_checkout():
+    pool, factory = _pool(health_check_interval=0)
+    connection = pool.acquire()
+    pool.release(connection)
+    connection.alive = False
+
+    assert pool.acquire() is factory.opened[1]
+    assert connection.closed
+    assert pool.stats()["failed_health_checks"] == 1
+
+
+def test_connections_are_not_reused_after_a_fork(monkeypatch):
+    pool, factory = _pool()
+    inherited = pool.acquire()
+    pool.release(inherited)
+
+    child_pid = os.getpid() + 1
+    monkeypatch.setattr(connection_pool.os, "getpid", lambda: child_pid)
+
+    assert pool.acquire() is factory.opened[1]
+    # The parent's session is left open for the parent to use
+    assert not inherited.closed
+    assert pool.stats()["size"] == 1
+
+
+def test_warm_opens_min_size_connections_and_stats_count_usage():
+    pool, factory = _pool(min_size=2, max_size=3)
+    assert factory.opened == []
+
+    pool.warm()
+    first = pool.acquire()
+    pool.release(first)
+
+    stats = pool.stats()
+    assert len(factory.opened) == 2
+    assert (stats["size"], stats["idle"], stats["in_use"]) == (2, 2, 0)
+    assert stats["checkouts"] == 1
+    assert stats["max_size"] == 3
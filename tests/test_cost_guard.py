@@ -0,0 +1,77 @@
+# pyquerybuilder/tests/test_cost_guard.py
+"""Tests for the EXPLAIN-based pre-execution cost guard."""
+import pytest
+
+from pyquerybuilder.core.cost_guard import ExplainCostGuard, QueryCostExceeded
+from pyquerybuilder.core.executor import QueryExecutor
+
+from .fakes import FakeConnector, explain_plan
+
+TERABYTE = 10 ** 12
+
+
+def test_query_under_budget_runs_on_default_connector():
+    connector = FakeConnector(plan=explain_plan(bytes_assigned=1000))
+    guard = ExplainCostGuard(connector, max_bytes=10 ** 9)
+
+    rows = QueryExecutor(connector, guard).execute("SELECT a FROM small")
+
+    assert rows == [{"A": 1, "B": 2}, {"A": 3, "B": 4}]
+    assert connector.executed("SELECT") == ["SELECT a FROM small"]
+
+
+def test_query_over_budget_is_rejected():
+    connector = FakeConnector(plan=explain_plan(TERABYTE, 900, 1000))
+    guard = ExplainCostGuard(connector, max_bytes=10 ** 9)
+
+    with pytest.raises(QueryCostExceeded) as excinfo:
+        QueryExecutor(connector, guard).execute("SELECT * FROM huge")
+
+    assert excinfo.value.estimate["bytes_assigned"] == TERABYTE
+    assert excinfo.value.estimate["partitions_assigned"] == 900
+    assert connector.executed("SELECT") == []
+
+
+def test_partition_budget():
+    connector = FakeConnector(plan=explain_plan(1, partitions_assigned=50, partitions_total=100))
+    guard = ExplainCostGuard(connector, max_partitions=10)
+
+    with pytest.raises(QueryCostExceeded):
+        guard.check("SELECT * FROM t")
+
+
+def test_query_over_budget_is_rerouted():
+    connector = FakeConnector(plan=explain_plan(TERABYTE))
+    large = FakeConnector(warehouse="XLARGE")
+    guard = ExplainCostGuard(connector, max_bytes=10 ** 9, reroute_connector=large)
+
+    QueryExecutor(connector, guard).execute("SELECT * FROM huge")
+
+    assert connector.executed("SELECT") == []
+    assert large.executed("SELECT") == ["SELECT * FROM huge"]
+
+
+def test_plans_are_cached_per_fingerprint():
+    connector = FakeConnector()
+    connector.add_plan("huge", explain_plan(TERABYTE))
+    guard = ExplainCostGuard(connector, max_bytes=10 ** 9)
+
+    guard.check("SELECT * FROM t WHERE a = :p0", {"p0": 1})
+    guard.check("SELECT *  FROM t\nWHERE a = :p0", {"p0": 2})
+    with pytest.raises(QueryCostExceeded):
+        guard.check("SELECT * FROM huge")
+
+    assert connector.explains == 2
+    assert guard.stats() == {"entries": 2, "hits": 1, "misses": 2, "evictions": 0}
+
+
+def test_plan_cache_evicts_oldest():
+    connector = FakeConnector()
+    guard = ExplainCostGuard(connector, cache_size=1)
+
+    guard.check("SELECT 1")
+    guard.check("SELECT 2")
+    guard.check("SELECT 1")
+
+    assert connector.explains == 3
+    assert guard.stats()["evictions"] == 2
@@ -0,0 +1,69 @@
+# pyquerybuilder/tests/test_disk_cache.py
+"""Tests for the on-disk Arrow result cache."""
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from pyquerybuilder.core.disk_cache import DiskResultCache  # noqa: E402
+
+
+def _table(rows=3):
+    return pa.table({"id": list(range(rows))})
+
+
+def test_round_trip_and_provenance(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+
+    fingerprint = cache.put("SELECT id FROM t", {"p0": 1}, _table(), tables=["T"])
+
+    assert cache.get("SELECT  id FROM t", {"p0": 1}).column("id").to_pylist() == [0, 1, 2]
+    assert cache.get("SELECT id FROM t", {"p0": 2}) is None
+    (entry,) = cache.entries()
+    assert entry["fingerprint"] == fingerprint
+    assert entry["tables"] == ["T"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_entries_expire_by_default(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    assert cache.max_age is not None
+
+    cache.max_age = -1
+    cache.put("SELECT id FROM t", None, _table())
+
+    assert cache.get("SELECT id FROM t") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_entries_are_invalidated_when_a_table_changes(tmp_path):
+    versions = {"ORDERS": "2024-01-01 00:00:00"}
+    cache = DiskResultCache(str(tmp_path), validation_interval=0,
+                            last_altered=lambda tables: {t: versions.get(t) for t in tables})
+
+    cache.put("SELECT id FROM orders", None, _table(), tables=["ORDERS"])
+    assert cache.get("SELECT id FROM orders") is not None
+
+    versions["ORDERS"] = "2024-01-02 00:00:00"
+
+    assert cache.get("SELECT id FROM orders") is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_oversized_results_are_not_written(tmp_path):
+    cache = DiskResultCache(str(tmp_path), max_bytes=100)
+
+    assert cache.put("SELECT id FROM big", None, _table(10000)) is None
+    assert os.listdir(str(tmp_path)) == []
+    assert cache.stats()["evictions"] == 0
+
+
+def test_failed_json_write_leaves_no_temporary_file(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+
+    with pytest.raises(TypeError):
+        cache._write_json(str(tmp_path / "x.json"), {"bad": object()})
+
+    assert os.listdir(str(tmp_path)) == []
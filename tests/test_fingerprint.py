@@ -0,0 +1,17 @@
+# pyquerybuilder/tests/test_fingerprint.py
+"""Tests for query shapes and fingerprints."""
+from pyquerybuilder.sql.fingerprint import fingerprint, query_shape
+from pyquerybuilder.sql.generators.where_generator import generate_where
+
+
+def test_in_list_strategies_share_a_fingerprint():
+    conditions = [{"field": "id", "operator": "IN", "value": list(range(5))}]
+    shapes = set()
+    for array_threshold, temp_table_threshold in ((10, 10), (2, 10), (2, 2)):
+        where, _ = generate_where(conditions, array_threshold=array_threshold,
+                                  temp_table_threshold=temp_table_threshold)
+        shapes.add(query_shape(f"SELECT a FROM t {where}"))
+
+    assert shapes == {"SELECT A FROM T WHERE ID IN (?+)"}
+    assert fingerprint("select a from t where id in (:p0)") == \
+        fingerprint("SELECT a FROM t WHERE id IN (SELECT value FROM IN_LIST_0123456789ABCDEF)")
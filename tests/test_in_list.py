@@ -0,0 +1,74 @@
+# pyquerybuilder/tests/test_in_list.py
+"""Tests for externalized IN lists."""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyquerybuilder.core import insert
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.sql.fingerprint import fingerprint
+from pyquerybuilder.sql.generators.where_generator import InListTable, generate_where
+
+from .fakes import FakeConnector
+
+
+def test_in_list_table_name_depends_only_on_values():
+    assert InListTable([1, 2, 3]).name == InListTable([1, 2, 3]).name
+    assert InListTable([1, 2, 3]).name != InListTable([1, 2, 4]).name
+    assert InListTable([1]).name != InListTable(["1"]).name
+
+
+def test_flatten_casts_elements_to_the_value_type():
+    conditions = [{"field": "id", "operator": "IN", "value": [1, 2, 3]},
+                  {"field": "code", "operator": "NOT IN", "value": ["a", "b"]}]
+
+    sql, params = generate_where(conditions, array_threshold=2)
+
+    assert "SELECT f.value::NUMBER(38, 0) FROM TABLE(FLATTEN" in sql
+    assert "SELECT f.value::VARCHAR FROM TABLE(FLATTEN" in sql
+    assert params == {"p0": "[1, 2, 3]", "p1": '["a", "b"]'}
+
+
+def test_failed_load_drops_created_tables():
+    connector = FakeConnector()
+    first, second = InListTable([1, 2]), InListTable([3, 4])
+
+    def fail(sql, params):
+        raise RuntimeError("warehouse suspended")
+
+    connector.add_result(f"TABLE {second.name}", (), fail)
+    executor = QueryExecutor(connector)
+
+    with pytest.raises(RuntimeError):
+        executor.execute("SELECT 1", {"p0": first, "p1": second})
+
+    dropped = [sql.split()[-1] for sql in connector.executed("DROP")]
+    assert [name.rsplit("_", 1)[0] for name in dropped] == [first.name, second.name]
+
+
+def test_executions_load_tables_of_their_own():
+    in_list = InListTable([1, 2, 3])
+    sql = f"SELECT * FROM t WHERE id IN (SELECT value FROM {in_list.name})"
+    connector = FakeConnector()
+    executor = QueryExecutor(connector)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(lambda _: executor.execute(sql, {"p0": in_list}), range(2)))
+
+    created = [s.split()[5] for s in connector.executed("CREATE OR REPLACE TEMPORARY")]
+    dropped = [s.split()[-1] for s in connector.executed("DROP")]
+    assert len(set(created)) == 2
+    assert sorted(dropped) == sorted(created)
+    assert all(name.startswith(f"{in_list.name}_") for name in created)
+    assert fingerprint(sql.replace(in_list.name, created[0])) == fingerprint(sql)
+
+
+def test_long_lists_load_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(insert, "pyarrow", None)
+    in_list = InListTable(range(insert.COPY_THRESHOLD + 1))
+    connector = FakeConnector()
+
+    QueryExecutor(connector).execute("SELECT 1", {"p0": in_list})
+
+    assert len(connector.executed("INSERT INTO")) == 11
+    assert connector.executed("PUT") == []
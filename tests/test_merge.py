@@ -0,0 +1,40 @@
+# pyquerybuilder/tests/test_merge.py
+"""Tests for staged MERGE upserts."""
+from pyquerybuilder.core.merge import MergeBuilder
+
+from .fakes import FakeConnector
+
+
+def test_batches_are_staged_and_merged_on_the_keys():
+    connector = FakeConnector()
+    counts = iter([[(1, 1)], [(0, 1)]])
+    connector.add_result("MERGE INTO", ("number of rows inserted", "number of rows updated"),
+                         lambda sql, params: next(counts))
+    merger = MergeBuilder(None, "sales.orders", ["region", "id"], connector=connector,
+                          columns=["region", "id", "status"], batch_size=2)
+
+    result = merger.execute([("EU", 1, "open"), ("EU", 2, "closed"), ("US", 1, "open")])
+
+    created = connector.executed("CREATE")
+    assert len(created) == 1
+    assert created[0].startswith("CREATE TEMPORARY TABLE orders_STAGING_")
+    assert created[0].endswith(" LIKE sales.orders")
+    staging = created[0].split()[3]
+
+    # The staging table is emptied before every batch but the first
+    assert connector.executed("TRUNCATE") == [f"TRUNCATE TABLE {staging}"]
+    assert len(connector.executed(f"INSERT INTO {staging}")) == 2
+
+    merges = connector.executed("MERGE")
+    assert merges == [
+        f"MERGE INTO sales.orders t USING {staging} s ON t.region = s.region AND t.id = s.id"
+        " WHEN MATCHED THEN UPDATE SET t.status = s.status"
+        " WHEN NOT MATCHED THEN INSERT (region, id, status)"
+        " VALUES (s.region, s.id, s.status)"
+    ] * 2
+    assert connector.executed("DROP") == [f"DROP TABLE IF EXISTS {staging}"]
+
+    assert (result["rows"], result["inserted"], result["updated"]) == (3, 1, 2)
+    assert [(b["rows"], b["inserted"], b["updated"]) for b in result["batches"]] == [
+        (2, 1, 1), (1, 0, 1)
+    ]
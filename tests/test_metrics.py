@@ -0,0 +1,63 @@
+# pyquerybuilder/tests/test_metrics.py
+"""Tests for the Prometheus metrics registry."""
+import gc
+import re
+
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.metrics import MetricsRegistry, render_metrics
+from pyquerybuilder.core.result_cache import ResultCache
+
+from .fakes import FakeConnector
+
+
+def _sample(text, name):
+    """Read one sample value from rendered metrics, 0 when absent."""
+    match = re.search(rf"^{re.escape(name)} (\S+)$", text, re.M)
+    return float(match.group(1)) if match else 0.0
+
+
+class _Component:
+    """Monitored component reporting fixed stats()."""
+
+    def stats(self):
+        return {"hits": 3, "misses": 1, "entries": 2, "enabled": True}
+
+
+def test_executor_queries_and_cache_hits_are_exported():
+    gc.collect()
+    before = render_metrics()
+    executor = QueryExecutor(FakeConnector(), result_cache=ResultCache())
+
+    executor.execute("SELECT a, b FROM t")
+    executor.execute("SELECT a, b FROM t")
+    after = render_metrics()
+
+    ok = 'pyquerybuilder_queries_total{status="ok"}'
+    hits = "pyquerybuilder_result_cache_hits_total"
+    assert _sample(after, ok) - _sample(before, ok) == 1
+    assert _sample(after, hits) - _sample(before, hits) == 1
+    assert "# TYPE pyquerybuilder_execute_seconds histogram" in after
+    assert "# TYPE pyquerybuilder_result_cache_entries gauge" in after
+
+
+def test_monitored_components_are_summed_and_dropped_once_collected():
+    registry = MetricsRegistry(prefix="test")
+    first, second = _Component(), _Component()
+    registry.monitor(first, "cache")
+    registry.monitor(second, "cache")
+    registry.monitor(second, "cache")
+
+    text = registry.render()
+    assert "# TYPE test_cache_hits_total counter" in text
+    assert _sample(text, "test_cache_hits_total") == 6
+    assert _sample(text, "test_cache_entries") == 4
+    assert _sample(text, "test_cache_hit_ratio") == 0.75
+    assert "test_cache_enabled" not in text
+
+    del first
+    gc.collect()
+    assert _sample(registry.render(), "test_cache_hits_total") == 3
+
+    del second
+    gc.collect()
+    assert "test_cache" not in registry.render()
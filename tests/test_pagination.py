@@ -0,0 +1,63 @@
+# pyquerybuilder/tests/test_pagination.py
+"""Tests for keyset (seek) pagination."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.pagination import KeysetPaginator
+from pyquerybuilder.schema.registry import SchemaRegistry
+from pyquerybuilder.sql.generators.where_generator import generate_seek
+
+from .fakes import FakeConnector
+
+
+def _orders():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    return builder
+
+
+def test_multi_column_seek_expands_to_alternatives():
+    sql, params = generate_seek({"columns": ["a", "b", "c"], "values": [1, 2, 3]})
+
+    assert sql == ("a > :k0 OR (a = :k0 AND b > :k1) "
+                   "OR (a = :k0 AND b = :k1 AND c > :k2)")
+    assert params == {"k0": 1, "k1": 2, "k2": 3}
+
+
+def test_seek_is_and_ed_with_existing_filters_in_parentheses():
+    builder = _orders().where("status", "open").or_where("region", "EU")
+    paginator = KeysetPaginator(builder, ["created_at", "id"], 2, descending=True)
+
+    sql, params = paginator.page_builder([5, 7]).build()
+
+    assert "WHERE ((status = :p0 OR region = :p1)) AND " \
+           "(created_at < :k0 OR (created_at = :k0 AND id < :k1))" in sql
+    assert sql.endswith("ORDER BY created_at DESC, id DESC LIMIT 2")
+    assert params == {"p0": "open", "p1": "EU", "k0": 5, "k1": 7}
+
+
+def test_first_page_has_no_seek_predicate():
+    sql, params = KeysetPaginator(_orders(), "id", 10).page_builder().build()
+
+    assert ":k0" not in sql
+    assert params == {}
+
+
+def test_pages_resume_after_the_last_key_and_stop_on_an_empty_page():
+    ids = [1, 2, 3, 4]
+
+    def rows(sql, params):
+        after = [i for i in ids if i > params["k0"]] if "k0" in params else ids
+        return [(i,) for i in after[:2]]
+
+    connector = FakeConnector()
+    connector.add_result("FROM orders", ("ID",), rows)
+    paginator = KeysetPaginator(_orders(), "id", 2, executor=QueryExecutor(connector))
+
+    pages = [[row["ID"] for row in page] for page in paginator.pages()]
+
+    assert pages == [[1, 2], [3, 4]]
+    # A full last page needs one more query to find out it was the last
+    assert len(connector.executed("SELECT")) == 3
+    assert paginator.last_key == [4]
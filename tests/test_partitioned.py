@@ -0,0 +1,55 @@
+# pyquerybuilder/tests/test_partitioned.py
+"""Tests for parallel extraction of partitioned queries."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.partitioned import PartitionedQuery
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+from .fakes import FakeConnector
+
+
+def test_slices_run_with_the_builder_session():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    builder.select("id").with_query_tag("nightly-export")
+    connector = FakeConnector()
+
+    rows = list(PartitionedQuery(builder, "id", 3, strategy="hash",
+                                 executor=QueryExecutor(connector)))
+
+    assert len(rows) == 6
+    assert set(connector.executed("ALTER SESSION SET QUERY_TAG")) == {
+        "ALTER SESSION SET QUERY_TAG = 'nightly-export'"
+    }
+
+
+def _ordered_slices(direction):
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    builder.select("id").order_by("id", direction)
+
+    def rows(sql, params):
+        if "ORDER BY" not in sql:
+            # MIN and MAX of the split column
+            return [(0, 9)]
+        if "IS NULL" in sql:
+            return [(None, None), (None, None)]
+        low = min(params.values()) if ">=" in sql else 0
+        result = [(low, None), (low + 1, None)]
+        return result if direction == "asc" else result[::-1]
+
+    connector = FakeConnector()
+    connector.add_result("FROM orders", ("ID", "MAX"), rows)
+    return PartitionedQuery(builder, "id", 3, executor=QueryExecutor(connector))
+
+
+def test_ordered_merge_puts_null_keys_last_ascending_and_first_descending():
+    ascending = [row["ID"] for row in _ordered_slices("asc").stream(ordered=True)]
+    descending = [row["ID"] for row in _ordered_slices("desc").stream(ordered=True)]
+
+    assert ascending == [0, 1, 3, 4, 6, 7, None, None]
+    assert descending == [None, None, 7, 6, 4, 3, 1, 0]
@@ -0,0 +1,29 @@
+# pyquerybuilder/tests/test_query_history.py
+"""Tests for harvesting QUERY_HISTORY statistics."""
+import pytest
+
+from pyquerybuilder.core.query_history import QueryHistoryHarvester
+from pyquerybuilder.core.telemetry import telemetry
+
+from .fakes import FakeConnector
+
+
+def test_failed_lookups_warn_and_count_as_attempts():
+    connector = FakeConnector()
+
+    def fail(sql, params):
+        raise RuntimeError("information schema unavailable")
+
+    connector.add_result("QUERY_HISTORY", ("QUERY_ID",), fail)
+    harvester = QueryHistoryHarvester(connector, max_attempts=2)
+    assert harvester.telemetry is telemetry
+    harvester.track("01b00000-0000-0000-0000-000000000001", "abc")
+
+    with pytest.warns(RuntimeWarning, match="information schema unavailable"):
+        assert harvester.harvest() == {}
+    assert harvester.pending() == 1
+
+    with pytest.warns(RuntimeWarning):
+        harvester.harvest()
+    assert harvester.stats() == {"pending": 0, "harvested": 0, "dropped": 1,
+                                 "failed_lookups": 2}
@@ -0,0 +1,94 @@
+# pyquerybuilder/tests/test_result_cache.py
+"""Tests for the in-process result cache and its use by the executor."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.disk_cache import cache_fingerprint
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.query_stats import query_stats
+from pyquerybuilder.core.result_cache import ResultCache, make_cache_key
+from pyquerybuilder.query.where_group import WhereGroup
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+from .fakes import FakeConnector
+
+
+def _registry(*tables):
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {t: {} for t in tables}, "relationships": {}})
+    return registry
+
+
+def test_cached_rows_cannot_be_changed_by_callers():
+    cache = ResultCache()
+    key = make_cache_key("SELECT a FROM t")
+    rows = [{"A": 1}]
+    cache.put(key, rows)
+    rows[0]["A"] = 2
+
+    first = cache.get(key)
+    first[0]["A"] = 3
+    first.append({"A": 4})
+
+    assert cache.get(key) == [{"A": 1}]
+
+
+def test_executor_serves_repeated_queries_from_cache():
+    connector = FakeConnector()
+    executor = QueryExecutor(connector, result_cache=ResultCache())
+
+    executor.execute("SELECT a FROM t", {"p0": 1})[0]["A"] = "changed"
+    rows = executor.execute("SELECT a FROM t", {"p0": 1})
+
+    assert rows == [{"A": 1, "B": 2}, {"A": 3, "B": 4}]
+    assert connector.executed("SELECT") == ["SELECT a FROM t"]
+
+
+def test_where_subquery_tables_are_referenced():
+    registry = _registry("orders", "customers", "regions")
+    customers = QueryBuilder(registry)
+    customers._from_table = "customers"
+    customers.select("id")
+    regions = QueryBuilder(registry)
+    regions._from_table = "regions"
+    regions.select("id")
+
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    builder.where_in("customer_id", customers.as_subquery())
+    builder.where("status", "=", "open")
+    builder.build()
+
+    assert builder.referenced_tables() == ["customers", "orders"]
+
+    grouped = QueryBuilder(registry)
+    grouped._from_table = "orders"
+    inner = WhereGroup().where("region_id", "IN", regions.as_subquery())
+    grouped._where_groups.append(WhereGroup().where("priority", "=", 1).or_where(inner))
+    grouped.build()
+
+    assert grouped.referenced_tables() == ["orders", "regions"]
+
+
+def test_cache_hits_are_not_counted_as_executions():
+    registry = _registry("shipments")
+    builder = QueryBuilder(registry)
+    builder._from_table = "shipments"
+    builder.select("id")
+    builder.build()
+    executor = QueryExecutor(FakeConnector(), result_cache=ResultCache())
+    before = query_stats.get(builder.fingerprint()) or {"executions": 0, "cache_hits": 0}
+
+    executor.execute_builder(builder)
+    executor.execute_builder(builder)
+
+    after = query_stats.get(builder.fingerprint())
+    assert after["executions"] - before["executions"] == 1
+    assert after["cache_hits"] - before["cache_hits"] == 1
+
+
+def test_whitespace_is_only_collapsed_outside_quoted_text():
+    assert make_cache_key("SELECT  a\n FROM t") == make_cache_key("SELECT a FROM t")
+    for first, second in [("WHERE a = 'x  y'", "WHERE a = 'x y'"),
+                          ('SELECT "a  b" FROM t', 'SELECT "a b" FROM t'),
+                          ("SELECT 1 -- note\nFROM t", "SELECT 1 -- note FROM t")]:
+        assert make_cache_key(first) != make_cache_key(second)
+        assert cache_fingerprint(first) != cache_fingerprint(second)
@@ -0,0 +1,66 @@
+# pyquerybuilder/tests/test_result_stream.py
+"""Tests for streaming results in fetchmany() batches."""
+import pytest
+
+from pyquerybuilder.core.result_stream import ResultStream
+
+
+class _Cursor:
+    """Cursor stand-in serving rows in batches and recording close()."""
+
+    def __init__(self, rows, fail_after=None):
+        self.description = [("N",)]
+        self.rows = list(rows)
+        self.fail_after = fail_after
+        self.fetches = 0
+        self.closed = 0
+
+    def fetchmany(self, size):
+        if self.fail_after is not None and self.fetches >= self.fail_after:
+            raise ConnectionError("session expired")
+        self.fetches += 1
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed += 1
+
+
+def test_exhausted_stream_closes_its_cursor_once():
+    cursor = _Cursor([(i,) for i in range(5)])
+    closed = []
+    stream = ResultStream(cursor, batch_size=2, on_close=closed.append)
+
+    assert [row["N"] for row in stream] == [0, 1, 2, 3, 4]
+    assert stream.closed and cursor.closed == 1
+    assert closed == [stream]
+    assert stream.rows_fetched == 5
+    assert stream.fetch_time > 0
+
+    stream.close()
+    assert cursor.closed == 1 and len(closed) == 1
+
+
+def test_early_exit_closes_the_cursor():
+    cursor = _Cursor([(i,) for i in range(5)])
+    closed = []
+
+    with ResultStream(cursor, batch_size=2, on_close=closed.append) as stream:
+        for row in stream:
+            break
+
+    assert cursor.closed == 1
+    assert closed == [stream]
+    assert stream.rows_fetched == 2
+
+
+def test_fetch_error_is_recorded_and_the_cursor_closed():
+    cursor = _Cursor([(i,) for i in range(5)], fail_after=1)
+    stream = ResultStream(cursor, batch_size=2)
+
+    with pytest.raises(ConnectionError):
+        list(stream)
+
+    assert isinstance(stream.error, ConnectionError)
+    assert stream.closed and cursor.closed == 1
+    assert stream.rows_fetched == 2
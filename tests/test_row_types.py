@@ -0,0 +1,34 @@
+# pyquerybuilder/tests/test_row_types.py
+"""Tests for compact per-shape row classes."""
+import pytest
+
+from pyquerybuilder.core.row_types import make_rows, row_class_for
+
+
+def test_values_are_read_by_position_name_and_attribute():
+    row = make_rows(["ID", "STATUS", "class", "total amount"], [(1, "open", 2, 3.5)])[0]
+
+    assert (row[0], row["STATUS"], row.ID, row.STATUS) == (1, "open", 1, "open")
+    assert row[1:3] == ("open", 2)
+    assert row["total amount"] == 3.5 and row["class"] == 2
+    # Keywords and non-identifiers are only reachable by name
+    assert not hasattr(row, "class")
+    assert row.get("MISSING", 0) == 0
+    with pytest.raises(KeyError):
+        row["MISSING"]
+
+
+def test_rows_convert_to_dictionaries():
+    row = make_rows(["ID", "STATUS"], [(1, "open")])[0]
+
+    assert row._asdict() == row.to_dict() == {"ID": 1, "STATUS": "open"}
+    assert dict(row.items()) == {"ID": 1, "STATUS": "open"}
+    assert list(row.keys()) == ["ID", "STATUS"] and "ID" in row
+    assert row == (1, "open")
+
+
+def test_one_class_per_result_shape():
+    first, second = make_rows(("A", "B"), [(1, 2), (3, 4)])
+
+    assert type(first) is type(second) is row_class_for(("A", "B"))
+    assert type(first) is not row_class_for(("A", "C"))
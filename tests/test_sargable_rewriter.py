@@ -0,0 +1,55 @@
+# pyquerybuilder/tests/test_sargable_rewriter.py
+"""Tests for rewriting DATE_TRUNC/DATE_PART predicates into column ranges."""
+import pytest
+
+from pyquerybuilder.query.analyzers.sargable_rewriter import rewrite_sargable
+from pyquerybuilder.sql.functions import fn
+
+
+def _ranges(operator, value, part="day"):
+    """Rewrite one DATE_TRUNC comparison and return (operator, value) pairs."""
+    conditions, _ = rewrite_sargable([
+        {"field": fn.DateTrunc(part, "ts"), "operator": operator, "value": value}
+    ])
+    return [(c["operator"], c["value"]) for c in conditions]
+
+
+@pytest.mark.parametrize("operator, expected", [
+    ("=", [(">=", "2024-01-02"), ("<", "2024-01-03")]),
+    (">=", [(">=", "2024-01-02")]),
+    (">", [(">=", "2024-01-03")]),
+    ("<", [("<", "2024-01-02")]),
+    ("<=", [("<", "2024-01-03")]),
+])
+def test_aligned_literal(operator, expected):
+    assert _ranges(operator, "2024-01-02") == expected
+
+
+@pytest.mark.parametrize("operator, expected", [
+    (">=", [(">=", "2024-01-02 00:00:00")]),
+    (">", [(">=", "2024-01-02 00:00:00")]),
+    ("<", [("<", "2024-01-02 00:00:00")]),
+    ("<=", [("<", "2024-01-02 00:00:00")]),
+])
+def test_unaligned_literal_splits_at_next_boundary(operator, expected):
+    assert _ranges(operator, "2024-01-01 12:00") == expected
+
+
+def test_unaligned_equality_is_not_rewritten():
+    conditions, _ = rewrite_sargable([
+        {"field": fn.DateTrunc("day", "ts"), "operator": "=", "value": "2024-01-01 12:00"}
+    ])
+    assert conditions[0]["operator"] == "="
+    assert getattr(conditions[0]["field"], "name", None) == "DATE_TRUNC"
+
+
+@pytest.mark.parametrize("operator, expected", [
+    ("=", [(">=", "2024-01-01"), ("<", "2025-01-01")]),
+    (">", [(">=", "2025-01-01")]),
+    ("<=", [("<", "2025-01-01")]),
+])
+def test_date_part_year(operator, expected):
+    conditions, _ = rewrite_sargable([
+        {"field": fn.DatePart("year", "ts"), "operator": operator, "value": 2024}
+    ])
+    assert [(c["operator"], str(c["value"])) for c in conditions] == expected
@@ -0,0 +1,75 @@
+# pyquerybuilder/tests/test_semantic_cache.py
+"""Tests for answering refined queries from the semantic cache."""
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.semantic_cache import SemanticCache
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+
+def _registry():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    return registry
+
+
+def _orders(registry, *filters):
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    builder.select("id", "status")
+    for field, operator, value in filters:
+        builder.where(field, operator, value)
+    builder.build()
+    return builder
+
+
+def _table():
+    return pyarrow.table({"id": [1, 2, 3, 4], "status": ["open", "closed", None, "open"]})
+
+
+def test_not_in_excludes_null_rows():
+    registry = _registry()
+    cache = SemanticCache()
+    cache.put(_orders(registry), _table())
+
+    answer = cache.lookup(_orders(registry, ("status", "NOT IN", ["closed"])))
+    assert answer.column("id").to_pylist() == [1, 4]
+
+    answer = cache.lookup(_orders(registry, ("status", "NOT IN", ["closed", None])))
+    assert answer.num_rows == 0
+
+
+def test_mismatched_literal_types_are_a_miss():
+    registry = _registry()
+    cache = SemanticCache()
+    cache.put(_orders(registry), _table())
+
+    assert cache.lookup(_orders(registry, ("status", ">", 3))) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire_and_are_invalidated():
+    registry = _registry()
+    versions = {"orders": 1}
+    cache = SemanticCache(
+        last_altered=lambda tables: {t: versions[t] for t in tables},
+        validation_interval=0
+    )
+    cache.put(_orders(registry), _table())
+    refined = _orders(registry, ("id", ">", 2))
+    assert cache.lookup(refined).num_rows == 2
+
+    versions["orders"] = 2
+    assert cache.lookup(refined) is None
+    assert cache.stats()["invalidations"] == 1
+
+    cache.put(_orders(registry), _table())
+    assert cache.invalidate_table("ORDERS") == 1
+    assert cache.lookup(refined) is None
+
+    expiring = SemanticCache(ttl=0)
+    expiring.put(_orders(registry), _table())
+    assert expiring.lookup(refined) is None
+    assert expiring.stats()["entries"] == 0
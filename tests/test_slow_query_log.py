@@ -0,0 +1,60 @@
+# pyquerybuilder/tests/test_slow_query_log.py
+"""Tests for the slow query log."""
+import json
+import threading
+import time
+
+import pytest
+
+from pyquerybuilder.core.slow_query_log import SlowQueryLog, redact_plan
+from pyquerybuilder.core.telemetry import QuerySpan
+
+from .fakes import FakeConnector
+
+SQL = "SELECT id FROM orders WHERE status = :p0 AND region_id = :p1"
+PARAMS = {"p0": "open", "p1": 42}
+
+
+def _span():
+    span = QuerySpan("query", {"db.statement": SQL, "db.query.fingerprint": "fp"})
+    span.end()
+    return span
+
+
+def test_plans_are_redacted():
+    plan = "Filter ORDERS.STATUS = 'open' AND ORDERS.REGION_ID = 42\npartitionsTotal=420"
+
+    assert redact_plan(plan, PARAMS) == (
+        "Filter ORDERS.STATUS = '?' AND ORDERS.REGION_ID = ?\npartitionsTotal=420"
+    )
+
+
+def test_burst_of_slow_queries_runs_one_explain(tmp_path):
+    connector = FakeConnector()
+
+    def explain(sql, params):
+        time.sleep(0.2)
+        return [("Filter ORDERS.STATUS = 'open'",)]
+
+    connector.add_result("EXPLAIN USING TEXT", ("plan",), explain)
+    log = SlowQueryLog(str(tmp_path / "slow.jsonl"), threshold=-1, explain=True)
+
+    threads = [threading.Thread(target=log.record, args=(_span(), PARAMS, connector))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+
+    assert len(connector.executed("EXPLAIN")) == 1
+    entries = [json.loads(line) for line in (tmp_path / "slow.jsonl").read_text().splitlines()]
+    assert len(entries) == 5
+    assert {entry["plan"] for entry in entries} <= {None, "Filter ORDERS.STATUS = '?'"}
+
+
+def test_logging_errors_do_not_fail_the_query(tmp_path):
+    log = SlowQueryLog(str(tmp_path), threshold=-1)
+
+    with pytest.warns(RuntimeWarning, match="Slow query log"):
+        assert log.record(_span(), PARAMS) is False
@@ -0,0 +1,32 @@
+# pyquerybuilder/tests/test_stage.py
+"""Tests for stage locations and COPY INTO results."""
+import pytest
+
+from pyquerybuilder.core.insert import InsertBuilder
+from pyquerybuilder.core.stage import SnowflakeStage, table_stage
+
+from .fakes import FakeConnector
+
+
+def test_table_stage_keeps_qualifiers():
+    assert table_stage("orders") == "@%orders"
+    assert table_stage("db.sales.orders") == "@db.sales.%orders"
+    assert table_stage('sales."odd.name"') == '@sales.%"odd.name"'
+    assert SnowflakeStage().location("sales.orders", "load_1") == "@sales.%orders/load_1"
+
+
+def test_copy_load_returns_rows_loaded_per_file():
+    pytest.importorskip("pyarrow")
+    connector = FakeConnector()
+    connector.add_result("COPY INTO", ("file", "status", "rows_parsed", "rows_loaded",
+                                       "error_limit", "errors_seen", "first_error"),
+                         [("load_0.parquet", "LOADED", 2, 2, 1, 0, None),
+                          ("load_1.parquet", "LOADED", 1, 1, 1, 0, None)])
+    loader = InsertBuilder(None, "db.sales.orders", connector=connector, rows_per_file=2)
+
+    result = loader.execute({"id": [1, 2, 3]}, strategy="copy")
+
+    assert result["batches"] == 2
+    assert result["rows_loaded"] == 3
+    assert [f["rows_loaded"] for f in result["files"]] == [2, 1]
+    assert all("@db.sales.%orders/load_" in sql for sql in connector.executed("PUT"))
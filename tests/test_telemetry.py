@@ -0,0 +1,43 @@
+# pyquerybuilder/tests/test_telemetry.py
+"""Tests for query spans."""
+import pytest
+
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.telemetry import RingBufferSink, Telemetry
+
+from .fakes import FakeConnector
+
+
+def _executor(connector):
+    sink = RingBufferSink()
+    return QueryExecutor(connector, telemetry=Telemetry([sink])), sink
+
+
+def test_streamed_query_span_ends_when_the_stream_closes():
+    connector = FakeConnector(rows=[(i, i) for i in range(5)])
+    executor, sink = _executor(connector)
+
+    with executor.execute_iter("SELECT a, b FROM t", batch_size=2) as rows:
+        iterator = iter(rows)
+        assert next(iterator) == {"A": 0, "B": 0}
+        assert sink.spans() == []
+
+    [span] = sink.spans()
+    attributes = span["attributes"]
+    assert attributes["db.response.returned_rows"] == 2
+    assert attributes["pyquerybuilder.fetch_time"] >= 0
+    assert attributes["db.snowflake.query_id"] is not None
+    assert span["status"]["code"] == "OK"
+
+
+def test_arrow_stream_span_counts_rows():
+    pytest.importorskip("pyarrow")
+    connector = FakeConnector(rows=[(i, i) for i in range(5)])
+    executor, sink = _executor(connector)
+
+    batches = list(executor.stream_arrow("SELECT a, b FROM t", batch_size=2))
+
+    assert sum(batch.num_rows for batch in batches) == 5
+    [span] = sink.spans()
+    assert span["attributes"]["db.response.returned_rows"] == 5
+    assert "pyquerybuilder.execute_time" in span["attributes"]
@@ -0,0 +1,47 @@
+# pyquerybuilder/tests/test_warehouse_router.py
+"""Tests for cost-based warehouse routing."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.core.executor import QueryExecutor
+from pyquerybuilder.core.result_cache import ResultCache
+from pyquerybuilder.core.warehouse_router import (
+    WarehouseRouter, _pruning_fraction, clustering_columns
+)
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+from .fakes import FakeConnector
+
+
+def _builder(*filters):
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"events": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "events"
+    builder.select("id")
+    for field, operator, value in filters:
+        builder.where(field, operator, value)
+    builder.build()
+    return builder
+
+
+def test_clustering_key_columns_are_matched_exactly():
+    assert clustering_columns('LINEAR(event_date, TO_DATE("Shipped At"))') == {
+        "EVENT_DATE", "SHIPPED AT"
+    }
+    info = {"clustering_key": "LINEAR(EVENT_DATE)"}
+
+    assert _pruning_fraction(_builder(("date", "=", "2024-01-01")), info) == 1.0
+    assert _pruning_fraction(_builder(("event_date", "=", "2024-01-01")), info) == 0.01
+
+
+def test_router_learns_execution_time_of_warehouse_runs_only():
+    builder = _builder()
+    router = WarehouseRouter(builder._schema_registry)
+    executor = QueryExecutor(FakeConnector(fetch_latency=0.2), result_cache=ResultCache(),
+                             warehouse_router=router)
+
+    executor.execute_builder(builder)
+    first = router.stats()[builder.fingerprint()]["latency"]["XSMALL"]
+    executor.execute_builder(builder)
+
+    assert first < 0.1
+    assert router.stats()[builder.fingerprint()]["latency"]["XSMALL"] == first
@@ -0,0 +1,51 @@
+# pyquerybuilder/tests/test_where_simplifier.py
+"""Tests for the WHERE simplification pass."""
+from pyquerybuilder.core.builder import QueryBuilder
+from pyquerybuilder.query.analyzers.where_simplifier import simplify_where
+from pyquerybuilder.schema.registry import SchemaRegistry
+
+
+def _condition(field, operator, value, **connector):
+    return dict(field=field, operator=operator, value=value, **connector)
+
+
+def _simplified(*conditions):
+    result = simplify_where(list(conditions))
+    assert not result["always_false"]
+    return result["where_conditions"]
+
+
+def _orders():
+    registry = SchemaRegistry()
+    registry.register_schema({"tables": {"orders": {}}, "relationships": {}})
+    builder = QueryBuilder(registry)
+    builder._from_table = "orders"
+    return builder
+
+
+def test_ranges_on_one_column_intersect_into_between():
+    assert _simplified(_condition("a", ">", 1), _condition("a", "<=", 5),
+                       _condition("a", ">=", 2)) == [_condition("a", "BETWEEN", (2, 5))]
+
+
+def test_in_lists_intersect_and_equalities_pick_from_them():
+    assert _simplified(_condition("a", "IN", [1, 2, 3]),
+                       _condition("a", "IN", [2, 3, 4])) == [_condition("a", "IN", [2, 3])]
+    assert _simplified(_condition("a", "IN", [1, 2, 3]),
+                       _condition("a", "=", 2)) == [_condition("a", "=", 2)]
+    assert simplify_where([_condition("a", "IN", [1, 2, 3]),
+                           _condition("a", "=", 5)])["always_false"]
+
+
+def test_contradiction_renders_where_false():
+    builder = _orders().where("a", ">", 5).where("a", "<", 3)
+
+    assert builder.build() == ("SELECT * FROM orders WHERE FALSE", {})
+    assert builder.is_always_false()
+
+
+def test_top_level_or_keeps_ranges_apart():
+    sql, params = _orders().where("a", ">", 1).where("a", "<", 5).or_where("b", 1).build()
+
+    assert sql == "SELECT * FROM orders WHERE ((a > :p0 AND a < :p1) OR b = :p2)"
+    assert params == {"p0": 1, "p1": 5, "p2": 1}